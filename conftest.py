@@ -1,7 +1,66 @@
 # Pytest fixtures: such as driver, setup, teardown, log information, the fixtures for pytest is an object that is passed to the test function and is reused  in all the tests
 # Fixtures de Pytest: navegador, setup, teardown, log information, 'fixtures' para pyest son objetos que se pasan a la funcion de test y se reutilizan en todos los tests
+import os
+import time
 import pytest
-from utils.logger import logger
+from utils.logger import log_context, logger
+
+# Registra la duración de cada test en reports/test_durations.json (ver utils/test_timing.py)
+# y la latencia de la API por endpoint en reports/api_metrics.json (ver utils/api_metrics.py)
+pytest_plugins = ["utils.test_timing", "utils.api_metrics"]
+
+
+def _pool_size(config) -> int:
+    """Tamaño del pool de navegadores: --browser-pool o BROWSER_POOL_SIZE (0 = sin pool).
+    Firefox no usa pool: sin CDP la sesión no se puede limpiar (BrowserPool.reset devuelve False),
+    así que se cerraría y relanzaría tras cada test igual que sin pool, pagando además el pool."""
+    size = config.getoption("--browser-pool")
+    if size is None:
+        size = int(os.getenv("BROWSER_POOL_SIZE", "0"))
+    if size > 0 and (config.getoption("--browser") or "chrome").lower() == "firefox":
+        if not getattr(config, "_browser_pool_skipped", False):
+            config._browser_pool_skipped = True
+            logger.warning("Pool de navegadores desactivado para Firefox: sin CDP no se puede reiniciar la sesión")
+        return 0
+    return size
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """Pool de sesiones WebDriver reutilizables por worker (solo si --browser-pool > 0).
+    Cada test recibe una sesión ya abierta y reiniciada (cookies, storage, ventanas, about:blank)
+    en lugar de lanzar un navegador nuevo.
+    """
+    size = _pool_size(request.config)
+    if size <= 0:
+        yield None
+        return
+    try:
+        from utils.browser_pool import BrowserPool  # type: ignore
+    except ModuleNotFoundError:
+        pytest.skip("Selenium no está instalado. El pool de navegadores es solo para pruebas de integración.")
+
+    browser = request.config.getoption("--browser") or "chrome"
+    logger.info(f"Iniciando pool de navegadores: {browser} x{size}")
+    pool = BrowserPool.for_browser(browser, size=size, profile=request.config.getoption("--browser-profile"))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def mock_api_server():
+    """Servidor local de la API simulada (usuarios, productos, órdenes, pagos) compartido por
+    las pruebas de API y los escenarios BDD. Usa server.base_url en los clientes.
+    La latencia se lee de API_MOCK_LATENCY y API_MOCK_JITTER (segundos).
+    """
+    from utils.api_helpers.mock_api_server import MockAPIServer
+
+    server = MockAPIServer(
+        latency=float(os.getenv("API_MOCK_LATENCY", "0")),
+        jitter=float(os.getenv("API_MOCK_JITTER", "0"))
+    )
+    with server:
+        yield server
 
 
 @pytest.fixture(scope="function")
@@ -9,7 +68,15 @@ def driver(request):
     """Fixture de WebDriver para pruebas de integración (usa Selenium).
     La importación de BrowserManager es perezosa para evitar requerir Selenium
     cuando se ejecutan únicamente pruebas unitarias en tools/.
+    Con --browser-pool=N (o BROWSER_POOL_SIZE=N) la sesión se toma de un pool de sesiones abiertas.
     """
+    if _pool_size(request.config) > 0:
+        pool = request.getfixturevalue("browser_pool")
+        driver = pool.acquire()
+        yield driver
+        pool.release(driver)
+        return
+
     try:
         # Importación perezosa: evita fallar al cargar si Selenium no está instalado
         from utils.browser_manager import BrowserManager  # type: ignore
@@ -26,7 +93,7 @@ def driver(request):
 
     logger.info(f"Iniciando navegador: {browser}")
 
-    manager = BrowserManager(browser)
+    manager = BrowserManager(browser, profile=request.config.getoption("--browser-profile"))
     driver = manager.driver
     yield driver
 
@@ -34,6 +101,70 @@ def driver(request):
     driver.quit()
 
 
+@pytest.fixture(scope="session")
+def _auth_session_holder():
+    """Sesión autenticada compartida por todos los tests del worker"""
+    return {}
+
+
+@pytest.fixture
+def auth_session(request, _auth_session_holder):
+    """Sesión de usuario (cookies + storage) capturada una vez por worker con USERNAME/PASSWORD.
+    Se captura por HTTP (AUTH_LOGIN=http, por defecto) o por UI (AUTH_LOGIN=ui) y se renueva al expirar.
+    """
+    from utils.config import Configuration
+    from utils.auth_session import AuthSession
+
+    if not Configuration.USERNAME or not Configuration.PASSWORD:
+        pytest.skip("USERNAME/PASSWORD no configurados en .env; se omite la sesión autenticada")
+
+    session = _auth_session_holder.get("session")
+    if session is None or session.is_expired():
+        def start_browser():
+            from utils.browser_manager import BrowserManager  # type: ignore
+            browser = request.config.getoption("--browser") or "chrome"
+            return BrowserManager(browser, profile=request.config.getoption("--browser-profile")).driver
+
+        logger.info("Capturando sesión autenticada para este worker")
+        session = AuthSession.login(start_browser, Configuration.USERNAME, Configuration.PASSWORD,
+                                    mode=os.getenv("AUTH_LOGIN", "http"))
+        _auth_session_holder["session"] = session
+    return session
+
+
+@pytest.fixture
+def authenticated_driver(driver, auth_session):
+    """Driver con la sesión inyectada, ya en ACCOUNT_URL (sin pasar por el login de la UI)"""
+    from utils.config import Configuration
+
+    auth_session.inject(driver, Configuration.ACCOUNT_URL)
+    return driver
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Etiqueta los logs de setup/call/teardown con el node id del test y el tiempo transcurrido
+    (campos test / elapsed del log NDJSON con LOG_OUTPUT=json, ver utils/logger.py)"""
+    with log_context(test=item.nodeid, test_started=time.time()):
+        yield
+
+
+def pytest_collection_finish(session):
+    """Si se recolectó algún test de UI (usa 'driver'), valida todos los locators del .env antes de
+    abrir un navegador, así un locator mal escrito falla al inicio y no a mitad de la ejecución.
+    Las ejecuciones solo de API no leen los locators."""
+    if session.config.getoption("--collect-only"):
+        return
+    if not any("driver" in getattr(item, "fixturenames", ()) for item in session.items):
+        return
+    from utils.config import Configuration
+
+    try:
+        Configuration.validate_locators()
+    except ValueError as exc:
+        raise pytest.UsageError(str(exc)) from exc
+
+
 # Para permitir pasar --browser desde CLI (Ejemplo browser=firefox)
 #pytest tests/test_login.py --browser=firefox
 #Si no pasas nada, usará "chrome" por defecto (como se define en BrowserManager).
@@ -43,4 +174,32 @@ def pytest_addoption(parser):
         action="store",
         default="chrome",
         help="Navegador a usar: chrome o firefox"
+    )
+    # Perfil rápido: sin imágenes/fuentes/extensiones, dominios de terceros bloqueados y perfil precalentado
+    # pytest tests/smoke_tests --browser-profile=fast
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=None,
+        choices=("default", "fast"),
+        help="Perfil del navegador: default o fast (por defecto: env BROWSER_PROFILE o default)"
+    )
+    # Reutilizar N sesiones de navegador abiertas por worker en lugar de lanzar una por test
+    # pytest tests/smoke_tests --browser-pool=2
+    parser.addoption(
+        "--browser-pool",
+        action="store",
+        type=int,
+        default=None,
+        help="Número de sesiones de navegador reutilizables por worker (por defecto: env BROWSER_POOL_SIZE o 0 = sin pool). "
+             "Solo Chrome/Edge: con Firefox se ignora porque sin CDP cada sesión se relanza igual"
+    )
+    # Grabar/reproducir las peticiones HTTP de las pruebas de API (ver tests/api_test/conftest.py)
+    # pytest tests/api_test --api-cassette=replay
+    parser.addoption(
+        "--api-cassette",
+        action="store",
+        default=None,
+        choices=("off", "record", "replay", "auto"),
+        help="Modo cassette para pruebas de API: off, record, replay o auto (por defecto: env API_CASSETTE u off)"
     )
\ No newline at end of file
@@ -5,19 +5,62 @@ This module exports all API clients for easy import in tests.
 Following Python best practices for package initialization.
 
 Usage:
-    from api import BaseAPIClient, UserServiceAPI
+    from src.api import BaseAPIClient, UserServiceAPI
     
     # Or import directly
-    from api.user_service_api import UserServiceAPI
+    from src.api.user_service_api import UserServiceAPI
+
+Always import through 'src.api' (as the clients do): importing the same modules as 'api.*'
+would load a second copy, splitting isinstance checks and the shared cache and metrics.
 """
 
-from api.base_api_client import BaseAPIClient
-from api.user_service_api import UserServiceAPI
+import importlib
+
+# English: Clients are imported on first access (PEP 562) so importing the package does not pull
+# requests/urllib3 for every client up front
+# Spanish: Los clientes se importan en el primer acceso (PEP 562) para no cargar requests/urllib3
+# de todos los clientes al importar el paquete
+_EXPORTS = {
+    'BaseAPIClient': 'base_api_client',
+    'UserServiceAPI': 'user_service_api',
+    'AsyncAPIClient': 'async_api_client',
+    'APIResult': 'api_result',
+    'ResponseCache': 'response_cache',
+    'Cassette': 'cassette',
+    'CassetteMissError': 'cassette',
+    'RequestMetrics': 'request_metrics',
+    'RequestTiming': 'request_metrics',
+    'LatencyHistogram': 'request_metrics',
+    'default_metrics': 'request_metrics'
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
-# Define what gets exported when using "from api import *"
+# Define what gets exported when using "from src.api import *"
 __all__ = [
     'BaseAPIClient',
-    'UserServiceAPI'
+    'UserServiceAPI',
+    'AsyncAPIClient',
+    'APIResult',
+    'ResponseCache',
+    'Cassette',
+    'CassetteMissError',
+    'RequestMetrics',
+    'RequestTiming',
+    'LatencyHistogram',
+    'default_metrics'
 ]
 
 # Version information
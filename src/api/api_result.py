@@ -0,0 +1,122 @@
+# API Result - lightweight, parse-once wrapper for service client results
+# Resultado de API - envoltorio ligero que decodifica la respuesta una sola vez
+
+"""
+English:
+Service clients used to return {'status_code', 'data', 'response'} dicts where 'data'
+came from response.json(), and tests often decoded the same body again. APIResult keeps
+the same keys (it is a read-only Mapping, so result['data'] keeps working) but decodes
+the JSON body lazily, exactly once, and caches it for 'data' and json().
+
+Spanish:
+Los clientes devolvían diccionarios {'status_code', 'data', 'response'} y los tests
+volvían a decodificar el mismo cuerpo. APIResult mantiene las mismas claves (es un
+Mapping de solo lectura) pero decodifica el JSON de forma perezosa, una sola vez.
+
+Usage:
+    result = user_api.get_user_by_id(1)
+    result['status_code']   # 200
+    result['data']['email'] # decoded on first access, cached afterwards
+    result.json()           # same cached object, no second decode
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional, Tuple
+
+_UNSET = object()
+
+
+class APIResult(Mapping):
+    """
+    Read-only result of a service client call
+
+    Keys (backward compatible with the previous dict results):
+        status_code (int | None): HTTP status, None when the call raised
+        data (Any): Decoded JSON when the status is in ok_statuses, otherwise None
+        response (requests.Response | None): Raw response object
+        error (Exception): Only present when the call raised (batch operations)
+    """
+
+    __slots__ = ('response', 'error', '_ok_statuses', '_json')
+
+    _KEYS = ('status_code', 'data', 'response')
+
+    def __init__(self, response: Any = None, ok_statuses: Tuple[int, ...] = (200,),
+                 error: Optional[Exception] = None):
+        """
+        Args:
+            response (requests.Response): Raw response, None when the call raised
+            ok_statuses (tuple): Status codes for which 'data' exposes the decoded body
+            error (Exception): Exception raised by the call, if any
+        """
+        self.response = response
+        self.error = error
+        self._ok_statuses = ok_statuses
+        self._json = _UNSET
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return self.response.status_code if self.response is not None else None
+
+    def json(self) -> Any:
+        """
+        Decode the response body once and cache it # Decodifica el cuerpo una vez y lo guarda
+
+        Returns:
+            Any: Decoded JSON body, or None when there is no response or the body is not JSON
+        """
+        if self._json is _UNSET:
+            if self.response is None:
+                self._json = None
+            else:
+                try:
+                    self._json = self.response.json()
+                except ValueError:
+                    self._json = None
+        return self._json
+
+    @property
+    def data(self) -> Any:
+        return self.json() if self.status_code in self._ok_statuses else None
+
+    @property
+    def timing(self) -> Any:
+        """
+        Phase timings of the call (RequestTiming: dns, connect, ttfb, total), None when it raised
+        # Tiempos por fase de la llamada, None si la llamada falló
+        """
+        return getattr(self.response, 'timing', None)
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """
+        Total duration of the call in seconds # Duración total de la llamada en segundos
+
+        Falls back to response.elapsed (time to headers) for responses not sent by BaseAPIClient.
+        """
+        timing = self.timing
+        if timing is not None and timing.total is not None:
+            return timing.total
+        elapsed = getattr(self.response, 'elapsed', None)
+        return elapsed.total_seconds() if elapsed is not None else None
+
+    # ==================== MAPPING PROTOCOL ====================
+
+    def _keys(self) -> Tuple[str, ...]:
+        return self._KEYS + ('error',) if self.error is not None else self._KEYS
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"APIResult(error={self.error!r})"
+        return f"APIResult(status_code={self.status_code})"
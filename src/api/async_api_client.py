@@ -0,0 +1,223 @@
+# Async API Client - asyncio sibling of BaseAPIClient for concurrent API test execution
+# Cliente API asíncrono - hermano asyncio de BaseAPIClient para ejecutar pruebas de API concurrentes
+
+"""
+English:
+AsyncAPIClient exposes the same method surface as BaseAPIClient (get, post, put,
+patch, delete, set_header, set_auth_token) but every HTTP call is awaitable.
+The blocking work runs on a bounded thread pool that shares the wrapped client's
+pooled requests.Session, so headers, auth and logging behave exactly as in the
+synchronous client while independent requests overlap instead of serializing.
+
+Any service client (e.g. UserServiceAPI) can be wrapped, and its operations become
+awaitable too:
+
+    async with AsyncAPIClient(client=UserServiceAPI(), max_concurrency=20) as users:
+        results = await users.gather(*(users.get_user_by_id(i) for i in range(1, 101)))
+
+Spanish:
+AsyncAPIClient expone los mismos métodos que BaseAPIClient pero cada llamada HTTP
+es 'awaitable'. El trabajo bloqueante se ejecuta en un pool de hilos acotado que
+comparte la sesión de requests del cliente envuelto, por lo que encabezados,
+autenticación y logging se comportan igual que en el cliente síncrono.
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import requests
+
+from src.api.base_api_client import BaseAPIClient
+
+
+class AsyncAPIClient:
+    """
+    Async API Client - awaitable wrapper around a BaseAPIClient
+
+    This demonstrates:
+    - Composition (wraps any BaseAPIClient subclass instead of duplicating it)
+    - Bounded concurrency (semaphore + fixed-size thread pool)
+    - Same public surface as the synchronous client
+    """
+
+    def __init__(self, base_url: Optional[str] = None, timeout: int = 30,
+                 max_concurrency: int = 10, client: Optional[BaseAPIClient] = None):
+        """
+        Initialize the async API client
+
+        Args:
+            base_url (str): Base URL for the API. Ignored when 'client' is given
+            timeout (int): Default timeout for requests in seconds
+            max_concurrency (int): Maximum number of requests in flight at once
+            client (BaseAPIClient): Existing client to wrap (e.g. UserServiceAPI)
+
+        Raises:
+            ValueError: If neither base_url nor client is provided
+        """
+        if client is None:
+            if base_url is None:
+                raise ValueError("AsyncAPIClient requires either 'base_url' or 'client'")
+            client = BaseAPIClient(base_url, timeout=timeout)
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.logger = client.logger
+
+        # English: The session pool must hold at least one connection per worker thread
+        # Spanish: El pool de la sesión debe tener al menos una conexión por hilo
+        self.client._ensure_pool_size(max_concurrency)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='async-api'
+        )
+        # English: asyncio primitives bind to one event loop; a session-scoped client is reused
+        # across the per-test loops of asyncio.run(), so keep one semaphore per loop
+        # Spanish: Las primitivas de asyncio se atan a un event loop; un cliente de sesión se reutiliza
+        # en los loops de cada test con asyncio.run(), así que se guarda un semáforo por loop
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def base_url(self) -> str:
+        return self.client.base_url
+
+    @property
+    def session(self) -> requests.Session:
+        return self.client.session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore of the running event loop, created on first use in that loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run any synchronous client callable on the thread pool and await its result
+
+        Args:
+            func (callable): Blocking function (e.g. user_api.get_user_by_id)
+            *args, **kwargs: Arguments forwarded to func
+
+        Returns:
+            Whatever func returns
+
+        Example:
+            user = await async_client.run(user_api.get_user_by_id, 1)
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def gather(self, *aws: Awaitable, return_exceptions: bool = False) -> List[Any]:
+        """
+        Await many calls concurrently; results keep the input order
+
+        Concurrency is already bounded by max_concurrency inside run().
+
+        Args:
+            *aws: Awaitables returned by this client's methods
+            return_exceptions (bool): Return exceptions as results instead of raising
+
+        Returns:
+            list: Results in the same order as the awaitables
+        """
+        return list(await asyncio.gather(*aws, return_exceptions=return_exceptions))
+
+    # ==================== HEADERS / AUTH ====================
+
+    def set_header(self, key: str, value: str):
+        """Set a custom header for all requests (shared with the wrapped client)"""
+        self.client.set_header(key, value)
+
+    def set_auth_token(self, token: str, token_type: str = "Bearer"):
+        """Set authentication token (shared with the wrapped client)"""
+        self.client.set_auth_token(token, token_type)
+
+    # ==================== HTTP METHODS ====================
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None,
+                  headers: Optional[Dict] = None, **kwargs) -> requests.Response:
+        """Perform GET request # Realiza una petición GET"""
+        return await self.run(self.client.get, endpoint, params=params, headers=headers, **kwargs)
+
+    async def post(self, endpoint: str, json: Optional[Dict] = None,
+                   data: Optional[Any] = None, headers: Optional[Dict] = None,
+                   **kwargs) -> requests.Response:
+        """Perform POST request # Realiza una petición POST"""
+        return await self.run(self.client.post, endpoint, json=json, data=data,
+                              headers=headers, **kwargs)
+
+    async def put(self, endpoint: str, json: Optional[Dict] = None,
+                  data: Optional[Any] = None, headers: Optional[Dict] = None,
+                  **kwargs) -> requests.Response:
+        """Perform PUT request # Realiza una petición PUT"""
+        return await self.run(self.client.put, endpoint, json=json, data=data,
+                              headers=headers, **kwargs)
+
+    async def patch(self, endpoint: str, json: Optional[Dict] = None,
+                    data: Optional[Any] = None, headers: Optional[Dict] = None,
+                    **kwargs) -> requests.Response:
+        """Perform PATCH request # Realiza una petición PATCH"""
+        return await self.run(self.client.patch, endpoint, json=json, data=data,
+                              headers=headers, **kwargs)
+
+    async def delete(self, endpoint: str, headers: Optional[Dict] = None,
+                     **kwargs) -> requests.Response:
+        """Perform DELETE request # Realiza una petición DELETE"""
+        return await self.run(self.client.delete, endpoint, headers=headers, **kwargs)
+
+    def __getattr__(self, name: str):
+        """
+        Expose the wrapped client's operations as coroutine functions
+
+        English: 'await async_users.get_user_by_id(1)' runs UserServiceAPI.get_user_by_id
+        on the thread pool.
+        Spanish: 'await async_users.get_user_by_id(1)' ejecuta UserServiceAPI.get_user_by_id
+        en el pool de hilos.
+        """
+        # English: Avoid recursion before __init__ has set self.client
+        # Spanish: Evita recursión antes de que __init__ asigne self.client
+        if name == 'client':
+            raise AttributeError(name)
+
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def _awaitable(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        return _awaitable
+
+    # ==================== CLEANUP ====================
+
+    async def aclose(self):
+        """Shut down the thread pool and close the wrapped session"""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    def close(self):
+        """Synchronous cleanup for non-async fixtures"""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def __aenter__(self):
+        """Async context manager support - allows 'async with'"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager cleanup"""
+        await self.aclose()
@@ -2,26 +2,78 @@
 # Clase Base para clientes API - Proporciona métodos HTTP reutilizables para pruebas de API
 
 import requests
+import contextvars
 import logging
-from typing import Dict, Optional, Any
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
+from urllib3.util.retry import Retry
 import json
 
+from src.api.api_result import APIResult
+from src.api.response_cache import ResponseCache
+from src.api.cassette import Cassette, CassetteAdapter
+from src.api.request_metrics import RequestMetrics, RequestTiming, default_metrics, observe, timing_scope
+from src.api.timed_adapter import TimedHTTPAdapter
+from utils.logger import log_context, setup_logger
 
-# Configure logging for educational purposes - helps trace API calls
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment # Lee un entero desde el entorno"""
+    value = os.getenv(name)
+    return int(value) if value not in (None, '') else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float from the environment # Lee un float desde el entorno"""
+    value = os.getenv(name)
+    return float(value) if value not in (None, '') else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean (1/true/yes) from the environment # Lee un booleano desde el entorno"""
+    value = os.getenv(name)
+    if value in (None, ''):
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes')
 
 
 class BaseAPIClient:    
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: int = 30,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 pool_block: Optional[bool] = None,
+                 max_retries: Optional[int] = None,
+                 retry_backoff: Optional[float] = None,
+                 retry_statuses: Optional[Tuple[int, ...]] = None,
+                 keep_alive: Optional[bool] = None,
+                 log_body_limit: Optional[int] = None,
+                 cache: Optional[ResponseCache] = None,
+                 metrics: Optional[RequestMetrics] = None):
         """
         English: Initialize the API client
         
         Args:
             base_url (str): Base URL for the API (e.g., 'https://api.example.com')
             timeout (int): Default timeout for requests in seconds
+            pool_connections (int): Number of host pools to cache (env: API_POOL_CONNECTIONS, default 10)
+            pool_maxsize (int): Max connections kept alive per host (env: API_POOL_MAXSIZE, default 10)
+            pool_block (bool): Wait for a free connection instead of opening a throwaway one
+                               when the pool is full (env: API_POOL_BLOCK, default False)
+            max_retries (int): Retries for connection errors and retry_statuses (env: API_MAX_RETRIES, default 0)
+            retry_backoff (float): Exponential backoff factor between retries (env: API_RETRY_BACKOFF, default 0.3)
+            retry_statuses (tuple): Status codes that trigger a retry
+                                    (env: API_RETRY_STATUSES, comma separated, default 502,503,504)
+            keep_alive (bool): Reuse connections between requests (env: API_KEEP_ALIVE, default True)
+            log_body_limit (int): Max size of a body written to DEBUG logs: characters of a request
+                                  body, bytes of a response body (env: API_LOG_BODY_LIMIT, default 2048;
+                                  0 disables truncation)
+            cache (ResponseCache): Opt-in cache for GET requests (default: disabled)
+            metrics (RequestMetrics): Where per-request dns/connect/ttfb/total timings are aggregated
+                                      (default: the shared default_metrics(); env API_METRICS=false disables)
 
         Returns:
             None
@@ -31,6 +83,13 @@ class BaseAPIClient:
         Argumentos que recibe la clase:
             base_url (str): URL base para la API (e.g., 'https://api.example.com')
             timeout (int): Tiempo de espera predeterminado para las peticiones en segundos
+            pool_connections, pool_maxsize, pool_block: Tamaño y comportamiento del pool de conexiones
+            max_retries, retry_backoff, retry_statuses: Política de reintentos del adaptador
+            keep_alive (bool): Reutilizar conexiones entre peticiones
+            log_body_limit (int): Tamaño máximo del cuerpo escrito en los logs DEBUG (caracteres de la petición,
+                                  bytes de la respuesta)
+            cache (ResponseCache): Caché opcional para peticiones GET (por defecto: deshabilitada)
+            metrics (RequestMetrics): Dónde se agregan los tiempos por petición (por defecto: default_metrics())
 
         Retorna:
             None
@@ -38,13 +97,85 @@ class BaseAPIClient:
         self.base_url = base_url.rstrip('/')  # Remove trailing slash # Elimina el slash final
         self.timeout = timeout
         self.session = requests.Session()  # Session for connection pooling # Sesión para el pooling de conexiones
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # Shared async logging pipeline (console + file / NDJSON) # Pipeline de logging compartido
+        self.logger = setup_logger(self.__class__.__name__)
         
         # Default headers - can be overridden # Encabezados por defecto - pueden ser sobrescritos
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        
+        # Connection pool and retry policy - constructor args win over env vars
+        # Pool de conexiones y política de reintentos - los argumentos tienen prioridad sobre el entorno
+        self.pool_connections = pool_connections if pool_connections is not None else _env_int('API_POOL_CONNECTIONS', 10)
+        self.pool_maxsize = pool_maxsize if pool_maxsize is not None else _env_int('API_POOL_MAXSIZE', 10)
+        self.pool_block = pool_block if pool_block is not None else _env_bool('API_POOL_BLOCK', False)
+        self.max_retries = max_retries if max_retries is not None else _env_int('API_MAX_RETRIES', 0)
+        self.retry_backoff = retry_backoff if retry_backoff is not None else _env_float('API_RETRY_BACKOFF', 0.3)
+        if retry_statuses is None:
+            raw_statuses = os.getenv('API_RETRY_STATUSES', '502,503,504')
+            retry_statuses = tuple(int(code) for code in raw_statuses.split(',') if code.strip())
+        self.retry_statuses = tuple(retry_statuses)
+        self.keep_alive = keep_alive if keep_alive is not None else _env_bool('API_KEEP_ALIVE', True)
+        self.log_body_limit = log_body_limit if log_body_limit is not None else _env_int('API_LOG_BODY_LIMIT', 2048)
+        
+        if not self.keep_alive:
+            self.session.headers['Connection'] = 'close'
+        self.cassette: Optional[Cassette] = None
+        self._adapter_lock = threading.RLock()
+        self._mount_adapter(self.pool_connections, self.pool_maxsize)
+        self.cache = cache
+        if metrics is None and _env_bool('API_METRICS', True):
+            metrics = default_metrics()
+        self.metrics = metrics
+    
+    def _build_retry(self) -> Retry:
+        """
+        Build the urllib3 retry policy for the mounted adapter # Construye la política de reintentos
+        
+        Only idempotent methods are retried on status codes so POSTs are never replayed.
+        """
+        return Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.retry_backoff,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False
+        )
+    
+    def _mount_adapter(self, pool_connections: int, pool_maxsize: int):
+        """
+        Mount an HTTPAdapter with the configured pool and retry policy
+        # Monta un HTTPAdapter con el pool y la política de reintentos configurados
+        
+        TimedHTTPAdapter is a plain HTTPAdapter that also measures DNS and connect time.
+        The replaced adapter is closed so its connection pool is not leaked; requests already
+        in flight on it finish normally and their connections are dropped when released.
+        """
+        adapter = TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=self._build_retry()
+        )
+        if self.cassette is not None:
+            adapter = CassetteAdapter(self.cassette, adapter)
+        with self._adapter_lock:
+            replaced = {self.session.adapters.get(prefix) for prefix in ('http://', 'https://')}
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self.pool_connections = pool_connections
+            self.pool_maxsize = pool_maxsize
+        for old in replaced - {None, adapter}:
+            old.close()
+        self.logger.debug(
+            f"HTTP adapter mounted: pool_connections={pool_connections}, pool_maxsize={pool_maxsize}, "
+            f"pool_block={self.pool_block}, max_retries={self.max_retries}"
+        )
     
     def _build_url(self, endpoint: str) -> str:
         """
@@ -59,25 +190,109 @@ class BaseAPIClient:
         endpoint = endpoint.lstrip('/')  # Remove leading slash
         return f"{self.base_url}/{endpoint}"
     
+    def _truncate(self, text: str) -> str:
+        """
+        Cut a body down to log_body_limit characters # Recorta un cuerpo a log_body_limit caracteres
+        """
+        if self.log_body_limit and len(text) > self.log_body_limit:
+            return f"{text[:self.log_body_limit]}... [truncated, {len(text)} chars total]"
+        return text
+    
+    def _response_preview(self, response: requests.Response) -> str:
+        """
+        First log_body_limit bytes of the body, decoded # Primeros log_body_limit bytes del cuerpo, decodificados
+        
+        Slicing the bytes first avoids decoding (and, without a declared charset, running
+        charset detection on) a large body that is mostly thrown away.
+        """
+        content = response.content or b''
+        limit = self.log_body_limit
+        head = content[:limit] if limit else content
+        text = head.decode(response.encoding or 'utf-8', errors='replace')
+        if len(head) < len(content):
+            return f"{text}... [truncated, {len(content)} bytes total]"
+        return text
+    
     def _log_request(self, method: str, url: str, **kwargs):
         """
         Log request details for debugging (educational purpose)
         Registra los detalles de la petición para depuración (propósito educativo)
         
+        The body is only serialized when DEBUG is enabled for this logger.
+        El cuerpo solo se serializa cuando DEBUG está habilitado para este logger.
         """
-        self.logger.info(f"Request: {method} {url}")
-        if 'json' in kwargs:
-            self.logger.debug(f"Request Body: {json.dumps(kwargs['json'], indent=2)}")
+        self.logger.info("Request: %s %s", method, url)
+        if kwargs.get('json') is not None and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Request Body: %s", self._truncate(json.dumps(kwargs['json'], indent=2)))
     
-    def _log_response(self, response: requests.Response):
+    def _log_response(self, response: requests.Response, elapsed: Optional[float] = None):
         """Log response details for debugging (as before)
          Registra los detalles de la respuesta para depuración (como antes)
+         
+         The raw body is logged (truncated before decoding) instead of re-parsing the JSON
+         the caller will parse anyway, and only when DEBUG is enabled.
+         Se registra el cuerpo crudo (recortado antes de decodificar) en lugar de volver a
+         parsear el JSON, y solo cuando DEBUG está habilitado.
+         
+         Method, URL, status and elapsed_ms travel as structured fields for the JSON log.
+         Método, URL, status y elapsed_ms viajan como campos estructurados para el log JSON.
          """
-        self.logger.info(f"Response: {response.status_code} {response.reason}")
-        try:
-            self.logger.debug(f"Response Body: {json.dumps(response.json(), indent=2)}")
-        except ValueError:
-            self.logger.debug(f"Response Body: {response.text}")
+        request = getattr(response, 'request', None)
+        extra = {
+            'method': getattr(request, 'method', None),
+            'url': getattr(request, 'url', None),
+            'status': response.status_code,
+            'elapsed_ms': round(elapsed * 1000, 3) if elapsed is not None else None,
+        }
+        timing = getattr(response, 'timing', None)
+        if timing is not None:
+            extra.update({f'{phase}_ms': round(value * 1000, 3)
+                          for phase, value in timing.as_dict().items() if value is not None and phase != 'total'})
+        self.logger.info("Response: %s %s", response.status_code, response.reason, extra=extra)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Response Body: %s", self._response_preview(response))
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send one request tagged with a fresh request id and log it with its latency
+        # Envía una petición etiquetada con un id nuevo y la registra con su latencia
+        
+        Every log record emitted while the request is in flight (adapter, retries, cassette)
+        carries the same request_id. The phase timings are attached to the response as
+        'response.timing' and added to self.metrics under the endpoint template.
+        """
+        timing = RequestTiming()
+        with log_context(request_id=uuid.uuid4().hex[:12]), timing_scope(timing):
+            self._log_request(method, url, **kwargs)
+            start = time.perf_counter()
+            try:
+                response = getattr(self.session, method.lower())(url, timeout=self.timeout, **kwargs)
+            except Exception:
+                timing.total = time.perf_counter() - start
+                self._record_timing(method, url, timing, error=True)
+                raise
+            timing.total = time.perf_counter() - start
+            # requests measures from sending the request until the headers were parsed
+            # requests mide desde el envío de la petición hasta que se leen los encabezados
+            elapsed = getattr(response, 'elapsed', None)
+            timing.ttfb = elapsed.total_seconds() if elapsed is not None else None
+            response.timing = timing
+            self._record_timing(method, url, timing, error=response.status_code >= 500,
+                                status=response.status_code)
+            self._log_response(response, timing.total)
+        # A successful write makes cached GETs of the resource and its collection stale
+        # Una escritura exitosa deja obsoletos los GET en caché del recurso y su colección
+        if self.cache is not None and method.upper() not in ('GET', 'HEAD') and response.status_code < 400:
+            self.cache.invalidate(url)
+        return response
+    
+    def _record_timing(self, method: str, url: str, timing: RequestTiming, error: bool = False,
+                       status: Optional[int] = None):
+        """Add a request to self.metrics under its endpoint template # Agrega la petición a self.metrics"""
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        observe(method, path, timing, status=status, error=error)
+        if self.metrics is not None:
+            self.metrics.record(method, path, timing, error=error)
     
     def set_header(self, key: str, value: str):
         """
@@ -115,17 +330,28 @@ class BaseAPIClient:
             requests.Response: Response object
         """
         url = self._build_url(endpoint)
-        self._log_request('GET', url, params=params)
         
-        response = self.session.get(
-            url,
-            params=params,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
+        # Opt-in cache: serve fresh entries, revalidate stale ones with their ETag
+        # Caché opcional: sirve entradas vigentes y revalida las expiradas con su ETag
+        cache_key = None
+        if self.cache is not None and not kwargs.get('stream'):
+            cache_key = ResponseCache.make_key(url, params, {**self.session.headers, **(headers or {})})
+            cached, etag = self.cache.lookup(cache_key)
+            if cached is not None:
+                self.logger.info("Cache hit: GET %s", url)
+                return cached
+            if etag:
+                headers = {**(headers or {}), 'If-None-Match': etag}
         
-        self._log_response(response)
+        response = self._send('GET', url, params=params, headers=headers, **kwargs)
+        
+        if cache_key is not None:
+            if response.status_code == 304:
+                cached = self.cache.revalidated(cache_key)
+                if cached is not None:
+                    return cached
+            else:
+                self.cache.store(cache_key, response)
         return response
     
     def post(self, endpoint: str, json: Optional[Dict] = None, 
@@ -145,19 +371,7 @@ class BaseAPIClient:
             requests.Response: Response object
         """
         url = self._build_url(endpoint)
-        self._log_request('POST', url, json=json, data=data)
-        
-        response = self.session.post(
-            url,
-            json=json,
-            data=data,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
-        
-        self._log_response(response)
-        return response
+        return self._send('POST', url, json=json, data=data, headers=headers, **kwargs)
     
     def put(self, endpoint: str, json: Optional[Dict] = None, 
             data: Optional[Any] = None, headers: Optional[Dict] = None, 
@@ -176,19 +390,7 @@ class BaseAPIClient:
             requests.Response: Response object
         """
         url = self._build_url(endpoint)
-        self._log_request('PUT', url, json=json, data=data)
-        
-        response = self.session.put(
-            url,
-            json=json,
-            data=data,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
-        
-        self._log_response(response)
-        return response
+        return self._send('PUT', url, json=json, data=data, headers=headers, **kwargs)
     
     def patch(self, endpoint: str, json: Optional[Dict] = None, 
               data: Optional[Any] = None, headers: Optional[Dict] = None, 
@@ -207,19 +409,7 @@ class BaseAPIClient:
             requests.Response: Response object
         """
         url = self._build_url(endpoint)
-        self._log_request('PATCH', url, json=json, data=data)
-        
-        response = self.session.patch(
-            url,
-            json=json,
-            data=data,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
-        
-        self._log_response(response)
-        return response
+        return self._send('PATCH', url, json=json, data=data, headers=headers, **kwargs)
     
     def delete(self, endpoint: str, headers: Optional[Dict] = None, 
                **kwargs) -> requests.Response:
@@ -235,20 +425,98 @@ class BaseAPIClient:
             requests.Response: Response object
         """
         url = self._build_url(endpoint)
-        self._log_request('DELETE', url)
+        return self._send('DELETE', url, headers=headers, **kwargs)
+    
+    def enable_cache(self, cache: Optional[ResponseCache] = None) -> ResponseCache:
+        """
+        Turn on GET response caching # Activa la caché de respuestas GET
         
-        response = self.session.delete(
-            url,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
+        Args:
+            cache (ResponseCache): Cache to use (shared between clients if desired).
+                                   A new default cache is created when None.
         
-        self._log_response(response)
-        return response
+        Returns:
+            ResponseCache: The active cache, to inspect stats() later
+        """
+        self.cache = cache if cache is not None else ResponseCache()
+        self.logger.info(f"Response cache enabled: {self.cache!r}")
+        return self.cache
+    
+    def disable_cache(self):
+        """Turn off GET response caching # Desactiva la caché de respuestas GET"""
+        self.cache = None
+        self.logger.info("Response cache disabled")
+    
+    def use_cassette(self, cassette: Optional[Cassette]):
+        """
+        Record every interaction into, or replay it from, a cassette
+        # Graba cada interacción en un cassette o la reproduce desde él
+        
+        Args:
+            cassette (Cassette): Cassette to use, or None to go back to the plain network adapter.
+                Requests are keyed relative to this client's base_url unless the cassette sets its own
+        """
+        if cassette is not None and cassette.base_url is None:
+            cassette.base_url = self.base_url
+        self.cassette = cassette
+        self._mount_adapter(self.pool_connections, self.pool_maxsize)
+        if cassette is not None:
+            self.logger.info(f"Using cassette: {cassette!r}")
     
+    def run_batch(self, func: Callable[[Any], Any], items: Iterable[Any],
+                  max_workers: int = 10) -> List[Any]:
+        """
+        Run one client operation for many inputs on a thread pool sharing this session
+        # Ejecuta una operación del cliente para muchas entradas en un pool de hilos que comparte esta sesión
+
+        Results keep the input order. A failing item does not abort the batch: its
+        slot holds an APIResult with 'status_code' None and the exception in 'error'.
+
+        Args:
+            func (callable): Operation taking one item (e.g. self.get_user_by_id)
+            items (iterable): Inputs, one call per item
+            max_workers (int): Maximum number of concurrent requests
+
+        Returns:
+            list: One result per item, in input order
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        workers = max(1, min(max_workers, len(items)))
+        self._ensure_pool_size(workers)
+
+        def _call(item):
+            try:
+                return func(item)
+            except Exception as e:
+                self.logger.error(f"Batch item {item!r} failed: {e}")
+                return APIResult(error=e)
+
+        self.logger.info(f"Running batch of {len(items)} calls with {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='api-batch') as executor:
+            # Each item runs in a copy of the caller's log context (test id, worker)
+            # Cada elemento corre con una copia del contexto de log del llamador
+            futures = [executor.submit(contextvars.copy_context().run, _call, item) for item in items]
+            return [future.result() for future in futures]
+
+    def _ensure_pool_size(self, size: int):
+        """
+        Make sure the session can keep 'size' connections per host alive
+        # Asegura que la sesión pueda mantener 'size' conexiones por host
+        """
+        # Called from worker setup on several threads; grow the pool once
+        # Se llama desde varios hilos; el pool crece una sola vez
+        with self._adapter_lock:
+            if self.pool_maxsize >= size:
+                return
+            self._mount_adapter(max(self.pool_connections, size), size)
+
     def close(self):
         """Close the session - good practice for cleanup # Cierra la sesión - buena práctica para limpieza"""
+        if self.cassette is not None:
+            self.cassette.save()
         self.session.close()
         self.logger.info("Session closed")
     
@@ -0,0 +1,259 @@
+# Cassette - record/replay of HTTP interactions for the API test suites
+# Cassette - grabación/reproducción de interacciones HTTP para las suites de API
+
+"""
+English:
+A Cassette captures every request/response pair a BaseAPIClient makes and stores it in a
+compact JSON file. In replay mode the same file is served back through a requests
+transport adapter, so the tests run with zero network (air-gapped CI agents) and
+deterministic data.
+
+Requests are matched on method plus path and query relative to the client's base_url, so a
+cassette recorded against one host or port (e.g. the mock server's random port) replays
+against another. Bodies are not matched by default, because the suites build them from
+Faker; pass match_body=True to also match a normalized hash of the body.
+
+Modes:
+- record: real network, every interaction is written to the cassette on save()
+- replay: no network, unknown requests raise CassetteMissError
+- auto:   replay when the cassette file exists, otherwise record
+
+Spanish:
+Un Cassette captura cada par petición/respuesta que hace BaseAPIClient y lo guarda en un
+archivo JSON compacto. En modo 'replay' el mismo archivo se sirve mediante un adaptador de
+requests, por lo que las pruebas se ejecutan sin red y con datos deterministas.
+Las peticiones se identifican por método y ruta + query relativas al base_url; el cuerpo
+solo se compara con match_body=True (los datos de las suites salen de Faker).
+
+Usage:
+    cassette = Cassette('tests/api_test/cassettes/test_user_service.json', mode='auto')
+    user_api.use_cassette(cassette)
+    ...
+    cassette.save()
+"""
+
+import base64
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+MODES = ('record', 'replay', 'auto')
+
+CASSETTE_VERSION = 2
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request was never recorded"""
+
+
+def _request_target(url: str, base_url: Optional[str] = None) -> str:
+    """Path and sorted query of 'url', relative to the path of base_url; scheme, host and port are dropped"""
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    prefix = urlsplit(base_url).path.rstrip('/') if base_url else ''
+    if prefix and (path == prefix or path.startswith(prefix + '/')):
+        path = path[len(prefix):] or '/'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{path}?{query}" if query else path
+
+
+def _body_hash(body: Optional[Union[str, bytes]]) -> str:
+    """sha1 of a request body; JSON bodies are normalized first (key order, spacing)"""
+    if not body:
+        return ''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, separators=(',', ':')).encode('utf-8')
+    except ValueError:
+        pass
+    return hashlib.sha1(body).hexdigest()
+
+
+class Cassette:
+    """
+    On-disk collection of recorded HTTP interactions
+
+    Attributes:
+        path (Path): Cassette file
+        mode (str): 'record' or 'replay' (auto is resolved on construction)
+        base_url (str): Requests are keyed relative to it (set by BaseAPIClient.use_cassette)
+        match_body (bool): Also match on the request body
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = 'auto', base_url: Optional[str] = None,
+                 match_body: bool = False):
+        """
+        Args:
+            path (str | Path): Cassette file location
+            mode (str): record | replay | auto
+            base_url (str): Base URL the request paths are relative to (default: the client's)
+            match_body (bool): Match on a normalized hash of the body as well as method and path
+
+        Raises:
+            ValueError: If mode is unknown
+            FileNotFoundError: If mode is replay and the cassette does not exist
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}'. Use one of: {', '.join(MODES)}")
+
+        self.path = Path(path)
+        if mode == 'auto':
+            mode = 'replay' if self.path.exists() else 'record'
+        if mode == 'replay' and not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found for replay: {self.path}")
+
+        self.mode = mode
+        self.base_url = base_url
+        self.match_body = match_body
+        self._lock = threading.Lock()
+        self._interactions: List[Dict] = []
+        # English: Identical requests are replayed in recorded order; the last answer repeats.
+        # Built on the first replay, once the client has set base_url
+        # Spanish: Las peticiones idénticas se reproducen en orden; la última respuesta se repite.
+        # Se arma en la primera reproducción, cuando el cliente ya fijó base_url
+        self._replay_queue: Optional[Dict[Tuple, List[Dict]]] = None
+        self._replay_cursor: Dict[Tuple, int] = defaultdict(int)
+
+        if self.mode == 'replay':
+            self._load()
+
+    @property
+    def is_recording(self) -> bool:
+        return self.mode == 'record'
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as cassette_file:
+            content = json.load(cassette_file)
+        self._interactions = content.get('interactions', [])
+
+    def _key(self, method: str, target: str, body_hash: str) -> Tuple[str, str, str]:
+        return (method.upper(), target, body_hash if self.match_body else '')
+
+    def _replay_index(self) -> Dict[Tuple, List[Dict]]:
+        if self._replay_queue is None:
+            self._replay_queue = defaultdict(list)
+            for interaction in self._interactions:
+                req = interaction['request']
+                # English: version 1 cassettes only stored the full URL
+                # Spanish: los cassettes de la versión 1 solo guardaban la URL completa
+                target = req.get('target') or _request_target(req['url'], self.base_url)
+                key = self._key(req['method'], target, req.get('body_sha1', ''))
+                self._replay_queue[key].append(interaction['response'])
+        return self._replay_queue
+
+    # ==================== RECORD ====================
+
+    def record(self, request: PreparedRequest, response: Response):
+        """Store one interaction (record mode) # Guarda una interacción"""
+        content = response.content or b''
+        try:
+            body = {'body': content.decode('utf-8')}
+        except UnicodeDecodeError:
+            body = {'body_b64': base64.b64encode(content).decode('ascii')}
+
+        interaction = {
+            'request': {
+                'method': request.method.upper(),
+                'url': request.url,
+                'target': _request_target(request.url, self.base_url),
+                'body_sha1': _body_hash(request.body)
+            },
+            'response': {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': {k: v for k, v in response.headers.items()
+                            if k.lower() not in ('content-encoding', 'transfer-encoding', 'content-length')},
+                'encoding': response.encoding,
+                **body
+            }
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def save(self):
+        """
+        Write recorded interactions to disk (no-op in replay mode)
+        # Escribe las interacciones grabadas en disco
+        """
+        if not self.is_recording:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            content = {'version': CASSETTE_VERSION, 'interactions': list(self._interactions)}
+        with open(self.path, 'w', encoding='utf-8') as cassette_file:
+            json.dump(content, cassette_file, separators=(',', ':'))
+
+    # ==================== REPLAY ====================
+
+    def play(self, request: PreparedRequest) -> Response:
+        """
+        Build the recorded response for a request (replay mode)
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        key = self._key(request.method, _request_target(request.url, self.base_url), _body_hash(request.body))
+        with self._lock:
+            answers = self._replay_index().get(key)
+            if not answers:
+                raise CassetteMissError(
+                    f"No recorded interaction for {key[0]} {key[1]} in cassette {self.path}. "
+                    f"Re-record it with API_CASSETTE=record"
+                )
+            cursor = self._replay_cursor[key]
+            recorded = answers[min(cursor, len(answers) - 1)]
+            self._replay_cursor[key] = cursor + 1
+
+        response = Response()
+        response.status_code = recorded['status']
+        response.reason = recorded['reason']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = recorded['encoding']
+        if 'body_b64' in recorded:
+            response._content = base64.b64decode(recorded['body_b64'])
+        else:
+            response._content = recorded['body'].encode('utf-8')
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def __repr__(self) -> str:
+        return f"Cassette(path='{self.path}', mode='{self.mode}', interactions={len(self)})"
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    requests transport adapter that records through, or replays from, a Cassette
+
+    In record mode it delegates to the real HTTPAdapter; in replay mode it never
+    touches the network.
+    """
+
+    def __init__(self, cassette: Cassette, real_adapter: BaseAdapter):
+        super().__init__()
+        self.cassette = cassette
+        self.real_adapter = real_adapter
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        if not self.cassette.is_recording:
+            return self.cassette.play(request)
+        response = self.real_adapter.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.real_adapter.close()
@@ -0,0 +1,441 @@
+# Request Metrics - per-request phase timings aggregated into latency histograms per endpoint
+# Métricas de peticiones - tiempos por fase de cada petición agregados en histogramas por endpoint
+
+"""
+English:
+Every request sent by BaseAPIClient gets a RequestTiming with four phases:
+- dns:     host name resolution (None when a pooled keep-alive connection was reused)
+- connect: TCP connect + TLS handshake (None when a pooled connection was reused)
+- ttfb:    time to first byte, from sending the request until the response headers arrived
+- total:   until the body was fully downloaded
+
+Timings are grouped by method and endpoint template ('/users/42' -> '/users/{id}') into
+HDR-style histograms: log-linear buckets with ~1% relative error, constant memory per
+endpoint, and histograms from several workers can be merged exactly. The pytest plugin in
+utils/api_metrics.py prints a p50/p95/p99 table and writes a JSON artifact.
+
+Spanish:
+Cada petición de BaseAPIClient recibe un RequestTiming con cuatro fases (dns, connect, ttfb,
+total). Los tiempos se agrupan por método y plantilla de endpoint ('/users/42' -> '/users/{id}')
+en histogramas estilo HDR: buckets log-lineales con ~1% de error relativo, memoria constante
+por endpoint y combinables entre workers sin pérdida.
+
+Usage:
+    metrics = default_metrics()
+    user_api.get_user_by_id(1)
+    metrics.histogram('GET', '/users/{id}').percentile(95)   # seconds
+    print(metrics.format_table())
+    metrics.save('reports/api_metrics.json')
+"""
+
+import contextvars
+import json
+import math
+import os
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Pattern, Tuple, Union
+from urllib.parse import urlsplit
+
+PHASES = ('dns', 'connect', 'ttfb', 'total')
+
+METRICS_VERSION = 1
+
+
+class RequestTiming:
+    """Phase durations of one request in seconds (None when the phase did not happen)"""
+
+    __slots__ = PHASES
+
+    def __init__(self, dns: Optional[float] = None, connect: Optional[float] = None,
+                 ttfb: Optional[float] = None, total: Optional[float] = None):
+        self.dns = dns
+        self.connect = connect
+        self.ttfb = ttfb
+        self.total = total
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        return {phase: getattr(self, phase) for phase in PHASES}
+
+    def __repr__(self) -> str:
+        phases = ', '.join(f"{phase}={value * 1000:.1f}ms" for phase, value in self.as_dict().items()
+                           if value is not None)
+        return f"RequestTiming({phases})"
+
+
+# The timing of the request in flight on this thread; the timed connections fill dns/connect
+# La medición de la petición en curso en este hilo; las conexiones medidas completan dns/connect
+_current_timing = contextvars.ContextVar('request_timing', default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current_timing.get()
+
+
+@contextmanager
+def timing_scope(timing: RequestTiming) -> Iterator[RequestTiming]:
+    """Make 'timing' the current request timing inside the block # Activa 'timing' dentro del bloque"""
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        _current_timing.reset(token)
+
+
+class LatencySample(NamedTuple):
+    """One request seen inside capture_samples() # Una petición vista dentro de capture_samples()"""
+    method: str
+    endpoint: str
+    timing: RequestTiming
+    status: Optional[int] = None
+    error: bool = False
+
+
+_sample_sink = contextvars.ContextVar('request_samples', default=None)
+
+
+@contextmanager
+def capture_samples() -> Iterator[List[LatencySample]]:
+    """
+    Collect every request sent inside the block (threads started with a copied context included)
+    # Recoge cada petición enviada dentro del bloque
+
+    Example:
+        with capture_samples() as samples:
+            user_api.get_user_by_id(1)
+        samples[0].timing.total
+    """
+    samples: List[LatencySample] = []
+    token = _sample_sink.set(samples)
+    try:
+        yield samples
+    finally:
+        _sample_sink.reset(token)
+
+
+def observe(method: str, endpoint: str, timing: RequestTiming, status: Optional[int] = None,
+            error: bool = False):
+    """Hand a finished request to the active capture_samples() block, if any"""
+    samples = _sample_sink.get()
+    if samples is not None:
+        samples.append(LatencySample(method.upper(), endpoint_template(endpoint), timing, status, error))
+
+
+_ID_SEGMENT = re.compile(
+    r'^(\d+'
+    r'|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|[0-9a-fA-F]{24,}'
+    # English: codes and slugs with a digit (ORD123, post-42-hello, 2024-01-05), but not API versions (v2)
+    # Spanish: códigos y slugs con algún dígito, pero no versiones de la API (v2)
+    r'|(?![vV]\d+$)(?=[^\d]*\d)[\w.~%-]+'
+    r')$'
+)
+
+# Extra patterns for ids the default rule cannot tell apart from a resource name (word-only slugs)
+# Patrones extra para ids que la regla por defecto no distingue de un recurso (slugs solo con palabras)
+_extra_id_patterns: List[Pattern] = []
+
+
+def add_id_pattern(pattern: Union[str, Pattern]):
+    """
+    Treat path segments matching 'pattern' (full match) as ids in endpoint_template
+    # Trata como id los segmentos de la ruta que coinciden con 'pattern'
+
+    Example:
+        add_id_pattern(r'[a-z]+(-[a-z]+){2,}')  # /posts/my-first-post -> /posts/{id}
+    """
+    _extra_id_patterns.append(re.compile(pattern))
+    endpoint_template.cache_clear()
+
+
+def _is_id(segment: str) -> bool:
+    return bool(_ID_SEGMENT.match(segment)) or any(p.fullmatch(segment) for p in _extra_id_patterns)
+
+
+@lru_cache(maxsize=2048)
+def endpoint_template(path: str) -> str:
+    """
+    Collapse identifiers in a path so calls to the same endpoint share one series
+    # Reemplaza identificadores de la ruta para que las llamadas al mismo endpoint compartan serie
+
+    Numbers, UUIDs, long hex ids (e.g. Mongo ObjectIds), and codes or slugs containing a digit
+    become '{id}'; word-only slugs need add_id_pattern(). The query string is dropped.
+
+    Example:
+        endpoint_template('/users/42/posts?_limit=5')  # '/users/{id}/posts'
+        endpoint_template('/v2/orders/ORD-2024-0042')  # '/v2/orders/{id}'
+    """
+    path = urlsplit(path).path if '://' in path else path.split('?', 1)[0]
+    segments = ['{id}' if _is_id(segment) else segment for segment in path.split('/')]
+    return '/' + '/'.join(segment for segment in segments if segment)
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram (values stored in microseconds)
+
+    Values below 2**SUB_BUCKET_BITS us are exact; above that every power of two is split
+    into 2**(SUB_BUCKET_BITS - 1) linear sub-buckets, so any percentile is reported with
+    a relative error below 1 / 2**(SUB_BUCKET_BITS - 1). Buckets are stored sparsely.
+    """
+
+    SUB_BUCKET_BITS = 8
+
+    __slots__ = ('counts', 'count', 'min_us', 'max_us', 'sum_us')
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.min_us = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    # ==================== BUCKETS ====================
+
+    @classmethod
+    def _index(cls, value_us: int) -> int:
+        if value_us < (1 << cls.SUB_BUCKET_BITS):
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS
+        return (shift << (cls.SUB_BUCKET_BITS - 1)) + (value_us >> shift)
+
+    @classmethod
+    def _highest_equivalent(cls, index: int) -> int:
+        half = 1 << (cls.SUB_BUCKET_BITS - 1)
+        if index < 2 * half:
+            return index
+        shift = index // half - 1
+        sub_bucket = index - shift * half
+        return ((sub_bucket + 1) << shift) - 1
+
+    # ==================== RECORDING ====================
+
+    def record(self, seconds: float, count: int = 1):
+        """Add a duration in seconds # Agrega una duración en segundos"""
+        value_us = max(0, int(round(seconds * 1_000_000)))
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.sum_us += value_us * count
+        self.max_us = max(self.max_us, value_us)
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """Add every sample of 'other' (exact, buckets are aligned) # Suma las muestras de 'other'"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        return self
+
+    # ==================== QUERIES (seconds) ====================
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Value at or below which 'percent' % of the samples fall, in seconds (None when empty)
+        # Valor por debajo del cual queda el 'percent' % de las muestras, en segundos
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum_us / self.count / 1_000_000 if self.count else None
+
+    @property
+    def min(self) -> Optional[float]:
+        return self.min_us / 1_000_000 if self.min_us is not None else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self.max_us / 1_000_000 if self.count else None
+
+    # ==================== SERIALIZATION ====================
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count, 'min_us': self.min_us, 'max_us': self.max_us, 'sum_us': self.sum_us,
+            'buckets': {str(index): count for index, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LatencyHistogram':
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data.get('buckets', {}).items()}
+        histogram.count = data.get('count', sum(histogram.counts.values()))
+        histogram.min_us = data.get('min_us')
+        histogram.max_us = data.get('max_us', 0)
+        histogram.sum_us = data.get('sum_us', 0)
+        return histogram
+
+    def __repr__(self) -> str:
+        if not self.count:
+            return "LatencyHistogram(count=0)"
+        return (f"LatencyHistogram(count={self.count}, p50={self.percentile(50) * 1000:.1f}ms, "
+                f"p99={self.percentile(99) * 1000:.1f}ms)")
+
+
+class _Series:
+    """Histograms of one (method, endpoint template) pair"""
+
+    __slots__ = ('phases', 'errors')
+
+    def __init__(self):
+        self.phases = {phase: LatencyHistogram() for phase in PHASES}
+        self.errors = 0
+
+
+class RequestMetrics:
+    """
+    Thread-safe registry of latency histograms by method and endpoint template
+
+    Attributes:
+        PERCENTILES (tuple): Percentiles reported by summary() and format_table()
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    def record(self, method: str, endpoint: str, timing: RequestTiming, error: bool = False):
+        """
+        Add one request # Registra una petición
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): Path or URL; ids are collapsed with endpoint_template()
+            timing (RequestTiming): Phase durations (phases left as None are not recorded)
+            error (bool): The request raised or returned a 5xx status
+        """
+        key = (method.upper(), endpoint_template(endpoint))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            for phase in PHASES:
+                value = getattr(timing, phase)
+                if value is not None:
+                    series.phases[phase].record(value)
+            if error:
+                series.errors += 1
+
+    def histogram(self, method: str, endpoint: str, phase: str = 'total') -> LatencyHistogram:
+        """Histogram of one phase (empty when nothing was recorded) # Histograma de una fase"""
+        series = self._series.get((method.upper(), endpoint_template(endpoint)))
+        return series.phases[phase] if series is not None else LatencyHistogram()
+
+    def summary(self) -> List[Dict]:
+        """
+        One row per endpoint, slowest p95 first # Una fila por endpoint, primero el p95 más lento
+
+        Returns:
+            list: {'method', 'endpoint', 'count', 'errors', '<phase>': {'p50', 'p95', 'p99', 'max', 'mean'}}
+                  with values in milliseconds (None when the phase was never measured)
+        """
+        rows = []
+        with self._lock:
+            items = list(self._series.items())
+        for (method, endpoint), series in items:
+            row = {'method': method, 'endpoint': endpoint,
+                   'count': series.phases['total'].count, 'errors': series.errors}
+            for phase, histogram in series.phases.items():
+                stats = {f'p{p}': histogram.percentile(p) for p in self.PERCENTILES}
+                stats.update(max=histogram.max, mean=histogram.mean)
+                row[phase] = {name: round(value * 1000, 3) if value is not None else None
+                              for name, value in stats.items()}
+            rows.append(row)
+        rows.sort(key=lambda row: row['total']['p95'] or 0, reverse=True)
+        return rows
+
+    def format_table(self, top: Optional[int] = None) -> str:
+        """Text table of total/ttfb/connect/dns percentiles in ms # Tabla de percentiles en ms"""
+        header = (f"{'method':<7}{'endpoint':<40}{'n':>6}{'err':>5}"
+                  f"{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'ttfb95':>9}{'conn95':>9}{'dns95':>9}")
+        lines = [header]
+
+        def ms(value):
+            return f"{value:9.1f}" if value is not None else f"{'-':>9}"
+
+        for row in self.summary()[:top]:
+            total = row['total']
+            lines.append(
+                f"{row['method']:<7}{row['endpoint'][:39]:<40}{row['count']:>6}{row['errors']:>5}"
+                f"{ms(total['p50'])}{ms(total['p95'])}{ms(total['p99'])}{ms(total['max'])}"
+                f"{ms(row['ttfb']['p95'])}{ms(row['connect']['p95'])}{ms(row['dns']['p95'])}"
+            )
+        return '\n'.join(lines)
+
+    # ==================== PERSISTENCE ====================
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            items = list(self._series.items())
+        return {
+            'version': METRICS_VERSION,
+            'endpoints': [
+                {'method': method, 'endpoint': endpoint, 'errors': series.errors,
+                 'histograms': {phase: h.to_dict() for phase, h in series.phases.items() if h.count}}
+                for (method, endpoint), series in items
+            ],
+            'summary': self.summary(),
+        }
+
+    def merge_dict(self, data: Dict) -> 'RequestMetrics':
+        """Add the histograms of a saved artifact (e.g. another worker) # Suma otro artefacto"""
+        with self._lock:
+            for entry in data.get('endpoints', []):
+                key = (entry['method'], entry['endpoint'])
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = _Series()
+                series.errors += entry.get('errors', 0)
+                for phase, histogram in entry.get('histograms', {}).items():
+                    series.phases[phase].merge(LatencyHistogram.from_dict(histogram))
+        return self
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the JSON artifact atomically # Escribe el artefacto JSON de forma atómica"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        tmp.write_text(json.dumps(self.to_dict(), indent=2), encoding='utf-8')
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'RequestMetrics':
+        return cls().merge_dict(json.loads(Path(path).read_text(encoding='utf-8')))
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def __len__(self) -> int:
+        """Number of recorded requests # Número de peticiones registradas"""
+        return sum(series.phases['total'].count for series in list(self._series.values()))
+
+    def __repr__(self) -> str:
+        return f"RequestMetrics(endpoints={len(self._series)}, requests={len(self)})"
+
+
+_default_metrics = RequestMetrics()
+
+
+def default_metrics() -> RequestMetrics:
+    """Process-wide registry shared by every client unless one is passed explicitly"""
+    return _default_metrics
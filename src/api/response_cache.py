@@ -0,0 +1,212 @@
+# Response Cache - opt-in cache for idempotent GET requests made by BaseAPIClient
+# Caché de respuestas - caché opcional para peticiones GET idempotentes de BaseAPIClient
+
+"""
+English:
+Regression runs call the same read-only endpoints (get_all_users, get_user_by_id(1), ...)
+many times with identical parameters. ResponseCache stores successful GET responses keyed
+by URL + query params + the headers that change the representation (Accept, Authorization,
+Accept-Language). Entries expire after a TTL and the least recently used entry is evicted
+when the cache is full. Expired entries that carry an ETag are revalidated with
+If-None-Match: a 304 answer refreshes the entry without downloading the body again.
+A successful write (POST/PUT/PATCH/DELETE) through BaseAPIClient invalidates the cached
+entries of that URL and of its collection, so a test reads back its own writes.
+
+Spanish:
+ResponseCache guarda respuestas GET exitosas usando como clave la URL, los parámetros y
+los encabezados relevantes. Las entradas expiran tras un TTL y se expulsa la menos usada
+cuando la caché está llena. Las entradas expiradas con ETag se revalidan con If-None-Match.
+Una escritura exitosa invalida las entradas de esa URL y de su colección.
+
+Usage:
+    cache = ResponseCache(ttl=60, max_entries=256)
+    user_api.enable_cache(cache)
+    user_api.get_user_by_id(1)   # miss -> network
+    user_api.get_user_by_id(1)   # hit  -> no network
+    cache.stats()                # {'hits': 1, 'misses': 1, ...}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Headers that select a different representation of the same URL
+# Encabezados que seleccionan una representación distinta de la misma URL
+VARY_HEADERS = ('Accept', 'Accept-Language', 'Authorization')
+
+
+class _CacheEntry:
+    """Cached response plus its freshness metadata"""
+
+    __slots__ = ('response', 'expires_at', 'etag')
+
+    def __init__(self, response: Any, expires_at: float, etag: Optional[str]):
+        self.response = response
+        self.expires_at = expires_at
+        self.etag = etag
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache for GET responses
+
+    Attributes:
+        ttl (float): Seconds an entry is served without contacting the server
+        max_entries (int): Maximum number of cached responses (LRU eviction)
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 512):
+        """
+        Args:
+            ttl (float): Time to live of an entry in seconds
+            max_entries (int): Maximum number of entries before evicting the oldest used one
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'revalidated': 0,
+            'evictions': 0,
+            'invalidations': 0,
+            'saved_seconds': 0.0
+        }
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping] = None,
+                 headers: Optional[Mapping] = None) -> Tuple:
+        """
+        Build the cache key for a GET request # Construye la clave de caché
+
+        Args:
+            url (str): Full request URL
+            params (dict): Query parameters
+            headers (dict): Effective request headers (session + per-request)
+
+        Returns:
+            tuple: Hashable key
+        """
+        params_key = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        headers = headers or {}
+        lowered = {str(k).lower(): v for k, v in headers.items()}
+        headers_key = tuple((name, lowered.get(name.lower())) for name in VARY_HEADERS)
+        return (url, params_key, headers_key)
+
+    def lookup(self, key: Tuple) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a key
+
+        Returns:
+            tuple: (fresh_response, None) on a hit,
+                   (None, etag) when a stale entry can be revalidated,
+                   (None, None) on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None, None
+
+            self._entries.move_to_end(key)
+            if entry.expires_at > time.monotonic():
+                self._stats['hits'] += 1
+                self._stats['saved_seconds'] += _elapsed_seconds(entry.response)
+                return entry.response, None
+
+            if entry.etag:
+                return None, entry.etag
+
+            del self._entries[key]
+            self._stats['misses'] += 1
+            return None, None
+
+    def revalidated(self, key: Tuple) -> Optional[Any]:
+        """
+        Mark a stale entry as fresh again after a 304 Not Modified answer
+
+        Returns:
+            requests.Response: The cached response, or None if it was evicted meanwhile
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl
+            self._stats['revalidated'] += 1
+            self._stats['saved_seconds'] += _elapsed_seconds(entry.response)
+            return entry.response
+
+    def store(self, key: Tuple, response: Any):
+        """
+        Store a successful response # Guarda una respuesta exitosa
+
+        Only 200 responses without 'Cache-Control: no-store' are cached.
+        """
+        if response.status_code != 200:
+            return
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+
+        entry = _CacheEntry(response, time.monotonic() + self.ttl, response.headers.get('ETag'))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, url: str) -> int:
+        """
+        Drop every cached variant (params, Vary headers) of a URL and of its collection URL
+        # Elimina todas las variantes en caché de una URL y de la URL de su colección
+
+        Example:
+            cache.invalidate('https://api.test/users/1')  # drops /users/1 and /users
+
+        Returns:
+            int: Number of entries removed
+        """
+        url = url.split('?', 1)[0].rstrip('/')
+        targets = {url, url.rsplit('/', 1)[0]}
+        with self._lock:
+            stale = [key for key in self._entries if key[0].split('?', 1)[0].rstrip('/') in targets]
+            for key in stale:
+                del self._entries[key]
+            self._stats['invalidations'] += len(stale)
+        return len(stale)
+
+    def clear(self):
+        """Drop every entry (counters are kept) # Elimina todas las entradas"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters and estimated network time saved
+
+        Returns:
+            dict: hits, misses, revalidated, evictions, invalidations, saved_seconds, size, hit_ratio
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses'] + stats['revalidated']
+        stats['hit_ratio'] = (stats['hits'] + stats['revalidated']) / lookups if lookups else 0.0
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(ttl={self.ttl}, max_entries={self.max_entries}, size={len(self)})"
+
+
+def _elapsed_seconds(response: Any) -> float:
+    """Network time the original request took, used for the saved-time counter"""
+    elapsed = getattr(response, 'elapsed', None)
+    return elapsed.total_seconds() if elapsed is not None else 0.0
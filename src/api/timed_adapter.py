@@ -0,0 +1,100 @@
+# Timed Adapter - HTTPAdapter whose connections measure DNS resolution and connect time
+# Adaptador medido - HTTPAdapter cuyas conexiones miden la resolución DNS y el tiempo de conexión
+
+"""
+English:
+requests only exposes response.elapsed (time until the headers arrived). TimedHTTPAdapter
+mounts urllib3 connection pools whose connections resolve the host themselves and time
+the TCP connect + TLS handshake, writing both into the RequestTiming that BaseAPIClient
+made current for the request (see request_metrics.timing_scope). Reused keep-alive
+connections never reconnect, so their dns/connect phases stay None.
+
+Spanish:
+requests solo expone response.elapsed (tiempo hasta recibir los encabezados).
+TimedHTTPAdapter monta pools de urllib3 cuyas conexiones resuelven el host y miden la
+conexión TCP + el handshake TLS, y lo escriben en el RequestTiming de la petición en curso.
+Las conexiones keep-alive reutilizadas no reconectan, por lo que dns/connect quedan en None.
+"""
+
+import socket
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from src.api.request_metrics import current_timing
+
+
+class _TimedConnectionMixin:
+    """Times name resolution in _new_conn() and the whole connect() (TCP + TLS)"""
+
+    def _new_conn(self):
+        timing = current_timing()
+        if timing is None:
+            return super()._new_conn()
+
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except OSError:
+            # Let urllib3 raise its own resolution error # urllib3 lanza su propio error de resolución
+            return super()._new_conn()
+        timing.dns = time.perf_counter() - start
+
+        # English: Connect to the addresses just resolved instead of resolving again, trying each
+        # in turn like urllib3's create_connection (an unreachable IPv6 falls back to IPv4).
+        # TLS (SNI and certificate checks) still uses self.host
+        # Spanish: Conecta a las direcciones ya resueltas, probando cada una en orden como
+        # create_connection de urllib3; TLS sigue usando self.host
+        dns_host = self._dns_host
+        error = None
+        try:
+            for address in dict.fromkeys(info[4][0] for info in addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as exc:
+                    error = exc
+        finally:
+            self._dns_host = dns_host
+        raise error
+
+    def connect(self):
+        timing = current_timing()
+        start = time.perf_counter()
+        super().connect()
+        if timing is not None:
+            timing.connect = time.perf_counter() - start - (timing.dns or 0.0)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter (same pool and retry options) that fills dns/connect of the current RequestTiming
+    # HTTPAdapter (mismas opciones de pool y reintentos) que completa dns/connect del RequestTiming actual
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
@@ -3,7 +3,8 @@
 # Servicio de usuario de la API, es una implementación de la clase BaseAPIClient para operaciones de gestión de usuarios
 
 from src.api.base_api_client import BaseAPIClient
-from typing import Dict, List, Optional
+from src.api.api_result import APIResult
+from typing import Dict, Iterable, List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -20,23 +21,25 @@ class UserServiceAPI(BaseAPIClient):
     - Single Responsibility (only handles user operations)
     """
     
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(self, base_url: Optional[str] = None, **client_options):
         """
         Initialize User Service API client
         
         Args:
             base_url (str): Base URL for the API. If None, reads from environment variable
+            **client_options: Timeout, connection pool and retry options forwarded to BaseAPIClient
+                              (e.g. pool_maxsize=32, max_retries=3)
         """
         # Read from environment or use default test API
         if base_url is None:
             base_url = os.getenv('API_BASE_URL', 'https://jsonplaceholder.typicode.com')
         
-        super().__init__(base_url)
+        super().__init__(base_url, **client_options)
         self.logger.info(f"UserServiceAPI initialized with base URL: {base_url}")
     
     # ==================== USER CRUD OPERATIONS ====================
     
-    def get_all_users(self, params: Optional[Dict] = None) -> Dict:
+    def get_all_users(self, params: Optional[Dict] = None) -> APIResult:
         """
         Get all users
         
@@ -44,20 +47,16 @@ class UserServiceAPI(BaseAPIClient):
             params (dict): Optional query parameters (e.g., pagination, filters)
             
         Returns:
-            dict: Response containing user list
+            APIResult: Response containing user list
             
         Example:
             users = user_api.get_all_users()
             users = user_api.get_all_users({'_limit': 5})
         """
         response = self.get('/users', params=params)
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
-    def get_user_by_id(self, user_id: int) -> Dict:
+    def get_user_by_id(self, user_id: int) -> APIResult:
         """
         Get specific user by ID
         
@@ -65,19 +64,15 @@ class UserServiceAPI(BaseAPIClient):
             user_id (int): User ID
             
         Returns:
-            dict: Response containing user data
+            APIResult: Response containing user data
             
         Example:
             user = user_api.get_user_by_id(1)
         """
         response = self.get(f'/users/{user_id}')
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
-    def create_user(self, user_data: Dict) -> Dict:
+    def create_user(self, user_data: Dict) -> APIResult:
         """
         Create a new user
         
@@ -85,7 +80,7 @@ class UserServiceAPI(BaseAPIClient):
             user_data (dict): User information (name, email, etc.)
             
         Returns:
-            dict: Response containing created user data
+            APIResult: Response containing created user data
             
         Example:
             user_data = {
@@ -96,13 +91,9 @@ class UserServiceAPI(BaseAPIClient):
             result = user_api.create_user(user_data)
         """
         response = self.post('/users', json=user_data)
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code in [200, 201] else None,
-            'response': response
-        }
+        return APIResult(response, ok_statuses=(200, 201))
     
-    def update_user(self, user_id: int, user_data: Dict) -> Dict:
+    def update_user(self, user_id: int, user_data: Dict) -> APIResult:
         """
         Update existing user (full update - PUT)
         
@@ -111,7 +102,7 @@ class UserServiceAPI(BaseAPIClient):
             user_data (dict): Complete user information
             
         Returns:
-            dict: Response containing updated user data
+            APIResult: Response containing updated user data
             
         Example:
             updated_data = {
@@ -123,13 +114,9 @@ class UserServiceAPI(BaseAPIClient):
             result = user_api.update_user(1, updated_data)
         """
         response = self.put(f'/users/{user_id}', json=user_data)
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
-    def partial_update_user(self, user_id: int, user_data: Dict) -> Dict:
+    def partial_update_user(self, user_id: int, user_data: Dict) -> APIResult:
         """
         Partially update user (PATCH)
         
@@ -138,20 +125,16 @@ class UserServiceAPI(BaseAPIClient):
             user_data (dict): Partial user information (only fields to update)
             
         Returns:
-            dict: Response containing updated user data
+            APIResult: Response containing updated user data
             
         Example:
             partial_data = {'email': 'newemail@example.com'}
             result = user_api.partial_update_user(1, partial_data)
         """
         response = self.patch(f'/users/{user_id}', json=user_data)
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
-    def delete_user(self, user_id: int) -> Dict:
+    def delete_user(self, user_id: int) -> APIResult:
         """
         Delete a user
         
@@ -159,21 +142,17 @@ class UserServiceAPI(BaseAPIClient):
             user_id (int): User ID
             
         Returns:
-            dict: Response containing deletion result
+            APIResult: Response containing deletion result
             
         Example:
             result = user_api.delete_user(1)
         """
         response = self.delete(f'/users/{user_id}')
-        return {
-            'status_code': response.status_code,
-            'data': None,
-            'response': response
-        }
+        return APIResult(response, ok_statuses=())
     
     # ==================== ADDITIONAL USER OPERATIONS ====================
     
-    def get_user_posts(self, user_id: int) -> Dict:
+    def get_user_posts(self, user_id: int) -> APIResult:
         """
         Get all posts by a specific user
         
@@ -181,19 +160,15 @@ class UserServiceAPI(BaseAPIClient):
             user_id (int): User ID
             
         Returns:
-            dict: Response containing user's posts
+            APIResult: Response containing user's posts
             
         Example:
             posts = user_api.get_user_posts(1)
         """
         response = self.get(f'/users/{user_id}/posts')
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
-    def get_user_albums(self, user_id: int) -> Dict:
+    def get_user_albums(self, user_id: int) -> APIResult:
         """
         Get all albums by a specific user
         
@@ -201,19 +176,15 @@ class UserServiceAPI(BaseAPIClient):
             user_id (int): User ID
             
         Returns:
-            dict: Response containing user's albums
+            APIResult: Response containing user's albums
             
         Example:
             albums = user_api.get_user_albums(1)
         """
         response = self.get(f'/users/{user_id}/albums')
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
-    def get_user_todos(self, user_id: int, completed: Optional[bool] = None) -> Dict:
+    def get_user_todos(self, user_id: int, completed: Optional[bool] = None) -> APIResult:
         """
         Get all todos by a specific user
         
@@ -222,7 +193,7 @@ class UserServiceAPI(BaseAPIClient):
             completed (bool): Filter by completion status (optional)
             
         Returns:
-            dict: Response containing user's todos
+            APIResult: Response containing user's todos
             
         Example:
             todos = user_api.get_user_todos(1)
@@ -233,15 +204,11 @@ class UserServiceAPI(BaseAPIClient):
             params['completed'] = str(completed).lower()
         
         response = self.get(f'/users/{user_id}/todos', params=params)
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
     # ==================== SEARCH AND FILTER OPERATIONS ====================
     
-    def search_users_by_email(self, email: str) -> Dict:
+    def search_users_by_email(self, email: str) -> APIResult:
         """
         Search users by email
         
@@ -249,19 +216,15 @@ class UserServiceAPI(BaseAPIClient):
             email (str): Email to search for
             
         Returns:
-            dict: Response containing matching users
+            APIResult: Response containing matching users
             
         Example:
             users = user_api.search_users_by_email('Sincere@april.biz')
         """
         response = self.get('/users', params={'email': email})
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
+        return APIResult(response)
     
-    def search_users_by_username(self, username: str) -> Dict:
+    def search_users_by_username(self, username: str) -> APIResult:
         """
         Search users by username
         
@@ -269,14 +232,83 @@ class UserServiceAPI(BaseAPIClient):
             username (str): Username to search for
             
         Returns:
-            dict: Response containing matching users
+            APIResult: Response containing matching users
             
         Example:
             users = user_api.search_users_by_username('Bret')
         """
         response = self.get('/users', params={'username': username})
-        return {
-            'status_code': response.status_code,
-            'data': response.json() if response.status_code == 200 else None,
-            'response': response
-        }
\ No newline at end of file
+        return APIResult(response)
+    
+    # ==================== BATCH OPERATIONS ====================
+    
+    def get_users_by_ids(self, user_ids: Iterable[int], max_workers: int = 10) -> List[APIResult]:
+        """
+        Get many users concurrently
+        
+        Args:
+            user_ids (iterable): User IDs
+            max_workers (int): Maximum number of concurrent requests
+            
+        Returns:
+            list: One APIResult per ID, in input order. Failed items carry an 'error' key
+            
+        Example:
+            results = user_api.get_users_by_ids(range(1, 11))
+            emails = [r['data']['email'] for r in results if r['status_code'] == 200]
+        """
+        return self.run_batch(self.get_user_by_id, user_ids, max_workers=max_workers)
+    
+    def get_posts_for_users(self, user_ids: Iterable[int], max_workers: int = 10) -> List[APIResult]:
+        """
+        Get the posts of many users concurrently
+        
+        Args:
+            user_ids (iterable): User IDs
+            max_workers (int): Maximum number of concurrent requests
+            
+        Returns:
+            list: One APIResult per ID, in input order
+            
+        Example:
+            results = user_api.get_posts_for_users([1, 2, 3])
+        """
+        return self.run_batch(self.get_user_posts, user_ids, max_workers=max_workers)
+    
+    def get_albums_for_users(self, user_ids: Iterable[int], max_workers: int = 10) -> List[APIResult]:
+        """
+        Get the albums of many users concurrently
+        
+        Args:
+            user_ids (iterable): User IDs
+            max_workers (int): Maximum number of concurrent requests
+            
+        Returns:
+            list: One APIResult per ID, in input order
+            
+        Example:
+            results = user_api.get_albums_for_users([1, 2, 3])
+        """
+        return self.run_batch(self.get_user_albums, user_ids, max_workers=max_workers)
+    
+    def get_todos_for_users(self, user_ids: Iterable[int], completed: Optional[bool] = None,
+                            max_workers: int = 10) -> List[APIResult]:
+        """
+        Get the todos of many users concurrently
+        
+        Args:
+            user_ids (iterable): User IDs
+            completed (bool): Filter by completion status (optional)
+            max_workers (int): Maximum number of concurrent requests
+            
+        Returns:
+            list: One APIResult per ID, in input order
+            
+        Example:
+            results = user_api.get_todos_for_users(range(1, 11), completed=True)
+        """
+        return self.run_batch(
+            lambda user_id: self.get_user_todos(user_id, completed=completed),
+            user_ids,
+            max_workers=max_workers
+        )
@@ -18,21 +18,120 @@ Apoya el principio DRY (Don’t Repeat Yourself)
  
 """
 
+from functools import lru_cache
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from src.pages.smart_wait import SmartWait
+
+
+# English: Memoized CSS normalization of string locators (one tuple per selector)
+# Spanish: Normalización CSS memorizada de locators string (una tupla por selector)
+@lru_cache(maxsize=512)
+def _css_locator(selector):
+    return (By.CSS_SELECTOR, selector)
+
+
+# English: Selenium locator strategy -> key understood by _FIND_ALL_JS
+# Spanish: Estrategia de locator de Selenium -> clave que entiende _FIND_ALL_JS
+_JS_STRATEGIES = {
+    By.CSS_SELECTOR: "css",
+    By.XPATH: "xpath",
+    By.ID: "id",
+    By.NAME: "name",
+    By.CLASS_NAME: "class",
+    By.TAG_NAME: "tag",
+    By.LINK_TEXT: "link",
+    By.PARTIAL_LINK_TEXT: "plink",
+}
+
+# English: Resolves a (strategy, value) locator in the browser, shared by the batch scripts below
+# Spanish: Resuelve un locator (estrategia, valor) en el navegador, compartido por los scripts en lote
+_FIND_ALL_JS = """
+function findAll(by, value) {
+    if (by === 'css') { return Array.prototype.slice.call(document.querySelectorAll(value)); }
+    if (by === 'xpath') {
+        var els = [];
+        var snap = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < snap.snapshotLength; i++) { els.push(snap.snapshotItem(i)); }
+        return els;
+    }
+    if (by === 'id') { return Array.prototype.slice.call(document.querySelectorAll('#' + CSS.escape(value))); }
+    if (by === 'name') { return Array.prototype.slice.call(document.getElementsByName(value)); }
+    if (by === 'class') { return Array.prototype.slice.call(document.getElementsByClassName(value)); }
+    if (by === 'tag') { return Array.prototype.slice.call(document.getElementsByTagName(value)); }
+    return Array.prototype.slice.call(document.getElementsByTagName('a')).filter(function (a) {
+        var text = (a.innerText || '').trim();
+        return by === 'link' ? text === value : text.indexOf(value) !== -1;
+    });
+}
+"""
+
+# English: Reads one property of every element matching a locator in a single round trip
+# Spanish: Lee una propiedad de cada elemento que coincide con un locator en un solo viaje
+_BATCH_READ_JS = _FIND_ALL_JS + """
+var kind = arguments[2], name = arguments[3];
+var els = findAll(arguments[0], arguments[1]);
+function visible(el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+return els.map(function (el) {
+    if (kind === 'text') { return visible(el) ? (el.innerText || '').trim() : ''; }
+    if (kind === 'visible') { return visible(el); }
+    if (kind === 'rect') {
+        var r = el.getBoundingClientRect();
+        return {x: r.x, y: r.y, width: r.width, height: r.height};
+    }
+    var prop = el[name];
+    if (prop !== undefined && prop !== null && typeof prop !== 'object' && typeof prop !== 'function') {
+        return String(prop);
+    }
+    return el.getAttribute(name);
+});
+"""
+
+# English: Sets the value of several fields in one round trip. Nothing is written unless every field
+# exists (returns the index of the first missing one, or -1). The native value setter plus input/keyup/change
+# events keep Knockout/jQuery bindings (Magento) in sync
+# Spanish: Asigna el valor de varios campos en un solo viaje. No se escribe nada si falta algún campo
+# (retorna el índice del primero que falta, o -1). El setter nativo y los eventos input/keyup/change
+# mantienen sincronizados los bindings de Knockout/jQuery (Magento)
+_FILL_FORM_JS = _FIND_ALL_JS + """
+var fields = arguments[0], targets = [];
+for (var i = 0; i < fields.length; i++) {
+    var el = findAll(fields[i][0], fields[i][1])[0];
+    if (!el) { return i; }
+    targets.push(el);
+}
+targets.forEach(function (el, i) {
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    el.focus();
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, fields[i][2]);
+    ['input', 'keyup', 'change'].forEach(function (type) {
+        el.dispatchEvent(new Event(type, {bubbles: true}));
+    });
+    el.blur();
+});
+return -1;
+"""
+
 
 class BaseActions:
     def __init__(self, driver):
         self.driver = driver
         self.wait = self._set_wait()
 
-    def _set_wait(self, timeout=10):
-        return WebDriverWait(self.driver, timeout)
+    # English: Explicit wait engine (polling interval, per-call timeouts); no implicit waits
+    # Spanish: Motor de esperas explícitas (intervalo de sondeo, timeouts por llamada); sin esperas implícitas
+    def _set_wait(self, timeout=None):
+        return SmartWait(self.driver, timeout=timeout)
 
     def _as_by_locator(self, locator):
         """
@@ -41,8 +140,11 @@ class BaseActions:
         - Si es una tupla (By, value) la retorna tal cual.
         - Si es un string, se asume como un CSS selector.
         """
+        # Fast path: locators from Configuration are already normalized (By, value) tuples
         if isinstance(locator, tuple) and len(locator) == 2:
             return locator
+        if isinstance(locator, str):
+            return _css_locator(locator)
         return (By.CSS_SELECTOR, locator)
 
     # English: Navigates to the URL
@@ -52,14 +154,15 @@ class BaseActions:
     
     # English: Waits and finds an element
     # Spanish: Espera y encuentra un elemento
-    def find(self, locator):
-        return self.wait.until(EC.presence_of_element_located(self._as_by_locator(locator)))
+    def find(self, locator, timeout=None):
+        return self.wait.until(EC.presence_of_element_located(self._as_by_locator(locator)), timeout,
+                               f"Elemento no encontrado: {locator}")
 
     # English: Clicks on an element, safe click waiting for it to be clickable
     # Spanish: Hace clic en un elemento, click seguro esperando que sea clickable
-    def click(self, locator):
+    def click(self, locator, timeout=None):
         try:
-            element = self.wait.until(EC.element_to_be_clickable(self._as_by_locator(locator)))
+            element = self.wait.until(EC.element_to_be_clickable(self._as_by_locator(locator)), timeout)
             element.click()
         except TimeoutException:
             raise Exception(f"Elemento no clickeable: {locator}")
@@ -71,29 +174,113 @@ class BaseActions:
         input_field.clear()
         input_field.send_keys(text)
 
+    # English: Fills several fields at once {locator: text}. Fields are located and set with a single script;
+    # locators listed in 'keystrokes' (or all of them with keystrokes=True) are typed with real key events
+    # afterwards, for widgets that only react to keyboard input
+    # Spanish: Llena varios campos a la vez {locator: texto}. Los campos se localizan y asignan con un solo script;
+    # los locators listados en 'keystrokes' (o todos con keystrokes=True) se escriben después con eventos de
+    # teclado reales, para widgets que solo reaccionan al teclado
+    def fill_form(self, fields, keystrokes=(), timeout=None):
+        keystrokes = set(fields) if keystrokes is True else set(keystrokes)
+        typed = [locator for locator in fields if locator in keystrokes]
+        batch = []
+        for locator, text in fields.items():
+            if locator in typed:
+                continue
+            by, value = self._as_by_locator(locator)
+            strategy = _JS_STRATEGIES.get(by)
+            if strategy is None:
+                # English: no JS equivalent for this strategy, type it instead
+                # Spanish: sin equivalente en JS para esta estrategia, se escribe con el teclado
+                typed.append(locator)
+                continue
+            batch.append((locator, [strategy, value, "" if text is None else str(text)]))
+
+        if batch:
+            missing = [None]
+
+            def all_fields_set(driver):
+                missing[0] = driver.execute_script(_FILL_FORM_JS, [payload for _, payload in batch])
+                return missing[0] == -1
+
+            try:
+                self.wait.until(all_fields_set, timeout)
+            except TimeoutException:
+                raise Exception(f"Campo de formulario no encontrado: {batch[missing[0] or 0][0]}")
+
+        for locator in typed:
+            self.send_keys(locator, fields[locator])
+
     # English: Obtains the visible text of an element
     # Spanish: Obtiene el texto visible de un elemento
     def get_text(self, locator):
         return self.find(locator).text
 
-    # English: Verifies if an element is visible
-    # Spanish: Verifica si un elemento es visible
-    def is_visible(self, locator):
+    # English: Verifies if an element is visible (per-call timeout optional)
+    # Spanish: Verifica si un elemento es visible (timeout por llamada opcional)
+    def is_visible(self, locator, timeout=None):
+        try:
+            return self.wait.until(EC.visibility_of_element_located(self._as_by_locator(locator)), timeout)
+        except TimeoutException:
+            return False
+
+    # English: Verifies that an element is hidden or absent; returns True as soon as it is
+    # Spanish: Verifica que un elemento esté oculto o no exista; retorna True en cuanto lo está
+    def is_not_visible(self, locator, timeout=None):
         try:
-            return self.wait.until(EC.visibility_of_element_located(self._as_by_locator(locator)))
+            return self.wait.until_not(EC.visibility_of_element_located(self._as_by_locator(locator)), timeout)
         except TimeoutException:
             return False
 
+    # English: Waits until the page has no pending requests (document loaded, no AJAX, no new resources)
+    # Spanish: Espera hasta que la página no tenga peticiones pendientes (documento cargado, sin AJAX ni recursos nuevos)
+    def wait_for_network_idle(self, timeout=None, idle_time=None):
+        self.wait.network_idle(timeout, idle_time)
+
+    # English: Waits until the DOM stops changing
+    # Spanish: Espera hasta que el DOM deje de cambiar
+    def wait_for_dom_stable(self, timeout=None, quiet=None):
+        self.wait.dom_stable(timeout, quiet)
+
     # English: Finds multiple elements
     # Spanish: Encontrar múltiples elementos
-    def find_all(self, locator):
-        return self.wait.until(EC.presence_of_all_elements_located(self._as_by_locator(locator)))
-
-    # English: Obtains the list of texts of multiple elements
-    # Spanish: Obtener lista de textos de múltiples elementos
-    def get_texts(self, locator):
-        elements = self.find_all(locator)
-        return [el.text for el in elements]
+    def find_all(self, locator, timeout=None):
+        return self.wait.until(EC.presence_of_all_elements_located(self._as_by_locator(locator)), timeout)
+
+    # English: Reads one property of every element matching the locator with a single execute_script per poll
+    # (waits until at least one element exists, like find_all)
+    # Spanish: Lee una propiedad de cada elemento que coincide con el locator con un solo execute_script por sondeo
+    # (espera hasta que exista al menos un elemento, como find_all)
+    def _batch_read(self, locator, kind, name=None, timeout=None):
+        by, value = self._as_by_locator(locator)
+        strategy = _JS_STRATEGIES.get(by)
+        if strategy is None:
+            raise ValueError(f"Estrategia de locator no soportada para lectura en lote: {by}")
+        return self.wait.until(
+            lambda driver: driver.execute_script(_BATCH_READ_JS, strategy, value, kind, name) or None,
+            timeout,
+            f"Elementos no encontrados: {locator}",
+        )
+
+    # English: Obtains the list of visible texts of multiple elements (one round trip instead of one per element)
+    # Spanish: Obtener lista de textos visibles de múltiples elementos (un viaje en lugar de uno por elemento)
+    def get_texts(self, locator, timeout=None):
+        return self._batch_read(locator, "text", timeout=timeout)
+
+    # English: Obtains an attribute (DOM property when present, like WebElement.get_attribute) of multiple elements
+    # Spanish: Obtener un atributo (propiedad del DOM si existe, como WebElement.get_attribute) de múltiples elementos
+    def get_attributes(self, locator, name, timeout=None):
+        return self._batch_read(locator, "attribute", name, timeout)
+
+    # English: Obtains the visibility (True/False) of multiple elements
+    # Spanish: Obtener la visibilidad (True/False) de múltiples elementos
+    def get_visibilities(self, locator, timeout=None):
+        return self._batch_read(locator, "visible", timeout=timeout)
+
+    # English: Obtains the bounding boxes {x, y, width, height} of multiple elements
+    # Spanish: Obtener los rectángulos {x, y, width, height} de múltiples elementos
+    def get_rects(self, locator, timeout=None):
+        return self._batch_read(locator, "rect", timeout=timeout)
 
     # English: Scrolls to an element
     # Spanish: Hacer scroll hacia un elemento visible
@@ -37,8 +37,10 @@ class LoginPage(BaseActions):
 # English: Login with the given username and password
 # Spanish: Iniciar sesión con el nombre de usuario y contraseña dados
     def login(self, username: str, password: str):
-        self.fill_username(username)
-        self.fill_password(password)
+        self.fill_form({
+            Configuration.USER_NAME_INPUT: username,
+            Configuration.PASSWORD_INPUT_LOGIN: password,
+        })
         self.submit()
 
 # English: Check if the user is redirected to the account page
@@ -46,8 +48,8 @@ class LoginPage(BaseActions):
     def is_redirected_to_account(self) -> bool:
         return Configuration.ACCOUNT_URL in self.driver.current_url
 
-# English: Check if the error message is visible
-# Spanish: Verificar si el mensaje de error es visible
+# English: Check if the error message is visible (waits the normal timeout: it may render after submit)
+# Spanish: Verificar si el mensaje de error es visible (espera el timeout normal: puede aparecer tras enviar)
     def is_error_visible(self) -> bool:
         if Configuration.LOGIN_ERROR_MESSAGE:
             return bool(self.is_visible(Configuration.LOGIN_ERROR_MESSAGE))
@@ -36,6 +36,22 @@ class FormSubmission(BaseActions):
     def fill_confirm_password(self, confirm_password):
         self.send_keys(Configuration.CONFIRM_PASSWORD_INPUT, confirm_password)
     
+# English: Fill the whole registration form at once (user dict from utils.data_generator.generate_user).
+# The password is typed with real keystrokes so the strength meter reacts to it
+# Spanish: Llenar todo el formulario de registro a la vez (dict de utils.data_generator.generate_user).
+# La contraseña se escribe con el teclado para que el medidor de fortaleza reaccione
+    def fill_registration_form(self, user):
+        self.fill_form(
+            {
+                Configuration.FIRST_NAME_INPUT: user["first_name"],
+                Configuration.LAST_NAME_INPUT: user["last_name"],
+                Configuration.EMAIL_INPUT: user["email"],
+                Configuration.PASSWORD_INPUT: user["password"],
+                Configuration.CONFIRM_PASSWORD_INPUT: user["confirm_password"],
+            },
+            keystrokes=[Configuration.PASSWORD_INPUT],
+        )
+
 # English: Get the strength label text
 # Spanish: Obtener el texto de la etiqueta de la contraseña
     def get_strength_label_text(self):
@@ -0,0 +1,168 @@
+# English: Explicit wait engine used by BaseActions (replaces implicit waits + fixed WebDriverWait)
+# Spanish: Motor de esperas explícitas usado por BaseActions (reemplaza esperas implícitas + WebDriverWait fijo)
+
+"""
+English:
+Mixing an implicit wait with WebDriverWait makes every poll of a condition block for the
+implicit wait, and negative checks (an element that will never appear) always burn the
+whole timeout. SmartWait polls conditions itself with a configurable interval and per-call
+timeouts. It also exposes network-idle (document loaded, no jQuery/AJAX requests in flight,
+no new resources) and DOM-stable (no DOM changes for a short quiet period) conditions.
+Conditions are plain callables taking the driver, so Selenium's expected_conditions work
+unchanged.
+
+Spanish:
+Mezclar una espera implícita con WebDriverWait hace que cada sondeo de una condición se
+bloquee por la espera implícita, y las comprobaciones negativas consumen todo el timeout.
+SmartWait sondea las condiciones con un intervalo configurable y timeouts por llamada.
+También ofrece las condiciones network-idle (documento cargado, sin peticiones AJAX en curso
+ni recursos nuevos) y DOM estable (sin cambios en el DOM durante un breve periodo).
+
+Environment variables (opcionales):
+- WAIT_TIMEOUT: default timeout in seconds (default: 10)
+- WAIT_POLL: polling interval in seconds (default: 0.1)
+- WAIT_SETTLE: quiet period in seconds for network-idle / DOM-stable (default: 0.5)
+"""
+
+import os
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+# English: One round trip that describes how "busy" the page is
+# Spanish: Un solo viaje de ida y vuelta que describe qué tan "ocupada" está la página
+_PAGE_STATE_JS = """
+return [
+    document.readyState,
+    (window.jQuery && window.jQuery.active) || 0,
+    window.performance ? window.performance.getEntriesByType('resource').length : 0,
+    document.getElementsByTagName('*').length,
+    document.body ? document.body.innerHTML.length : 0
+];
+"""
+
+
+class SmartWait:
+    """
+    English:
+    Polling wait bound to one driver. Drop-in for WebDriverWait.until/until_not with
+    per-call timeout and polling interval.
+
+    Spanish:
+    Espera por sondeo asociada a un driver. Reemplazo directo de WebDriverWait.until/until_not
+    con timeout por llamada e intervalo de sondeo.
+
+    Example:
+        wait = SmartWait(driver, timeout=10, poll=0.1)
+        element = wait.until(EC.visibility_of_element_located(locator), timeout=3)
+        wait.network_idle()
+    """
+
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, driver, timeout=None, poll=None, settle=None):
+        self.driver = driver
+        self.timeout = float(timeout if timeout is not None else os.getenv("WAIT_TIMEOUT", "10"))
+        self.poll = float(poll if poll is not None else os.getenv("WAIT_POLL", "0.1"))
+        self.settle = float(settle if settle is not None else os.getenv("WAIT_SETTLE", "0.5"))
+
+    # --------------------------
+    # Core polling / Sondeo
+    # --------------------------
+    def until(self, condition, timeout=None, message=""):
+        """
+        English: Poll 'condition(driver)' until it returns a truthy value, which is returned.
+        Spanish: Sondea 'condition(driver)' hasta que devuelva un valor verdadero, que se retorna.
+
+        Raises:
+            TimeoutException: If the condition is not met in time
+        """
+        return self._poll(condition, True, timeout, message)
+
+    def until_not(self, condition, timeout=None, message=""):
+        """
+        English: Poll until 'condition(driver)' is falsy (or raises an ignored exception). Returns True.
+        Spanish: Sondea hasta que 'condition(driver)' sea falsa (o lance una excepción ignorada). Retorna True.
+        """
+        return self._poll(condition, False, timeout, message)
+
+    def _poll(self, condition, expected, timeout, message):
+        timeout = self.timeout if timeout is None else float(timeout)
+        deadline = time.monotonic() + timeout
+        last_error = None
+
+        while True:
+            try:
+                value = condition(self.driver)
+            except self.IGNORED_EXCEPTIONS as e:
+                value, last_error = None, e
+            if bool(value) == expected:
+                return value if expected else True
+
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            time.sleep(min(self.poll, deadline - now))
+
+        raise TimeoutException(message or f"Condition not met after {timeout}s") from last_error
+
+    # --------------------------
+    # Page conditions / Condiciones de página
+    # --------------------------
+    def page_state(self):
+        """[readyState, active jQuery requests, loaded resources, DOM nodes, body length]"""
+        try:
+            return tuple(self.driver.execute_script(_PAGE_STATE_JS))
+        except Exception:
+            # English: navigation in progress; treat as busy
+            # Spanish: navegación en curso; se considera ocupada
+            return None
+
+    def network_idle(self, timeout=None, idle_time=None):
+        """
+        English: Wait until the document is loaded, no jQuery requests are active and no new
+        resources finished loading for 'idle_time' seconds.
+        Spanish: Espera a que el documento esté cargado, sin peticiones jQuery activas y sin
+        recursos nuevos durante 'idle_time' segundos.
+        """
+        tracker = _SettleTracker(self.settle if idle_time is None else idle_time, dom=False)
+        return self.until(lambda driver: tracker.update(self.page_state(), time.monotonic()),
+                          timeout, "network did not become idle")
+
+    def dom_stable(self, timeout=None, quiet=None):
+        """
+        English: Wait until the DOM has not changed (node count / body size) for 'quiet' seconds.
+        Spanish: Espera a que el DOM no cambie (nodos / tamaño del body) durante 'quiet' segundos.
+        """
+        tracker = _SettleTracker(self.settle if quiet is None else quiet, network=False)
+        return self.until(lambda driver: tracker.update(self.page_state(), time.monotonic()),
+                          timeout, "DOM did not become stable")
+
+
+class _SettleTracker:
+    """Remembers since when the page state stopped changing"""
+
+    __slots__ = ("quiet", "network", "dom", "_last", "_since")
+
+    def __init__(self, quiet, network=True, dom=True):
+        self.quiet = quiet
+        self.network = network
+        self.dom = dom
+        self._last = None
+        self._since = None
+
+    def update(self, state, now):
+        """Feed a page_state() sample; True once it has been idle/unchanged for 'quiet' seconds"""
+        if state is None or state[0] != "complete" or (self.network and state[1]):
+            self._last = self._since = None
+            return False
+
+        key = (state[2] if self.network else None, state[3:] if self.dom else None)
+        if key != self._last:
+            self._last, self._since = key, now
+            return False
+        return now - self._since >= self.quiet
@@ -22,46 +22,124 @@ Notas Educativas:
 - Sigue las mejores prácticas de pytest para organización de pruebas
 """
 
+import os
+import zlib
 import pytest
 import allure
-from api.user_service_api import UserServiceAPI
-from faker import Faker
-
-# Initialize Faker for test data generation
-fake = Faker()
+from src.api.user_service_api import UserServiceAPI
+from src.api.response_cache import ResponseCache
+from src.api.cassette import Cassette
+from pathlib import Path
+from utils.data_generator import fake
+from utils.logger import logger
 
 
 # ==================== PYTEST FIXTURES ====================
 
+@pytest.fixture(scope="session")
+def session_response_cache():
+    """
+    Fixture that provides one GET response cache shared by the whole test session
+    
+    TTL is read from API_CACHE_TTL (seconds, default 300). Hit/miss counters are
+    logged when the session ends.
+    
+    Returns:
+        ResponseCache: Session-wide cache
+    """
+    cache = ResponseCache(ttl=float(os.getenv('API_CACHE_TTL', '300')))
+    yield cache
+    logger.info(f"API response cache stats (session): {cache.stats()}")
+
+
+# Directory where recorded HTTP cassettes are stored, one file per test module
+CASSETTES_DIR = Path(os.getenv('API_CASSETTE_DIR', Path(__file__).parent / 'cassettes'))
+
+
+@pytest.fixture(scope="module")
+def api_cassette(request):
+    """
+    Fixture that provides the record/replay cassette for the current test module
+    
+    Mode comes from --api-cassette or the API_CASSETTE env var
+    (off | record | replay | auto). Returns None when cassettes are off.
+    
+    Returns:
+        Cassette | None: Cassette stored as <API_CASSETTE_DIR>/<module>.json
+    """
+    mode = request.config.getoption("--api-cassette", default=None) or os.getenv('API_CASSETTE', 'off')
+    if mode == 'off':
+        yield None
+        return
+    
+    cassette = Cassette(CASSETTES_DIR / f"{request.module.__name__.split('.')[-1]}.json", mode=mode)
+    logger.info(f"API cassette for {request.module.__name__}: {cassette!r}")
+    yield cassette
+    cassette.save()
+
+
 @pytest.fixture(scope="module")
-def user_api():
+def user_api(request, api_cassette):
     """
     Fixture that provides UserServiceAPI instance for all tests
     Scope='module' means it's created once per test module
     
+    Set API_CACHE=session to serve repeated identical GETs from the
+    session-wide response cache, --api-cassette / API_CASSETTE to
+    record or replay the module's HTTP traffic, and API_MOCK_SERVER=1 to
+    run against the local mock API server instead of API_BASE_URL.
+    
     Educational: Fixtures promote code reuse and clean test setup
     
     Returns:
         UserServiceAPI: Initialized API client instance
     """
     with allure.step("Initialize User Service API client"):
-        api = UserServiceAPI()
+        base_url = None
+        if os.getenv('API_MOCK_SERVER', '').lower() in ('1', 'true', 'yes'):
+            base_url = request.getfixturevalue('mock_api_server').base_url
+        api = UserServiceAPI(base_url=base_url)
+        if api_cassette is not None:
+            api.use_cassette(api_cassette)
+        if os.getenv('API_CACHE', '').lower() in ('1', 'true', 'session'):
+            api.enable_cache(request.getfixturevalue('session_response_cache'))
         yield api  # Provide the API client to tests
         api.close()  # Cleanup after all tests
 
 
 @pytest.fixture
-def sample_user_data():
+def response_cache(user_api):
+    """
+    Fixture that enables a fresh GET response cache for a single test
+    
+    The previous cache setting of user_api is restored afterwards.
+    
+    Returns:
+        ResponseCache: Test-scoped cache (inspect .stats() in the test)
+    """
+    previous = user_api.cache
+    cache = user_api.enable_cache(ResponseCache())
+    yield cache
+    logger.info(f"API response cache stats (test): {cache.stats()}")
+    user_api.cache = previous
+
+
+@pytest.fixture
+def sample_user_data(request, api_cassette):
     """
     Fixture that generates random user data for testing
     Uses Faker library to generate realistic test data
     
     Educational: This demonstrates test data generation best practices
-    Each test gets fresh random data, preventing test interdependencies
+    Each test gets fresh random data, preventing test interdependencies.
+    With a cassette, Faker is seeded from the test id so a replay sees
+    the same data the recording sent (and got echoed back)
     
     Returns:
         dict: Dictionary containing random user data
     """
+    if api_cassette is not None:
+        fake.seed_instance(zlib.crc32(request.node.nodeid.encode('utf-8')))
     return {
         'name': fake.name(),
         'username': fake.user_name(),
@@ -125,6 +125,23 @@ class TestUserCRUD:
             except jsonschema.exceptions.ValidationError as e:
                 pytest.fail(f"Schema validation failed: {e.message}")
     
+    @allure.title("Test GET user by ID - Body decoded once")
+    @allure.description("Verify that the result decodes the JSON body once and reuses it")
+    def test_get_user_by_id_decodes_body_once(self, user_api):
+        """
+        Test: 'data' and json() share the same cached object
+        Expected: No second decode of the response body
+        """
+        result = user_api.get_user_by_id(1)
+        
+        with allure.step("Verify data and json() return the same cached object"):
+            assert result['data'] is result.json()
+            assert result.data is result['data']
+        
+        with allure.step("Verify backward compatible keys"):
+            assert set(result) == {'status_code', 'data', 'response'}
+            assert result['response'].status_code == result['status_code']
+    
     @allure.title("Test GET user by ID - User not found")
     @allure.description("Verify that API handles non-existent user ID correctly")
     @allure.severity(allure.severity_level.NORMAL)
@@ -29,10 +29,7 @@ Notas Educativas:
 
 import allure
 from jsonschema import validate
-from faker import Faker
-
-# Initialize Faker for additional test data if needed
-fake = Faker()
+from utils.data_generator import fake  # Faker is created on first use, not at collection
 
 # Note: Fixtures (user_api, sample_user_data, user_schema) are defined in conftest.py
 # and are automatically discovered by pytest
@@ -87,4 +84,69 @@ class TestIntegration:
             allure.attach(
                 "User was created, read, updated, and deleted successfully",
                 name="Lifecycle Summary"
-            )
\ No newline at end of file
+            )
+
+@allure.feature("User Service API")
+@allure.story("Batch Operations")
+class TestBatchOperations:
+    """
+    Batch tests - many independent reads executed concurrently
+    
+    Educational: Batch calls share the pooled session and keep the input order
+    """
+    
+    @allure.title("Test batch get users keeps input order")
+    @allure.description("Fetch several users concurrently and verify order and status")
+    def test_get_users_by_ids_keeps_order(self, user_api):
+        user_ids = [5, 1, 3, 2, 4]
+        
+        with allure.step(f"Fetch users {user_ids} in one batch"):
+            results = user_api.get_users_by_ids(user_ids, max_workers=5)
+        
+        with allure.step("Verify every result matches its requested ID"):
+            assert len(results) == len(user_ids)
+            for user_id, result in zip(user_ids, results):
+                assert result['status_code'] == 200
+                assert result['data']['id'] == user_id
+    
+    @allure.title("Test batch reports per-item failures")
+    @allure.description("A missing user does not abort the rest of the batch")
+    def test_batch_reports_missing_items(self, user_api):
+        with allure.step("Fetch an existing and a non-existing user in one batch"):
+            results = user_api.get_users_by_ids([1, 99999])
+        
+        with allure.step("Verify the batch completed with per-item status"):
+            assert results[0]['status_code'] == 200
+            assert results[1]['status_code'] == 404
+            assert results[1]['data'] is None
+
+
+
+@allure.feature("User Service API")
+@allure.story("Response Cache")
+class TestResponseCache:
+    """
+    Cache tests - repeated identical GETs are served without network
+    """
+    
+    @allure.title("Test repeated GET is served from cache")
+    def test_repeated_get_is_cached(self, user_api, response_cache):
+        first = user_api.get_user_by_id(1)
+        second = user_api.get_user_by_id(1)
+        
+        with allure.step("Verify the second call reused the cached response"):
+            assert first['response'] is second['response']
+            assert second['data']['id'] == 1
+            stats = response_cache.stats()
+            assert stats['hits'] == 1
+            assert stats['misses'] == 1
+    
+    @allure.title("Test different params are cached separately")
+    def test_params_are_part_of_the_key(self, user_api, response_cache):
+        limited = user_api.get_all_users(params={'_limit': 2})
+        everyone = user_api.get_all_users()
+        
+        with allure.step("Verify both calls went to the network"):
+            assert len(limited['data']) == 2
+            assert len(everyone['data']) > 2
+            assert response_cache.stats()['misses'] == 2
@@ -0,0 +1,59 @@
+"""
+English:
+User Service API Latency Tests - response time SLAs for the user endpoints
+
+Educational Notes:
+- Per-call threshold: every request of the test must finish under the limit
+- Percentile threshold: p95 over N repetitions, so one slow outlier does not fail the run
+- Warm-up exclusion: the first calls (cold connection, empty caches) are not counted
+- The 'latency_sla' marker (utils/api_metrics.py) checks every API call the test makes
+
+Spanish:
+Pruebas de Latencia de la API de Usuario - SLAs de tiempo de respuesta para los endpoints de usuario
+
+Notas Educativas:
+- Umbral por llamada: cada petición del test debe terminar bajo el límite
+- Umbral por percentil: p95 sobre N repeticiones, un valor atípico no hace fallar la prueba
+- Exclusión de calentamiento: las primeras llamadas (conexión en frío, cachés vacías) no cuentan
+- El marcador 'latency_sla' (utils/api_metrics.py) revisa cada llamada API que hace el test
+"""
+
+import pytest
+import allure
+
+from utils.api_metrics import assert_latency_percentile, assert_response_time, measure_latency
+
+
+@allure.feature("User Service API")
+@allure.story("User API Latency")
+class TestUserLatency:
+    """
+    Test class for User API response time SLAs
+    """
+
+    @allure.title("Test GET user by ID responds within 2 seconds")
+    @pytest.mark.latency_sla(2)
+    def test_get_user_by_id_response_time(self, user_api):
+        """
+        Test: Get one user
+        Expected: Status 200 and the call (checked explicitly and by the marker) under 2 s
+        """
+        # Latency must measure the service, not the response cache (API_CACHE=session)
+        user_api.disable_cache()
+        result = user_api.get_user_by_id(1)
+
+        assert result['status_code'] == 200, f"Expected 200, got {result['status_code']}"
+        assert_response_time(result, 2)
+
+    @allure.title("Test GET user by ID p95 over 10 calls after warm-up")
+    @pytest.mark.latency_sla(1, percentile=95, warmup=1, endpoint="GET /users/{id}")
+    def test_get_user_by_id_p95(self, user_api):
+        """
+        Test: Repeat the same request 10 times after 1 warm-up call
+        Expected: p95 of the measured calls under 1 s
+        """
+        user_api.disable_cache()
+        results = measure_latency(lambda: user_api.get_user_by_id(1), repetitions=10, warmup=1)
+
+        assert all(result['status_code'] == 200 for result in results)
+        assert_latency_percentile(results, 95, 1)
@@ -0,0 +1,44 @@
+# tests/bdd_steps_definitions/conftest.py
+
+import pytest
+from pytest_bdd import then, parsers
+from utils.api_metrics import assert_latency_percentile, assert_response_time
+
+@pytest.fixture
+def scenario_context():
+    """
+    Creates a new, empty dictionary for each scenario.
+    
+    This fixture is used to pass data between Gherkin
+    steps (Given, When, Then).
+    
+    It is function scoped (one pytest-bdd scenario is one test),
+    so it is created at the start of a scenario and destroyed at the end,
+    ensuring no data leaks between tests.
+    """
+    # Create the context object
+    context = {}
+    
+    # Yield the object to the steps
+    yield context
+    
+    # Teardown: (Optional) Clear the context after the
+    # scenario is done, just for good measure.
+    context.clear()
+
+
+# --- Shared Step Definitions (visible to every scenario in this folder) ---
+
+@then(parsers.parse('the response status code should be {status_code}'))
+def check_status_code(status_code, scenario_context):
+    assert scenario_context['response'].status_code == int(status_code)
+
+# Latency steps shared by the "... within acceptable time" scenarios (product / payment features):
+# they check the timing that BaseAPIClient attached to the stored APIResult, and the p95 when
+# the 'when' step stored several measured calls under 'responses'
+@then(parsers.parse('the response should be received within {seconds:g} seconds'))
+@then(parsers.parse('the payment should be processed within {seconds:g} seconds'))
+def check_response_time(seconds, scenario_context):
+    assert_response_time(scenario_context['response'], seconds)
+    if scenario_context.get('responses'):
+        assert_latency_percentile(scenario_context['responses'], 95, seconds)
@@ -0,0 +1,58 @@
+from pytest_bdd import scenario, given, when
+import pytest
+from src.api.api_result import APIResult
+from src.api.base_api_client import BaseAPIClient
+from utils.api_metrics import measure_latency
+
+
+# Latency scenarios run against the local mock API server (root conftest), so the
+# "within N seconds" steps measure the framework, not the network to a public API
+
+
+@scenario(
+    '../../features/api/product_service.feature',
+    'Product API responds within acceptable time'
+)
+def test_product_api_response_time():
+    pass
+
+@scenario(
+    '../../features/api/order_paymemnt_service.feature',
+    'Payment processing completes within acceptable time'
+)
+def test_payment_processing_time():
+    pass
+
+# --- Fixtures ---
+
+@pytest.fixture
+def service_client(mock_api_server):
+    client = BaseAPIClient(mock_api_server.base_url)
+    yield client
+    client.close()
+
+# --- Step Definitions ---
+
+@given('the product service is available')
+@given('the payment service is available')
+def service_is_available(service_client: BaseAPIClient):
+    # Warm-up call: opens the pooled connection so the timed step does not pay for it
+    assert service_client.get('/products', params={'limit': 1}).status_code == 200
+
+@when('I request all products')
+def request_all_products(service_client: BaseAPIClient, scenario_context):
+    # Several calls so the "within" step can also check the p95, not only one sample
+    results = measure_latency(lambda: APIResult(service_client.get('/products')), repetitions=5)
+    scenario_context['responses'] = results
+    scenario_context['response'] = results[-1]
+
+@when('I submit a valid payment')
+def submit_valid_payment(service_client: BaseAPIClient, scenario_context):
+    payment = {
+        'order_id': 'ORD123',
+        'amount': 49.99,
+        'currency': 'USD',
+        'payment_method': 'credit_card',
+        'card_number': '4111111111111111'
+    }
+    scenario_context['response'] = APIResult(service_client.post('/payments', json=payment))
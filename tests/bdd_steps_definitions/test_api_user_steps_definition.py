@@ -1,6 +1,6 @@
 
 from pytest_bdd import scenario, given, when, then, parsers
-from api.user_service_api import UserServiceAPI
+from src.api.user_service_api import UserServiceAPI
 from utils.api_helpers.schema_validator import SchemaValidator
 
 
@@ -23,23 +23,18 @@ def user_service_is_ready(user_api_client: UserServiceAPI):
 def request_user(user_api_client: UserServiceAPI, user_id, scenario_context):
     # ^-- Pytest injects the NEW fixture
     
-    response = user_api_client.get_user(user_id)
+    response = user_api_client.get_user_by_id(user_id)
     
     # Store the response in the scenario-scoped context
     scenario_context['response'] = response
 
-@then(parsers.parse('the response status code should be {status_code}'))
-def check_status_code(status_code, scenario_context):
-    # ^-- Pytest injects the SAME fixture
-    assert scenario_context['response'].status_code == int(status_code)
-
 @then(parsers.parse('the response body should contain the user email "{email}"'))
 def check_email_in_body(email, scenario_context):
-    response_json = scenario_context['response'].json()
-    assert response_json['data']['email'] == email
+    # 'data' is decoded once by APIResult and reused by every following step
+    assert scenario_context['response']['data']['email'] == email
 
 @then('the response schema should be valid')
 def validate_schema(scenario_context):
     validator = SchemaValidator(schema_name='user_schema.json')
-    is_valid = validator.validate(scenario_context['response'].json())
-    assert is_valid, "API response schema is invalid"
\ No newline at end of file
+    is_valid = validator.validate(scenario_context['response']['data'])
+    assert is_valid, "API response schema is invalid"
@@ -1,6 +1,6 @@
 from pytest_bdd import scenario, given, when, then, parsers
-from pages.login_page import LoginPage # <-- Import your existing POM
-from pages.products_page import ProductsPage
+from src.pages.login_page import LoginPage # <-- Import your existing POM
+from src.pages.products_page import ProductsPage
 
 # This links the .py file to the .feature file
 @scenario(
@@ -0,0 +1,435 @@
+# Load Engine - drives the framework's API clients with virtual users at a target arrival rate
+# Motor de carga - ejecuta los clientes API del framework con usuarios virtuales a una tasa de llegada objetivo
+
+"""
+English:
+A scenario is a plain function that receives a VirtualUser and calls the same service
+clients the functional tests use (UserServiceAPI, BaseAPIClient...). LoadEngine runs it:
+
+- open model (arrival_rate or stages): iterations start at the target rate (iterations per
+  second, optionally ramping between stages) no matter how slow the service gets; when
+  every virtual user is busy the iteration is dropped and counted, so an overloaded
+  service shows up as dropped iterations instead of a silently lower rate.
+- closed model (no rate): every virtual user runs iterations back to back.
+
+Every request made inside an iteration is captured through src.api.request_metrics, so the
+report has throughput, error rate and latency percentiles overall and per endpoint template.
+
+Spanish:
+Un escenario es una función que recibe un VirtualUser y llama a los mismos clientes de
+servicio que usan las pruebas funcionales. LoadEngine lo ejecuta en modelo abierto (tasa de
+llegada fija o por etapas; si todos los usuarios virtuales están ocupados la iteración se
+descarta y se cuenta) o cerrado (cada usuario virtual encadena iteraciones). El reporte
+incluye throughput, tasa de error y percentiles de latencia globales y por endpoint.
+
+Usage:
+    python -m tests.load_test.load_engine --scenario user_read --vus 20 --rate 50 --duration 60
+
+    engine = LoadEngine(user_read, client=UserServiceAPI(), virtual_users=20, arrival_rate=50, duration=60)
+    report = engine.run()
+    print(report.format())
+    assert report.error_rate < 0.01 and report.percentile(95) < 0.5
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.api.request_metrics import LatencyHistogram, LatencySample, RequestMetrics, capture_samples
+
+# (seconds, target iterations per second) # (segundos, iteraciones por segundo objetivo)
+Stage = Tuple[float, float]
+
+_STOP = object()
+
+
+def default_is_error(sample: LatencySample) -> bool:
+    """A request failed when it raised or returned 4xx/5xx # Una petición falla si lanzó o devolvió 4xx/5xx"""
+    return sample.error or sample.status is None or sample.status >= 400
+
+
+class VirtualUser:
+    """
+    State of one simulated user, passed to the scenario on every iteration
+
+    Attributes:
+        id (int): 0-based virtual user number
+        client: Service client for this user (shared or from client_factory)
+        iteration (int): Iterations this user has started
+        data (dict): Scratch space kept between iterations (e.g. a created user id)
+        random (random.Random): Per-user random generator (reproducible with a seed)
+    """
+
+    __slots__ = ('id', 'client', 'iteration', 'data', 'random')
+
+    def __init__(self, vu_id: int, client: Any = None, seed: Optional[int] = None):
+        self.id = vu_id
+        self.client = client
+        self.iteration = 0
+        self.data: Dict[str, Any] = {}
+        self.random = random.Random(None if seed is None else seed + vu_id)
+
+    def __repr__(self) -> str:
+        return f"VirtualUser(id={self.id}, iteration={self.iteration})"
+
+
+class LoadReport:
+    """
+    Result of a load run
+
+    Latencies are in seconds; throughput in requests per second.
+    """
+
+    PERCENTILES = (50, 90, 95, 99)
+
+    def __init__(self, virtual_users: int, target: str):
+        self.virtual_users = virtual_users
+        self.target = target
+        self.duration = 0.0
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.dropped_iterations = 0
+        self.failed_requests = 0
+        self.errors: Counter = Counter()
+        self.requests = RequestMetrics()
+        self.request_latency = LatencyHistogram()
+        self.iteration_latency = LatencyHistogram()
+
+    @property
+    def request_count(self) -> int:
+        return self.request_latency.count
+
+    @property
+    def throughput(self) -> float:
+        return self.request_count / self.duration if self.duration else 0.0
+
+    @property
+    def iteration_rate(self) -> float:
+        return self.iterations / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed_requests / self.request_count if self.request_count else 0.0
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Request latency percentile in seconds # Percentil de latencia de las peticiones en segundos"""
+        return self.request_latency.percentile(percent)
+
+    def to_dict(self) -> Dict:
+        def ms(value):
+            return round(value * 1000, 3) if value is not None else None
+
+        return {
+            'target': self.target,
+            'virtual_users': self.virtual_users,
+            'duration_s': round(self.duration, 3),
+            'iterations': {'completed': self.iterations, 'failed': self.failed_iterations,
+                           'dropped': self.dropped_iterations, 'rate': round(self.iteration_rate, 3)},
+            'requests': {'count': self.request_count, 'failed': self.failed_requests,
+                         'throughput': round(self.throughput, 3), 'error_rate': round(self.error_rate, 5)},
+            'latency_ms': {**{f'p{p}': ms(self.percentile(p)) for p in self.PERCENTILES},
+                           'max': ms(self.request_latency.max), 'mean': ms(self.request_latency.mean)},
+            'iteration_latency_ms': {f'p{p}': ms(self.iteration_latency.percentile(p)) for p in self.PERCENTILES},
+            'errors': dict(self.errors),
+            'endpoints': self.requests.summary(),
+        }
+
+    def save(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding='utf-8')
+        return path
+
+    def format(self) -> str:
+        latency = ' | '.join(
+            f"p{p} {self.percentile(p) * 1000:.1f} ms" if self.request_count else f"p{p} -"
+            for p in self.PERCENTILES
+        )
+        lines = [
+            f"Load run: {self.duration:.1f}s, {self.virtual_users} virtual users, {self.target}",
+            f"  iterations: {self.iterations} completed, {self.failed_iterations} failed, "
+            f"{self.dropped_iterations} dropped ({self.iteration_rate:.2f} it/s)",
+            f"  requests:   {self.request_count} ({self.throughput:.2f} req/s), "
+            f"{self.failed_requests} failed ({self.error_rate:.2%})",
+            f"  latency:    {latency}",
+        ]
+        if self.errors:
+            lines.append("  errors:     " + ', '.join(f"{name} x{count}" for name, count in self.errors.most_common()))
+        if self.request_count:
+            lines += ["", self.requests.format_table()]
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return (f"LoadReport(requests={self.request_count}, throughput={self.throughput:.2f}/s, "
+                f"error_rate={self.error_rate:.2%})")
+
+
+class LoadEngine:
+    """
+    Runs a scenario with virtual users in an open (arrival rate) or closed model
+
+    This demonstrates:
+    - Reuse (scenarios call the functional API clients, no separate load tool)
+    - Open workload model (constant or ramping arrival rate, dropped iterations counted)
+    - Thread-based virtual users sharing a pooled session
+    """
+
+    def __init__(self, scenario: Callable[[VirtualUser], Any], client: Any = None,
+                 client_factory: Optional[Callable[[], Any]] = None, virtual_users: int = 10,
+                 arrival_rate: Optional[float] = None, duration: float = 30.0,
+                 stages: Optional[Sequence[Stage]] = None, start_rate: Optional[float] = None,
+                 iterations: Optional[int] = None, is_error: Callable[[LatencySample], bool] = default_is_error,
+                 seed: Optional[int] = None, quiet: bool = True):
+        """
+        Args:
+            scenario (callable): Function run once per iteration with a VirtualUser
+            client: Service client shared by every virtual user (e.g. UserServiceAPI())
+            client_factory (callable): Builds one client per virtual user instead of sharing 'client'
+            virtual_users (int): Maximum concurrent iterations (threads)
+            arrival_rate (float): Iterations started per second (open model); None = closed model
+            duration (float): Run length in seconds (ignored when 'stages' is given)
+            stages (list): [(seconds, target_rate), ...] ramping linearly from the previous rate
+            start_rate (float): Rate at t=0 for 'stages' (default: the first stage's target)
+            iterations (int): Stop after this many iterations (both models)
+            is_error (callable): Decides whether a captured request counts as failed
+            seed (int): Seed for the per-user random generators
+            quiet (bool): Raise the clients' log level to WARNING during the run
+
+        Raises:
+            ValueError: If virtual_users < 1, a rate is negative or the run has no length
+        """
+        if virtual_users < 1:
+            raise ValueError("virtual_users must be >= 1")
+        if arrival_rate is not None and stages is None:
+            stages = [(duration, arrival_rate)]
+        if stages is not None:
+            stages = [(float(seconds), float(rate)) for seconds, rate in stages]
+            if any(seconds < 0 or rate < 0 for seconds, rate in stages):
+                raise ValueError("stage durations and rates must be >= 0")
+            duration = sum(seconds for seconds, _ in stages)
+        if duration <= 0 and not iterations:
+            raise ValueError("the run needs a positive duration or an iteration count")
+
+        self.scenario = scenario
+        self.client = client
+        self.client_factory = client_factory
+        self.virtual_users = virtual_users
+        self.stages = stages
+        self.start_rate = start_rate if start_rate is not None else (stages[0][1] if stages else None)
+        self.duration = duration
+        self.iterations = iterations
+        self.is_error = is_error
+        self.seed = seed
+        self.quiet = quiet
+        self._lock = threading.Lock()
+        self._started = 0
+        self._report: Optional[LoadReport] = None
+
+    # ==================== ARRIVAL RATE ====================
+
+    def rate_at(self, elapsed: float) -> float:
+        """Target iterations per second 'elapsed' seconds into the run # Tasa objetivo en el instante 'elapsed'"""
+        previous = self.start_rate
+        for seconds, target in self.stages:
+            if elapsed < seconds:
+                return previous + (target - previous) * (elapsed / seconds)
+            elapsed -= seconds
+            previous = target
+        return previous
+
+    # ==================== RUN ====================
+
+    def run(self) -> LoadReport:
+        """
+        Execute the load and return its report # Ejecuta la carga y devuelve su reporte
+        """
+        target = (f"open model, {self.start_rate:g}->{self.stages[-1][1]:g} it/s" if self.stages
+                  else "closed model")
+        report = self._report = LoadReport(self.virtual_users, target)
+        users = [VirtualUser(i, self._client_for(), self.seed) for i in range(self.virtual_users)]
+        self._started = 0
+
+        with self._quiet_clients(users):
+            started = time.perf_counter()
+            if self.stages is None:
+                self._run_closed(users)
+            else:
+                self._run_open(users)
+            report.duration = time.perf_counter() - started
+        return report
+
+    def _client_for(self) -> Any:
+        if self.client_factory is not None:
+            return self.client_factory()
+        if self.client is not None and hasattr(self.client, '_ensure_pool_size'):
+            # One pooled connection per virtual user # Una conexión del pool por usuario virtual
+            self.client._ensure_pool_size(self.virtual_users)
+        return self.client
+
+    def _take_iteration(self) -> bool:
+        """Reserve one iteration of the budget # Reserva una iteración del presupuesto"""
+        with self._lock:
+            if self.iterations is not None and self._started >= self.iterations:
+                return False
+            self._started += 1
+            return True
+
+    def _run_closed(self, users: List[VirtualUser]):
+        deadline = time.monotonic() + self.duration if self.duration > 0 else None
+
+        def loop(user):
+            while (deadline is None or time.monotonic() < deadline) and self._take_iteration():
+                self._iterate(user)
+
+        self._join([threading.Thread(target=loop, args=(user,), name=f'vu-{user.id}') for user in users])
+
+    def _run_open(self, users: List[VirtualUser]):
+        work: queue.Queue = queue.Queue()
+        idle = threading.Semaphore(len(users))
+
+        def loop(user):
+            while work.get() is not _STOP:
+                try:
+                    self._iterate(user)
+                finally:
+                    idle.release()
+
+        threads = [threading.Thread(target=loop, args=(user,), name=f'vu-{user.id}') for user in users]
+        for thread in threads:
+            thread.start()
+
+        start = time.monotonic()
+        next_at = start
+        while True:
+            now = time.monotonic()
+            elapsed = now - start
+            if elapsed >= self.duration:
+                break
+            rate = self.rate_at(elapsed)
+            if rate <= 0:
+                time.sleep(min(0.05, self.duration - elapsed))
+                next_at = time.monotonic()
+                continue
+            if next_at > now:
+                time.sleep(min(next_at - now, self.duration - elapsed))
+                continue
+            if not self._take_iteration():
+                break
+            if idle.acquire(blocking=False):
+                work.put(next_at)
+            else:
+                with self._lock:
+                    self._report.dropped_iterations += 1
+            next_at += 1.0 / rate
+
+        for _ in threads:
+            work.put(_STOP)
+        self._join(threads, started=True)
+
+    @staticmethod
+    def _join(threads: List[threading.Thread], started: bool = False):
+        if not started:
+            for thread in threads:
+                thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _iterate(self, user: VirtualUser):
+        user.iteration += 1
+        error = None
+        start = time.perf_counter()
+        with capture_samples() as samples:
+            try:
+                self.scenario(user)
+            except Exception as e:
+                error = e
+        elapsed = time.perf_counter() - start
+
+        report = self._report
+        for sample in samples:
+            failed = self.is_error(sample)
+            report.requests.record(sample.method, sample.endpoint, sample.timing, error=failed)
+        with self._lock:
+            report.iterations += 1
+            report.iteration_latency.record(elapsed)
+            for sample in samples:
+                if sample.timing.total is not None:
+                    report.request_latency.record(sample.timing.total)
+                report.failed_requests += self.is_error(sample)
+            if error is not None:
+                report.failed_iterations += 1
+                report.errors[type(error).__name__] += 1
+
+    @contextmanager
+    def _quiet_clients(self, users: List[VirtualUser]):
+        """Per-request INFO logs would dominate a load run # Los logs INFO por petición dominarían la carga"""
+        loggers = {id(lg): lg for lg in (getattr(u.client, 'logger', None) for u in users)
+                   if isinstance(lg, logging.Logger)} if self.quiet else {}
+        levels = {key: lg.level for key, lg in loggers.items()}
+        for lg in loggers.values():
+            lg.setLevel(max(lg.level, logging.WARNING))
+        try:
+            yield
+        finally:
+            for key, lg in loggers.items():
+                lg.setLevel(levels[key])
+
+
+@contextmanager
+def target_base_url(base_url: Optional[str] = None):
+    """
+    English:
+    Yields the URL a load run should hit: base_url, else env API_BASE_URL, else a local
+    MockAPIServer started for the run. Load profiles never default to a public API.
+
+    Spanish:
+    Devuelve la URL a cargar: base_url, si no API_BASE_URL, si no un MockAPIServer local
+    levantado para la ejecución. Los perfiles de carga nunca apuntan a una API pública por defecto.
+    """
+    base_url = base_url or os.getenv('API_BASE_URL')
+    if base_url:
+        yield base_url
+        return
+
+    from utils.api_helpers.mock_api_server import MockAPIServer
+
+    with MockAPIServer() as server:
+        print(f"API_BASE_URL not set, running against a local mock API at {server.base_url}")
+        yield server.base_url
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from tests.load_test.scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description="Run an API load scenario with the framework's service clients")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="user_read", help="Scenario to run")
+    parser.add_argument("--vus", type=int, default=10, help="Virtual users (max concurrent iterations)")
+    parser.add_argument("--rate", type=float, default=None, help="Iterations per second (omit for closed model)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Run length in seconds")
+    parser.add_argument("--iterations", type=int, default=None, help="Stop after this many iterations")
+    parser.add_argument("--base-url", default=None, help="API base URL (default: env API_BASE_URL, else a local mock API)")
+    parser.add_argument("--output", type=Path, default=Path("reports") / "load_report.json", help="JSON report path")
+    args = parser.parse_args(argv)
+
+    from src.api.user_service_api import UserServiceAPI
+
+    with target_base_url(args.base_url) as base_url, UserServiceAPI(base_url=base_url) as client:
+        report = LoadEngine(SCENARIOS[args.scenario], client=client, virtual_users=args.vus,
+                            arrival_rate=args.rate, duration=args.duration, iterations=args.iterations).run()
+    print(report.format())
+    print(f"\nReport saved to {report.save(args.output)}")
+    return 1 if report.failed_iterations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
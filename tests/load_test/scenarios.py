@@ -0,0 +1,62 @@
+# Load Scenarios - user journeys built from the UserServiceAPI calls the functional tests use
+# Escenarios de Carga - recorridos de usuario construidos con las llamadas de UserServiceAPI
+
+"""
+English:
+Each scenario receives a VirtualUser whose 'client' is a UserServiceAPI. Scenarios only
+call client methods and raise AssertionError on an unexpected response, so the same step
+code can be reused by the functional suites and the load engine.
+
+Spanish:
+Cada escenario recibe un VirtualUser cuyo 'client' es un UserServiceAPI. Los escenarios
+solo llaman métodos del cliente y lanzan AssertionError ante una respuesta inesperada.
+"""
+
+from typing import Callable, Dict
+
+from tests.load_test.load_engine import VirtualUser
+
+# The mock API and JSONPlaceholder have users 1..10 # La API simulada y JSONPlaceholder tienen los usuarios 1..10
+USER_IDS = range(1, 11)
+
+
+def _expect(result, status: int):
+    assert result['status_code'] == status, f"Expected {status}, got {result['status_code']} ({result!r})"
+
+
+def user_read(user: VirtualUser):
+    """Open a random user profile # Abre el perfil de un usuario aleatorio"""
+    _expect(user.client.get_user_by_id(user.random.choice(USER_IDS)), 200)
+
+
+def user_browse(user: VirtualUser):
+    """List users, open one and load their posts and todos # Lista usuarios, abre uno y carga sus posts y tareas"""
+    api = user.client
+    _expect(api.get_all_users(), 200)
+    user_id = user.random.choice(USER_IDS)
+    _expect(api.get_user_by_id(user_id), 200)
+    _expect(api.get_user_posts(user_id), 200)
+    _expect(api.get_user_todos(user_id, completed=False), 200)
+
+
+def user_write(user: VirtualUser):
+    """Create a user, then update and delete it # Crea un usuario, lo actualiza y lo elimina"""
+    api = user.client
+    created = api.create_user({
+        'name': f"Load User {user.id}-{user.iteration}",
+        'username': f"load_{user.id}_{user.iteration}",
+        'email': f"load_{user.id}_{user.iteration}@example.com",
+    })
+    _expect(created, 201)
+    # JSONPlaceholder does not persist creations; reuse an existing id for the follow-up calls
+    # JSONPlaceholder no guarda lo creado; se reutiliza un id existente para las siguientes llamadas
+    user_id = user.random.choice(USER_IDS)
+    _expect(api.partial_update_user(user_id, {'name': 'Updated by load test'}), 200)
+    _expect(api.delete_user(user_id), 200)
+
+
+SCENARIOS: Dict[str, Callable[[VirtualUser], None]] = {
+    'user_read': user_read,
+    'user_browse': user_browse,
+    'user_write': user_write,
+}
@@ -0,0 +1,70 @@
+"""
+English:
+User Service Load Test - a short open-model run of the user journeys with an SLA on the result
+
+Runs only with LOAD_TEST=true so the functional suites do not hit the API with load.
+LOAD_TEST_RATE / LOAD_TEST_DURATION / LOAD_TEST_VUS tune the run.
+
+Spanish:
+Prueba de Carga del Servicio de Usuario - una ejecución corta en modelo abierto con un SLA sobre el resultado
+Solo se ejecuta con LOAD_TEST=true para que las suites funcionales no generen carga sobre la API.
+"""
+
+import os
+
+import allure
+import pytest
+
+from tests.load_test.load_engine import LoadEngine
+from tests.load_test.scenarios import user_browse, user_read
+
+pytestmark = pytest.mark.skipif(
+    os.getenv('LOAD_TEST', 'false').lower() != 'true',
+    reason="Load tests run only with LOAD_TEST=true"
+)
+
+
+@pytest.fixture
+def load_client():
+    from src.api.user_service_api import UserServiceAPI
+
+    with UserServiceAPI() as client:
+        yield client
+
+
+def _run(scenario, client):
+    report = LoadEngine(
+        scenario,
+        client=client,
+        virtual_users=int(os.getenv('LOAD_TEST_VUS', '10')),
+        arrival_rate=float(os.getenv('LOAD_TEST_RATE', '5')),
+        duration=float(os.getenv('LOAD_TEST_DURATION', '20')),
+    ).run()
+    allure.attach(report.format(), name=f"load report: {scenario.__name__}",
+                  attachment_type=allure.attachment_type.TEXT)
+    return report
+
+
+@allure.feature("User Service API")
+@allure.story("User API Load")
+class TestUserLoad:
+    """
+    Test class for User API behaviour under a constant arrival rate
+    """
+
+    @allure.title("Test user read journey under load: error rate < 1%, p95 < 1 s")
+    def test_user_read_load(self, load_client):
+        report = _run(user_read, load_client)
+
+        assert report.request_count > 0, "No requests were made"
+        assert report.dropped_iterations == 0, f"{report.dropped_iterations} iterations dropped, add virtual users"
+        assert report.error_rate < 0.01, report.format()
+        assert report.percentile(95) < 1.0, report.format()
+
+    @allure.title("Test user browse journey under load: error rate < 1%, p95 < 2 s")
+    def test_user_browse_load(self, load_client):
+        report = _run(user_browse, load_client)
+
+        assert report.request_count > 0, "No requests were made"
+        assert report.error_rate < 0.01, report.format()
+        assert report.percentile(95) < 2.0, report.format()
@@ -0,0 +1,39 @@
+# Spike Profile - a sudden burst on top of a low baseline, then recovery
+# Perfil de Pico - una ráfaga repentina sobre una base baja y luego la recuperación
+
+"""
+Runs against API_BASE_URL, or a local MockAPIServer when it is not set.
+Se ejecuta contra API_BASE_URL, o contra un MockAPIServer local si no está definida.
+
+Usage:
+    API_BASE_URL=https://staging.example.com python -m tests.performance_test.spike
+"""
+
+import os
+import sys
+
+from tests.load_test.load_engine import LoadEngine, target_base_url
+from tests.load_test.scenarios import user_read
+
+# (seconds, iterations per second) # (segundos, iteraciones por segundo)
+STAGES = [
+    (30, 5),
+    (5, 150),
+    (30, 150),
+    (5, 5),
+    (30, 5),
+]
+
+
+def main() -> int:
+    from src.api.user_service_api import UserServiceAPI
+
+    with target_base_url() as base_url, UserServiceAPI(base_url=base_url) as client:
+        report = LoadEngine(user_read, client=client, virtual_users=150, stages=STAGES).run()
+    print(report.format())
+    report.save(os.path.join('reports', 'spike_report.json'))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
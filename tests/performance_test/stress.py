@@ -0,0 +1,38 @@
+# Stress Profile - ramps the arrival rate past the expected capacity to find the breaking point
+# Perfil de Estrés - sube la tasa de llegada por encima de la capacidad esperada para encontrar el punto de quiebre
+
+"""
+Runs against API_BASE_URL, or a local MockAPIServer when it is not set.
+Se ejecuta contra API_BASE_URL, o contra un MockAPIServer local si no está definida.
+
+Usage:
+    API_BASE_URL=https://staging.example.com python -m tests.performance_test.stress
+"""
+
+import os
+import sys
+
+from tests.load_test.load_engine import LoadEngine, target_base_url
+from tests.load_test.scenarios import user_read
+
+# (seconds, iterations per second) # (segundos, iteraciones por segundo)
+STAGES = [
+    (30, 10),
+    (60, 50),
+    (60, 100),
+    (30, 0),
+]
+
+
+def main() -> int:
+    from src.api.user_service_api import UserServiceAPI
+
+    with target_base_url() as base_url, UserServiceAPI(base_url=base_url) as client:
+        report = LoadEngine(user_read, client=client, virtual_users=100, stages=STAGES, start_rate=0).run()
+    print(report.format())
+    report.save(os.path.join('reports', 'stress_report.json'))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
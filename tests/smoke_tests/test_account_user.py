@@ -32,11 +32,7 @@ def test_account_page_after_registration(driver):
     form.open(Configuration.SUBMISSION_URL)
     
     logger.debug("Filling registration form")
-    form.fill_name(user["first_name"])
-    form.fill_last_name(user["last_name"])
-    form.fill_email(user["email"])
-    form.fill_password(user["password"])
-    form.fill_confirm_password(user["confirm_password"])
+    form.fill_registration_form(user)
     
     logger.debug("Submitting registration form")
     form.submit_form()
@@ -60,4 +56,23 @@ def test_account_page_after_registration(driver):
     )
     
     logger.info("✓ Test passed: Account page loaded successfully after registration")
-    logger.info("=" * 80)
\ No newline at end of file
+    logger.info("=" * 80)
+
+
+# English: Open the account page with a session injected from a single login per worker (no UI login)
+# Spanish: Abrir la página de cuenta con una sesión inyectada desde un único login por worker (sin login por UI)
+
+def test_account_page_with_injected_session(authenticated_driver):
+    logger.info("=" * 80)
+    logger.info("Starting test: test_account_page_with_injected_session")
+
+    account = AccountUser(authenticated_driver)
+
+    logger.info("Validating that the injected session lands on the account page")
+    assert Configuration.ACCOUNT_URL.rstrip("/") in authenticated_driver.current_url.rstrip("/"), (
+        "La sesión inyectada no permitió acceder a la página de cuenta"
+    )
+    assert account.is_welcome_message_visible(), "No se visualiza el mensaje de bienvenida en la cuenta"
+
+    logger.info("✓ Test passed: Account page reached with an injected session")
+    logger.info("=" * 80)
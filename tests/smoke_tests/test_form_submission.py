@@ -30,11 +30,7 @@ def test_valid_submission(driver):
     page.open(Configuration.SUBMISSION_URL)
 
     logger.info("Filling out registration form")
-    page.fill_name(user["first_name"])
-    page.fill_last_name(user["last_name"])
-    page.fill_email(user["email"])
-    page.fill_password(user["password"])
-    page.fill_confirm_password(user["confirm_password"])
+    page.fill_registration_form(user)
     
     logger.debug("Submitting form")
     page.submit_form()
@@ -73,11 +69,7 @@ def test_password_strength_label(driver):
     page.open(Configuration.SUBMISSION_URL)
     
     logger.info("Filling form fields to trigger password strength indicator")
-    page.fill_name(user["first_name"])
-    page.fill_last_name(user["last_name"])
-    page.fill_email(user["email"])
-    page.fill_password(user["password"])
-    page.fill_confirm_password(user["confirm_password"])
+    page.fill_registration_form(user)
 
     # English: Validates that the password strength label is displayed and has the expected value
     # Spanish: Valida que el mensaje de fortaleza sea visible en la página de cuenta    
@@ -102,9 +102,18 @@ except ModuleNotFoundError:
     # selenium.common.exceptions
     common_mod = types.ModuleType("selenium.common")
     exceptions_mod = types.ModuleType("selenium.common.exceptions")
-    class TimeoutException(Exception):
+    class WebDriverException(Exception):
         pass
+    class TimeoutException(WebDriverException):
+        pass
+    class NoSuchElementException(WebDriverException):
+        pass
+    class StaleElementReferenceException(WebDriverException):
+        pass
+    exceptions_mod.WebDriverException = WebDriverException
     exceptions_mod.TimeoutException = TimeoutException
+    exceptions_mod.NoSuchElementException = NoSuchElementException
+    exceptions_mod.StaleElementReferenceException = StaleElementReferenceException
     sys.modules["selenium.common"] = common_mod
     sys.modules["selenium.common.exceptions"] = exceptions_mod
 
@@ -156,18 +165,54 @@ except ModuleNotFoundError:
     support_ec_mod.presence_of_element_located = _return_arg
     support_ec_mod.element_to_be_clickable = _return_arg
     support_ec_mod.visibility_of_element_located = _return_arg
+    support_ec_mod.presence_of_all_elements_located = _return_arg
 
     sys.modules["selenium.webdriver.support"] = support_mod
     sys.modules["selenium.webdriver.support.ui"] = support_ui_mod
     sys.modules["selenium.webdriver.support.expected_conditions"] = support_ec_mod
 
+    # English: selenium.webdriver.{chrome,firefox}.{options,service}, enough to build the
+    # BrowserManager options in unit tests (arguments and preferences are only recorded)
+    # Spanish: selenium.webdriver.{chrome,firefox}.{options,service}, suficiente para construir
+    # las opciones de BrowserManager en pruebas unitarias (solo se registran argumentos y preferencias)
+    class _ArgOptions:
+        def __init__(self):
+            self.arguments = []
+            self.binary_location = ""
+        def add_argument(self, argument):
+            self.arguments.append(argument)
+    class ChromeOptions(_ArgOptions):
+        def __init__(self):
+            super().__init__()
+            self.experimental_options = {}
+        def add_experimental_option(self, name, value):
+            self.experimental_options[name] = value
+    class FirefoxOptions(_ArgOptions):
+        def __init__(self):
+            super().__init__()
+            self.preferences = {}
+        def set_preference(self, name, value):
+            self.preferences[name] = value
+    class Service:
+        def __init__(self, executable_path=None):
+            self.path = executable_path
+    for browser_name, options_cls in (("chrome", ChromeOptions), ("firefox", FirefoxOptions)):
+        browser_mod = types.ModuleType(f"selenium.webdriver.{browser_name}")
+        options_mod = types.ModuleType(f"selenium.webdriver.{browser_name}.options")
+        service_mod = types.ModuleType(f"selenium.webdriver.{browser_name}.service")
+        options_mod.Options = options_cls
+        service_mod.Service = Service
+        sys.modules[f"selenium.webdriver.{browser_name}"] = browser_mod
+        sys.modules[f"selenium.webdriver.{browser_name}.options"] = options_mod
+        sys.modules[f"selenium.webdriver.{browser_name}.service"] = service_mod
+    selenium_mod.webdriver = webdriver_mod
+
 # Reload utils.config to re-evaluate Configuration with seeded env
 import utils.config as cfg
 importlib.reload(cfg)
 
-# Monkeypatch BaseActions wait creation to avoid constructing Selenium WebDriverWait
-import pages.base_actions as base_actions
-base_actions.BaseActions._set_wait = lambda self, timeout=10: object()
+# BaseActions builds a SmartWait (src/pages/smart_wait.py), which needs no real WebDriver,
+# so page objects are constructed as they are in the suites
 
 
 class DummyDriver:
@@ -1,6 +1,6 @@
 # Unit test for AccountUser page object
 
-from pages.page_account_user import AccountUser
+from src.pages.page_account_user import AccountUser
 
 
 def test_account_welcome_visibility_and_text(monkeypatch, dummy_driver):
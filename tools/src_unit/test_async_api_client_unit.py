@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.api.async_api_client import AsyncAPIClient
+from src.api.base_api_client import BaseAPIClient
+from utils.api_helpers.mock_api_server import MockAPIServer
+
+
+class _UsersClient(BaseAPIClient):
+    def get_user(self, user_id):
+        return self.get(f'/users/{user_id}').json()
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockAPIServer(latency=0.05) as running:
+        yield running
+
+
+@pytest.fixture
+def client(server):
+    async_client = AsyncAPIClient(client=_UsersClient(server.base_url), max_concurrency=4)
+    yield async_client
+    async_client.close()
+
+
+def test_http_methods_and_gather_keep_input_order(client):
+    async def scenario():
+        return await client.gather(*(client.get(f'/users/{i}') for i in (3, 1, 2)))
+
+    responses = asyncio.run(scenario())
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert [r.json()['id'] for r in responses] == [3, 1, 2]
+
+
+def test_calls_overlap_up_to_max_concurrency(client):
+    async def scenario():
+        return await client.gather(*(client.get_user(i) for i in range(1, 9)))
+
+    start = time.perf_counter()
+    users = asyncio.run(scenario())
+    elapsed = time.perf_counter() - start
+
+    assert [u['id'] for u in users] == list(range(1, 9))
+    # 8 calls of 50 ms, 4 at a time: about 2 rounds, far from the 8 rounds of a serial run
+    assert 0.1 <= elapsed < 0.35
+
+
+def test_getattr_exposes_client_operations_and_attributes(client, server):
+    assert client.base_url == server.base_url
+    assert asyncio.iscoroutinefunction(client.get_user)
+    assert asyncio.run(client.get_user(1))['id'] == 1
+    with pytest.raises(AttributeError):
+        client.not_an_operation
+
+
+def test_run_returns_exceptions_when_asked(client):
+    async def scenario():
+        return await client.gather(client.run(int, 'x'), client.run(int, '7'), return_exceptions=True)
+
+    failed, ok = asyncio.run(scenario())
+
+    assert isinstance(failed, ValueError) and ok == 7
+
+
+def test_client_is_reusable_across_event_loops_under_contention(server):
+    async_client = AsyncAPIClient(client=_UsersClient(server.base_url), max_concurrency=1)
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def tracked(user_id):
+        with lock:
+            running.append(user_id)
+            peak.append(len(running))
+        try:
+            return async_client.client.get_user(user_id)
+        finally:
+            with lock:
+                running.remove(user_id)
+
+    async def scenario():
+        return await async_client.gather(*(async_client.run(tracked, i) for i in (1, 2, 3)))
+
+    try:
+        for _ in range(2):
+            assert [u['id'] for u in asyncio.run(scenario())] == [1, 2, 3]
+    finally:
+        async_client.close()
+    assert max(peak) == 1
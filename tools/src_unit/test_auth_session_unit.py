@@ -0,0 +1,54 @@
+import time
+
+from utils.auth_session import _FORM_KEY, AuthSession
+
+
+class SessionDriver:
+    def __init__(self, current_url="https://example.test/customer/account/"):
+        self.current_url = current_url
+        self.cookies = [{"name": "PHPSESSID", "value": "abc", "domain": ".example.test", "sameSite": "Lax",
+                         "expiry": int(time.time()) + 3600}]
+        self.visited = []
+        self.added = []
+        self.scripts = []
+
+    def get_cookies(self):
+        return self.cookies
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        return [{"mage-cache-sessid": "true"}, {}]
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def add_cookie(self, cookie):
+        self.added.append(cookie)
+
+
+def test_capture_and_inject_restore_cookies_and_storage():
+    session = AuthSession.capture(SessionDriver())
+    target = SessionDriver(current_url="about:blank")
+
+    session.inject(target, "https://example.test/customer/account/")
+
+    assert session.origin == "https://example.test/"
+    assert target.visited == ["https://example.test/", "https://example.test/customer/account/"]
+    assert target.added == [{"name": "PHPSESSID", "value": "abc", "expiry": session.cookies[0]["expiry"]}]
+    assert target.scripts[-1] == ({"mage-cache-sessid": "true"}, {})
+
+
+def test_session_expiry_uses_earliest_persistent_cookie():
+    fresh = AuthSession("https://example.test/", [{"name": "a", "value": "1", "expiry": time.time() + 3600}])
+    stale = AuthSession("https://example.test/", [{"name": "a", "value": "1", "expiry": time.time() + 30}])
+    session_only = AuthSession("https://example.test/", [{"name": "a", "value": "1"}])
+
+    assert not fresh.is_expired()
+    assert stale.is_expired()
+    assert not session_only.is_expired()
+
+
+def test_form_key_is_found_in_either_attribute_order():
+    assert _FORM_KEY.search('<input name="form_key" type="hidden" value="k1" />').group(1) == "k1"
+    assert _FORM_KEY.search('<input value="k2" name="form_key" type="hidden">').group(2) == "k2"
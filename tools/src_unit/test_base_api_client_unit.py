@@ -0,0 +1,222 @@
+import logging
+import threading
+
+import pytest
+import requests
+
+from src.api.base_api_client import BaseAPIClient, _env_bool, _env_float, _env_int
+from src.api.response_cache import ResponseCache
+from utils.api_helpers.mock_api_server import MockAPIServer
+
+POOL_ENV = ('API_POOL_CONNECTIONS', 'API_POOL_MAXSIZE', 'API_POOL_BLOCK', 'API_MAX_RETRIES',
+            'API_RETRY_BACKOFF', 'API_RETRY_STATUSES', 'API_KEEP_ALIVE', 'API_LOG_BODY_LIMIT')
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in POOL_ENV:
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockAPIServer() as running:
+        yield running
+
+
+def _adapter(client):
+    return client.session.get_adapter(client.base_url)
+
+
+# ==================== ENV PARSING ====================
+
+def test_env_helpers_fall_back_to_defaults_when_unset_or_empty(monkeypatch):
+    assert _env_int('API_POOL_MAXSIZE', 10) == 10
+    monkeypatch.setenv('API_POOL_MAXSIZE', '')
+    assert _env_int('API_POOL_MAXSIZE', 10) == 10
+    monkeypatch.setenv('API_POOL_MAXSIZE', '32')
+    assert _env_int('API_POOL_MAXSIZE', 10) == 32
+
+    monkeypatch.setenv('API_RETRY_BACKOFF', '0.75')
+    assert _env_float('API_RETRY_BACKOFF', 0.3) == 0.75
+    monkeypatch.setenv('API_POOL_MAXSIZE', 'many')
+    with pytest.raises(ValueError):
+        _env_int('API_POOL_MAXSIZE', 10)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ('1', True), ('true', True), (' YES ', True), ('0', False), ('false', False), ('no', False), ('', True),
+])
+def test_env_bool(monkeypatch, raw, expected):
+    monkeypatch.setenv('API_KEEP_ALIVE', raw)
+    assert _env_bool('API_KEEP_ALIVE', True) is expected
+
+
+def test_pool_retry_and_keep_alive_come_from_env(monkeypatch):
+    monkeypatch.setenv('API_POOL_CONNECTIONS', '4')
+    monkeypatch.setenv('API_POOL_MAXSIZE', '16')
+    monkeypatch.setenv('API_POOL_BLOCK', 'true')
+    monkeypatch.setenv('API_MAX_RETRIES', '3')
+    monkeypatch.setenv('API_RETRY_BACKOFF', '0.5')
+    monkeypatch.setenv('API_RETRY_STATUSES', '429, 503,')
+    monkeypatch.setenv('API_KEEP_ALIVE', 'false')
+
+    client = BaseAPIClient('http://api.test/')
+    adapter = _adapter(client)
+
+    assert (client.pool_connections, client.pool_maxsize, client.pool_block) == (4, 16, True)
+    assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (4, 16, True)
+    assert client.retry_statuses == (429, 503)
+    assert client.session.headers['Connection'] == 'close'
+    retry = adapter.max_retries
+    assert (retry.total, retry.connect, retry.read, retry.status) == (3, 3, 3, 3)
+    assert retry.backoff_factor == 0.5
+    assert set(retry.status_forcelist) == {429, 503}
+    assert 'POST' not in retry.allowed_methods and 'GET' in retry.allowed_methods
+    assert retry.raise_on_status is False
+    client.close()
+
+
+def test_constructor_arguments_override_env(monkeypatch):
+    monkeypatch.setenv('API_POOL_MAXSIZE', '16')
+    monkeypatch.setenv('API_MAX_RETRIES', '3')
+
+    client = BaseAPIClient('http://api.test', pool_maxsize=2, max_retries=0, keep_alive=True,
+                           retry_statuses=(500,))
+
+    assert client.pool_maxsize == 2 and _adapter(client).max_retries.total == 0
+    assert client.retry_statuses == (500,)
+    assert client.session.headers['Connection'] == 'keep-alive'
+    client.close()
+
+
+# ==================== POOL GROWTH ====================
+
+def test_growing_the_pool_closes_the_replaced_adapter(server, monkeypatch):
+    client = BaseAPIClient(server.base_url, pool_maxsize=2)
+    assert client.get('/users/1').status_code == 200
+    old = _adapter(client)
+    closed = []
+    monkeypatch.setattr(old, 'close', lambda: closed.append(old))
+
+    client._ensure_pool_size(2)
+    assert _adapter(client) is old and not closed
+
+    client._ensure_pool_size(8)
+    assert _adapter(client) is not old and closed == [old]
+    assert client.pool_maxsize == 8 and _adapter(client)._pool_maxsize == 8
+    assert client.get('/users/2').status_code == 200
+    client.close()
+
+
+def test_concurrent_pool_growth_mounts_once(server, monkeypatch):
+    client = BaseAPIClient(server.base_url, pool_maxsize=1)
+    mounts = []
+    real_mount = client._mount_adapter
+    monkeypatch.setattr(client, '_mount_adapter', lambda *args: mounts.append(args) or real_mount(*args))
+    barrier = threading.Barrier(8)
+
+    def grow():
+        barrier.wait()
+        client._ensure_pool_size(8)
+
+    threads = [threading.Thread(target=grow) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mounts == [(10, 8)]
+    client.close()
+
+
+# ==================== RESPONSE LOGGING ====================
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def logged_client():
+    client = BaseAPIClient('http://api.test', log_body_limit=10)
+    records = _Records()
+    client.logger.addHandler(records)
+    level = client.logger.level
+    yield client, records
+    client.logger.removeHandler(records)
+    client.logger.setLevel(level)
+    client.close()
+
+
+def _response(content, encoding=None):
+    response = requests.Response()
+    response.status_code, response.reason = 200, 'OK'
+    response._content = content
+    response.encoding = encoding
+    return response
+
+
+def test_response_body_is_not_logged_at_info(logged_client, monkeypatch):
+    client, records = logged_client
+    client.logger.setLevel(logging.INFO)
+    monkeypatch.setattr(requests.Response, 'text', property(lambda self: pytest.fail("body decoded at INFO")))
+
+    client._log_response(_response(b'{"id": 1, "name": "secret"}'), 0.01)
+
+    assert records.messages == ['Response: 200 OK']
+
+
+def test_response_body_is_truncated_before_decoding_at_debug(logged_client, monkeypatch):
+    client, records = logged_client
+    client.logger.setLevel(logging.DEBUG)
+    monkeypatch.setattr(requests.Response, 'apparent_encoding',
+                        property(lambda self: pytest.fail("charset detection on the log path")))
+
+    client._log_response(_response(b'{"name": "' + b'x' * 5000 + b'"}'))
+    client._log_response(_response('{"n": "ñ"}'.encode('latin-1'), encoding='latin-1'))
+
+    assert records.messages[1] == 'Response Body: {"name": "... [truncated, 5012 bytes total]'
+    assert records.messages[3] == 'Response Body: {"n": "ñ"}'
+
+
+
+# ==================== RESPONSE CACHE ====================
+
+def test_write_invalidates_cached_resource_and_collection():
+    with MockAPIServer() as writable:
+        client = BaseAPIClient(writable.base_url)
+        cache = client.enable_cache(ResponseCache(ttl=300))
+        client.set_header('Authorization', 'Bearer token')
+
+        assert client.get('/products/1').json()['price'] != 1.5
+        client.get('/products', params={'limit': 100})
+        client.get('/products/1', headers={'Accept-Language': 'es'})
+        client.get('/products/2')
+        assert len(cache) == 4
+
+        assert client.patch('/products/1', json={'price': 1.5}).status_code == 200
+
+        # Every variant of /products/1 and the collection are gone; /products/2 stays cached
+        assert len(cache) == 1 and cache.stats()['invalidations'] == 3
+        assert client.get('/products/1').json()['price'] == 1.5
+        listed = client.get('/products', params={'limit': 100}).json()['products']
+        assert next(p for p in listed if p['id'] == 1)['price'] == 1.5
+
+        client.delete('/products/1')
+        assert client.get('/products/1').status_code == 404
+        client.close()
+
+
+def test_failed_write_keeps_the_cache(server):
+    client = BaseAPIClient(server.base_url)
+    cache = client.enable_cache(ResponseCache(ttl=300))
+    client.get('/products/1')
+
+    assert client.patch('/products/1', json={'price': -1}).status_code in (400, 401)
+    assert len(cache) == 1 and cache.stats()['invalidations'] == 0
+    client.close()
@@ -0,0 +1,200 @@
+import json
+import os
+import shutil
+import subprocess
+import time
+from urllib.parse import unquote, urlsplit
+
+import pytest
+
+from utils import browser_manager
+from utils.browser_manager import DEFAULT_BLOCKED_DOMAINS, BrowserManager, _blocking_pac_url
+
+PROXY_ENV = tuple(name for base in ("http_proxy", "https_proxy", "all_proxy", "no_proxy")
+                  for name in (base, base.upper()))
+
+
+class FakeDriver:
+    def __init__(self):
+        self.visited = []
+        self.quit_called = False
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture(autouse=True)
+def no_browser(monkeypatch, tmp_path):
+    monkeypatch.setattr(BrowserManager, "_start_driver", lambda self, browser: FakeDriver())
+    monkeypatch.setenv("BROWSER_PROFILE_DIR", str(tmp_path / "profiles"))
+    for name in ("BLOCKED_DOMAINS", "CHROME_BINARY", "FIREFOX_BINARY", "BROWSER_WARMUP_URL", *PROXY_ENV):
+        monkeypatch.delenv(name, raising=False)
+
+
+# ==================== OPTIONS ====================
+
+def test_default_chrome_options_have_no_fast_flags():
+    options = BrowserManager("chrome", headless=True, profile="default")._build_chrome_options()
+
+    assert {"--headless=new", "--no-sandbox", "--disable-dev-shm-usage"} <= set(options.arguments)
+    assert not any(arg.startswith("--host-resolver-rules") for arg in options.arguments)
+    assert "--disable-extensions" not in options.arguments
+    assert options.experimental_options == {}
+
+
+def test_fast_chrome_options_skip_images_fonts_and_block_hosts(tmp_path):
+    options = BrowserManager("chrome", headless=False, profile="fast")._build_chrome_options(tmp_path)
+
+    assert "--start-maximized" in options.arguments
+    assert f"--user-data-dir={tmp_path}" in options.arguments
+    assert {"--blink-settings=imagesEnabled=false", "--disable-remote-fonts", "--disable-extensions",
+            "--disable-background-networking", "--no-first-run"} <= set(options.arguments)
+    assert options.experimental_options["prefs"] == {"profile.managed_default_content_settings.images": 2}
+    rules = next(arg for arg in options.arguments if arg.startswith("--host-resolver-rules="))
+    for domain in DEFAULT_BLOCKED_DOMAINS:
+        assert f"MAP {domain} ~NOTFOUND" in rules and f"MAP *.{domain} ~NOTFOUND" in rules
+
+
+def test_blocked_domains_come_from_env(monkeypatch):
+    monkeypatch.setenv("BLOCKED_DOMAINS", " ads.example.com, ,tracker.test ")
+    manager = BrowserManager("chrome", headless=True, profile="fast")
+    assert manager._blocked_domains() == ["ads.example.com", "tracker.test"]
+
+    monkeypatch.setenv("BLOCKED_DOMAINS", "")
+    assert not any(arg.startswith("--host-resolver-rules") for arg in manager._build_chrome_options().arguments)
+    assert "network.proxy.type" not in manager._build_firefox_options().preferences
+
+
+def test_fast_firefox_options_fail_blocked_hosts_instead_of_resolving_them(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLOCKED_DOMAINS", "doubleclick.net,Hotjar.com")
+    options = BrowserManager("firefox", headless=True, profile="fast")._build_firefox_options(tmp_path)
+    prefs = options.preferences
+
+    assert options.arguments == ["-headless", "-profile", str(tmp_path)]
+    assert prefs["permissions.default.image"] == 2 and prefs["gfx.downloadable_fonts.enabled"] is False
+    assert "network.dns.localDomains" not in prefs
+    assert prefs["network.proxy.type"] == 2 and prefs["network.proxy.failover_direct"] is False
+    pac = unquote(prefs["network.proxy.autoconfig_url"].split(",", 1)[1])
+    assert pac.startswith("function FindProxyForURL(url, host)")
+    assert '["doubleclick.net", "hotjar.com"]' in pac
+    assert "dnsDomainIs(host, '.' + blocked[i])" in pac and "PROXY 127.0.0.1:9" in pac
+
+
+def _find_proxy(pac_url, url):
+    """Run the PAC script with node (dnsDomainIs as Firefox defines it)"""
+    script = unquote(pac_url.split(",", 1)[1])
+    host = urlsplit(url).hostname
+    program = ("function dnsDomainIs(h, d) { return h.length >= d.length && h.substring(h.length - d.length) == d; }\n"
+               f"{script}\nprocess.stdout.write(FindProxyForURL({json.dumps(url)}, {json.dumps(host)}));")
+    return subprocess.run(["node", "-e", program], capture_output=True, text=True, check=True).stdout
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is needed to evaluate the PAC script")
+def test_pac_blocks_domains_and_keeps_the_configured_proxy():
+    proxies = {"https": "http://proxy.corp:3128", "http": "proxy.corp:8080", "no": "localhost,.intra.corp"}
+    pac = _blocking_pac_url(["doubleclick.net"], proxies)
+
+    assert _find_proxy(pac, "https://ad.doubleclick.net/x.js") == "PROXY 127.0.0.1:9"
+    assert _find_proxy(pac, "https://shop.test/") == "PROXY proxy.corp:3128"
+    assert _find_proxy(pac, "http://shop.test/") == "PROXY proxy.corp:8080"
+    assert _find_proxy(pac, "https://wiki.intra.corp/") == "DIRECT"
+    assert _find_proxy(pac, "http://localhost:8000/") == "DIRECT"
+
+    socks = _blocking_pac_url(["doubleclick.net"], {"all": "socks5h://gateway:1081"})
+    assert _find_proxy(socks, "https://shop.test/") == "SOCKS5 gateway:1081"
+    assert _find_proxy(_blocking_pac_url(["doubleclick.net"]), "https://shop.test/") == "DIRECT"
+    assert _find_proxy(_blocking_pac_url(["doubleclick.net"], {**proxies, "no": "*"}), "https://shop.test/") == "DIRECT"
+
+
+def test_fast_firefox_options_fold_the_env_proxy_into_the_pac(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.corp:3128")
+    prefs = BrowserManager("firefox", headless=True, profile="fast")._build_firefox_options().preferences
+
+    pac = unquote(prefs["network.proxy.autoconfig_url"])
+    assert "return 'PROXY proxy.corp:3128'" in pac and "PROXY 127.0.0.1:9" in pac
+
+
+def test_default_firefox_options_keep_the_system_proxy():
+    prefs = BrowserManager("firefox", headless=True)._build_firefox_options().preferences
+    assert not any(name.startswith("network.proxy") for name in prefs)
+
+
+# ==================== TEMPLATE PROFILE ====================
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = BrowserManager("chrome", headless=True, profile="fast")
+    manager.launches = []
+
+    def fake_launch(browser, profile_dir=None):
+        manager.launches.append(profile_dir)
+        (profile_dir / "Default").mkdir(exist_ok=True)
+        return FakeDriver()
+
+    monkeypatch.setattr(manager, "_launch", fake_launch)
+    return manager
+
+
+def _base():
+    return browser_manager.Path(os.environ["BROWSER_PROFILE_DIR"])
+
+
+def test_template_is_built_once_and_marked_ready(manager, monkeypatch):
+    monkeypatch.setenv("BROWSER_WARMUP_URL", "https://shop.test/")
+
+    template = manager._prepare_template_profile("chrome")
+
+    assert template == _base() / "chrome-template"
+    assert (template / ".ready").exists() and (template / "Default").is_dir()
+    assert not (_base() / "chrome-template.lock").exists()
+    assert manager._prepare_template_profile("chrome") == template
+    assert manager.launches == [template]
+
+
+def test_template_lock_is_exclusive(manager):
+    _base().mkdir(parents=True)
+    (_base() / "chrome-template.lock").touch()
+
+    # Another worker is building it: start with a fresh profile instead of waiting
+    assert manager._prepare_template_profile("chrome") is None
+    assert manager.launches == []
+    assert (_base() / "chrome-template.lock").exists()
+
+
+def test_stale_template_lock_is_taken_over(manager):
+    _base().mkdir(parents=True)
+    lock = _base() / "chrome-template.lock"
+    lock.touch()
+    old = time.time() - browser_manager._TEMPLATE_LOCK_STALE_SECONDS - 5
+    os.utime(lock, (old, old))
+
+    assert manager._prepare_template_profile("chrome") == _base() / "chrome-template"
+    assert not lock.exists()
+
+
+def test_failed_template_build_is_removed(manager, monkeypatch):
+    def broken_launch(browser, profile_dir=None):
+        raise RuntimeError("browser did not start")
+
+    monkeypatch.setattr(manager, "_launch", broken_launch)
+
+    assert manager._prepare_template_profile("chrome") is None
+    assert not (_base() / "chrome-template").exists()
+    assert not (_base() / "chrome-template.lock").exists()
+
+
+def test_profile_copy_skips_lock_files(manager):
+    template = manager._prepare_template_profile("chrome")
+    (template / "SingletonLock").write_text("busy")
+    (template / "Default" / "Cookies").write_text("data")
+
+    copy = BrowserManager._copy_profile(template)
+
+    assert (copy / "Default" / "Cookies").read_text() == "data"
+    assert (copy / ".ready").exists() and not (copy / "SingletonLock").exists()
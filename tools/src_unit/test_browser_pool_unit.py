@@ -0,0 +1,154 @@
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from utils.browser_pool import BrowserPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_handle = handle
+
+
+class FakeFirefoxDriver:
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.current_handle = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.visited = []
+        self.quit_called = False
+        self.crashed = False
+
+    def close(self):
+        self.window_handles.remove(self.current_handle)
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeDriver(FakeFirefoxDriver):
+    """Chromium driver: exposes the DevTools Protocol"""
+
+    def __init__(self):
+        super().__init__()
+        self.history = {"main": ["about:blank"]}
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, command, params):
+        if self.crashed:
+            raise ConnectionError("driver is gone")
+        self.cdp_calls.append((command, params))
+        if command == "Page.getNavigationHistory":
+            return {"entries": [{"url": url} for url in self.history.get(self.current_handle, [])]}
+        return {}
+
+    @property
+    def cookies_cleared(self):
+        return sum(command == "Network.clearBrowserCookies" for command, _ in self.cdp_calls)
+
+    def cleared_origins(self):
+        return [p["origin"] for command, p in self.cdp_calls if command == "Storage.clearDataForOrigin"]
+
+
+@pytest.fixture
+def launched():
+    return []
+
+
+@pytest.fixture
+def pool(launched):
+    def factory():
+        driver = FakeDriver()
+        launched.append(driver)
+        return driver
+    return BrowserPool(factory, size=2, max_uses=3)
+
+
+def test_session_is_reused_and_reset(pool, launched):
+    driver = pool.acquire()
+    driver.window_handles.append("popup")
+    pool.release(driver)
+
+    assert pool.acquire() is driver
+    assert len(launched) == 1
+    assert driver.window_handles == ["main"]
+    assert driver.cookies_cleared == 1
+    assert driver.visited[-1] == "about:blank"
+
+
+def test_session_recycled_after_max_uses(pool, launched):
+    for _ in range(3):
+        driver = pool.acquire()
+        pool.release(driver)
+
+    assert launched[0].quit_called is True
+    assert pool.acquire() is not launched[0]
+    assert len(launched) == 2
+
+
+def test_crashed_session_is_recycled(pool, launched):
+    driver = pool.acquire()
+    driver.crashed = True
+    driver.window_handles = ["main"]
+    pool.release(driver)
+
+    assert driver.quit_called is True
+    assert pool.acquire() is not driver
+
+
+def test_pool_size_is_respected(pool, launched):
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not second
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+    pool.release(first)
+    pool.close()
+    assert first.quit_called is True
+
+
+def test_reset_clears_every_visited_origin(pool):
+    driver = pool.acquire()
+    driver.history["main"] = ["about:blank", "https://shop.test/login", "https://shop.test/account",
+                              "https://sso.idp.test:8443/authorize?x=1"]
+    driver.window_handles.append("popup")
+    driver.history["popup"] = ["https://payments.test/checkout", "data:text/html,hi"]
+    pool.release(driver)
+
+    assert pool.acquire() is driver
+    assert driver.window_handles == ["main"] and driver.current_handle == "main"
+    assert driver.cookies_cleared == 1
+    assert driver.cleared_origins() == ["https://payments.test", "https://shop.test", "https://sso.idp.test:8443"]
+    assert all(p.get("storageTypes") == "all" for c, p in driver.cdp_calls if c == "Storage.clearDataForOrigin")
+
+
+def test_sessions_without_cdp_are_recycled(launched):
+    pool = BrowserPool(lambda: launched.append(FakeFirefoxDriver()) or launched[-1], size=1, max_uses=50)
+    driver = pool.acquire()
+    pool.release(driver)
+
+    # Firefox cannot clear other origins' cookies through WebDriver, so it is not reused
+    assert driver.quit_called is True
+    assert pool.acquire() is not driver
+
+
+def _root_conftest():
+    spec = importlib.util.spec_from_file_location("root_conftest", Path(__file__).resolve().parents[2] / "conftest.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("browser, expected", [("chrome", 2), (None, 2), ("firefox", 0), ("Firefox", 0)])
+def test_pool_is_only_used_for_browsers_it_can_reset(monkeypatch, browser, expected):
+    monkeypatch.delenv("BROWSER_POOL_SIZE", raising=False)
+    options = {"--browser-pool": 2, "--browser": browser}
+    config = SimpleNamespace(getoption=options.get)
+
+    assert _root_conftest()._pool_size(config) == expected
@@ -0,0 +1,176 @@
+import json
+
+import pytest
+
+from src.api.base_api_client import BaseAPIClient
+from src.api.cassette import Cassette, CassetteMissError
+from utils.api_helpers.mock_api_server import MockAPIServer
+
+
+@pytest.fixture
+def server():
+    with MockAPIServer() as running:
+        yield running
+
+
+def _record(server, path):
+    client = BaseAPIClient(server.base_url)
+    client.use_cassette(Cassette(path, mode='record'))
+    responses = [
+        client.get('/users/1'),
+        client.get('/products', params={'category': 'Books', 'limit': 2}),
+        client.post('/payments', json={'amount': 10, 'card_number': '4111111111111111'}),
+        client.post('/payments', json={'amount': 10, 'card_number': '4111111111111111'}),
+    ]
+    client.close()
+    return responses
+
+
+def test_record_then_replay_without_network(server, tmp_path):
+    path = tmp_path / 'cassettes' / 'user.json'
+    recorded = _record(server, path)
+    base_url = server.base_url
+    server.stop()
+
+    cassette = Cassette(path, mode='auto')
+    client = BaseAPIClient(base_url)
+    client.use_cassette(cassette)
+
+    assert cassette.mode == 'replay' and len(cassette) == 4
+    assert client.get('/users/1').json() == recorded[0].json()
+    replayed = client.get('/products', params={'category': 'Books', 'limit': 2})
+    assert replayed.status_code == 200 and replayed.json() == recorded[1].json()
+    assert replayed.headers['Content-Type'] == recorded[1].headers['Content-Type']
+    client.close()
+
+
+def test_identical_requests_replay_in_recorded_order(server, tmp_path):
+    path = tmp_path / 'payments.json'
+    recorded = _record(server, path)
+    ids = [r.json()['id'] for r in recorded[2:]]
+    assert ids[0] != ids[1]
+
+    client = BaseAPIClient(server.base_url)
+    client.use_cassette(Cassette(path, mode='replay'))
+    payment = {'amount': 10, 'card_number': '4111111111111111'}
+    replayed = [client.post('/payments', json=payment).json()['id'] for _ in range(3)]
+    client.close()
+
+    # The last recorded answer repeats once the queue is exhausted
+    assert replayed == [ids[0], ids[1], ids[1]]
+
+
+def test_replay_miss_raises(server, tmp_path):
+    path = tmp_path / 'user.json'
+    _record(server, path)
+    client = BaseAPIClient(server.base_url)
+    client.use_cassette(Cassette(path, mode='replay'))
+
+    with pytest.raises(CassetteMissError, match='GET /users/2 '):
+        client.get('/users/2')
+    with pytest.raises(CassetteMissError):
+        client.get('/products', params={'category': 'Books', 'limit': 3})
+    client.close()
+
+
+def test_replay_ignores_host_port_and_body_by_default(server, tmp_path):
+    path = tmp_path / 'user.json'
+    recorded = _record(server, path)
+
+    # Another run: the mock binds a new port and Faker builds different bodies
+    with MockAPIServer() as other:
+        client = BaseAPIClient(other.base_url)
+        client.use_cassette(Cassette(path, mode='replay'))
+        other.stop()
+        assert client.get('/products', params={'limit': 2, 'category': 'Books'}).json() == recorded[1].json()
+        replayed = client.post('/payments', json={'amount': 99, 'card_number': '5500000000000004'})
+        assert replayed.json() == recorded[2].json()
+        client.close()
+
+
+def test_match_body_uses_normalized_json(server, tmp_path):
+    path = tmp_path / 'payments.json'
+    recorded = _record(server, path)
+    client = BaseAPIClient(server.base_url)
+    client.use_cassette(Cassette(path, mode='replay', match_body=True))
+
+    # Same JSON with another key order and spacing still matches
+    body = '{"card_number": "4111111111111111",  "amount": 10}'
+    replayed = client.post('/payments', data=body, headers={'Content-Type': 'application/json'})
+    assert replayed.json() == recorded[2].json()
+    with pytest.raises(CassetteMissError):
+        client.post('/payments', json={'amount': 11, 'card_number': '4111111111111111'})
+    client.close()
+
+
+def test_paths_are_relative_to_base_url_path(tmp_path):
+    path = tmp_path / 'prefixed.json'
+
+    class _Request:
+        method, body = 'GET', None
+        url = 'http://127.0.0.1:8080/api/v1/users/1?b=2&a=1'
+
+    class _Response:
+        status_code, reason, encoding, headers, content = 200, 'OK', 'utf-8', {}, b'{}'
+
+    cassette = Cassette(path, mode='record', base_url='http://127.0.0.1:8080/api/v1')
+    cassette.record(_Request, _Response)
+    cassette.save()
+
+    _Request.url = 'https://staging.example.com/v2/users/1?a=1&b=2'
+    replay = Cassette(path, mode='replay', base_url='https://staging.example.com/v2/')
+    assert replay.play(_Request).status_code == 200
+
+
+def test_save_load_round_trip_keeps_binary_bodies(tmp_path):
+    path = tmp_path / 'binary.json'
+    cassette = Cassette(path, mode='record')
+
+    class _Request:
+        method, url, body = 'get', 'http://api.test/blob?x=1', None
+
+    class _Response:
+        status_code, reason, encoding = 200, 'OK', None
+        headers = {'Content-Type': 'application/octet-stream', 'Content-Length': '4'}
+        content = b'\x00\xff\xfe\x01'
+
+    cassette.record(_Request, _Response)
+    cassette.save()
+    saved = json.loads(path.read_text(encoding='utf-8'))
+    assert saved['version'] == 2
+    assert saved['interactions'][0]['request'] == {
+        'method': 'GET', 'url': 'http://api.test/blob?x=1', 'target': '/blob?x=1', 'body_sha1': ''
+    }
+    assert 'Content-Length' not in saved['interactions'][0]['response']['headers']
+
+    replayed = Cassette(path, mode='replay').play(_Request)
+    assert replayed.status_code == 200 and replayed.content == b'\x00\xff\xfe\x01'
+    assert replayed.headers['content-type'] == 'application/octet-stream'
+
+
+def test_modes(tmp_path):
+    path = tmp_path / 'new.json'
+
+    assert Cassette(path).mode == 'record'
+    with pytest.raises(FileNotFoundError):
+        Cassette(path, mode='replay')
+    with pytest.raises(ValueError):
+        Cassette(path, mode='rewind')
+
+    Cassette(path, mode='record').save()
+    assert Cassette(path).mode == 'replay'
+    Cassette(path, mode='replay').save()
+    assert json.loads(path.read_text(encoding='utf-8'))['interactions'] == []
+
+
+def test_version_1_cassettes_still_replay(tmp_path):
+    path = tmp_path / 'v1.json'
+    path.write_text(json.dumps({'version': 1, 'interactions': [{
+        'request': {'method': 'GET', 'url': 'http://127.0.0.1:5555/users/1', 'body_sha1': ''},
+        'response': {'status': 200, 'reason': 'OK', 'headers': {}, 'encoding': 'utf-8', 'body': '{"id": 1}'}
+    }]}), encoding='utf-8')
+
+    class _Request:
+        method, url, body = 'GET', 'http://127.0.0.1:6666/users/1', None
+
+    assert Cassette(path, mode='replay').play(_Request).json() == {'id': 1}
@@ -0,0 +1,104 @@
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import utils.config as config
+from utils.config import Configuration, Locator
+
+
+def test_missing_locator_only_fails_when_used(monkeypatch):
+    monkeypatch.delenv("UNIT_MISSING_LOCATOR", raising=False)
+
+    class Settings:
+        MISSING = Locator("UNIT_MISSING_LOCATOR")
+        OPTIONAL = Locator("UNIT_MISSING_LOCATOR", optional=True)
+
+    assert Settings.OPTIONAL is None
+    with pytest.raises(ValueError, match="UNIT_MISSING_LOCATOR"):
+        Settings.MISSING
+
+
+def test_locator_is_parsed_once_and_memoized(monkeypatch):
+    monkeypatch.setenv("UNIT_LOCATOR", "id,username")
+    calls = []
+    real_parse = config.parse_locator
+    monkeypatch.setattr(config, "parse_locator", lambda value, name=None: calls.append(name) or real_parse(value, name))
+
+    class Settings:
+        FIELD = Locator("UNIT_LOCATOR")
+
+    assert Settings.FIELD == ("id", "username")
+    assert Settings.FIELD == ("id", "username")
+    assert calls == ["UNIT_LOCATOR"]
+    assert Settings.__dict__["FIELD"] == ("id", "username")
+
+
+def test_reset_locators_rereads_environment(monkeypatch):
+    monkeypatch.setenv("UNIT_RESET_LOCATOR", "css,.old")
+
+    class Settings(Configuration):
+        FIELD = Locator("UNIT_RESET_LOCATOR")
+
+    assert Settings.FIELD == ("css", ".old")
+    monkeypatch.setenv("UNIT_RESET_LOCATOR", "css,.new")
+    Settings.reset_locators()
+    assert Settings.FIELD == ("css", ".new")
+
+
+def test_parse_locator_rejects_malformed_values():
+    with pytest.raises(ValueError, match="tipo,valor"):
+        config.parse_locator("#no-type", "BROKEN")
+    with pytest.raises(ValueError, match="tipo,valor"):
+        config.parse_locator("unknown,#id", "BROKEN")
+
+
+def test_validate_locators_reports_every_bad_locator(monkeypatch):
+    monkeypatch.setenv("UNIT_GOOD_LOCATOR", "id,username")
+    monkeypatch.setenv("UNIT_BAD_LOCATOR", "#no-type")
+    monkeypatch.delenv("UNIT_UNSET_LOCATOR", raising=False)
+
+    class Settings(Configuration):
+        GOOD = Locator("UNIT_GOOD_LOCATOR")
+        BAD = Locator("UNIT_BAD_LOCATOR")
+        UNSET = Locator("UNIT_UNSET_LOCATOR")
+
+    with pytest.raises(ValueError) as error:
+        Settings.validate_locators()
+
+    message = str(error.value)
+    assert "BAD: Locator inválido para 'UNIT_BAD_LOCATOR'" in message
+    assert "UNSET: El valor del locator para 'UNIT_UNSET_LOCATOR'" in message
+    assert "GOOD" not in message and Settings.GOOD == ("id", "username")
+
+
+def test_seeded_configuration_locators_are_valid():
+    Configuration.validate_locators()
+
+
+def _root_conftest():
+    spec = importlib.util.spec_from_file_location(
+        "root_conftest", Path(__file__).resolve().parents[2] / "conftest.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _session(*fixturenames):
+    config = SimpleNamespace(getoption=lambda name: False)
+    return SimpleNamespace(config=config, items=[SimpleNamespace(fixturenames=names) for names in fixturenames])
+
+
+def test_ui_sessions_validate_locators_after_collection(monkeypatch):
+    conftest = _root_conftest()
+    monkeypatch.setenv("LOGIN_BUTTON", "button#login")
+    Configuration.reset_locators()
+
+    # API-only runs never read the UI locators
+    conftest.pytest_collection_finish(_session(["user_api"], ["mock_api_server"]))
+
+    with pytest.raises(pytest.UsageError, match="LOGIN_BUTTON"):
+        conftest.pytest_collection_finish(_session(["user_api"], ["driver", "request"]))
+    Configuration.reset_locators()
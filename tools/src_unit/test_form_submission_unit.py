@@ -1,6 +1,8 @@
 
 # Unit test for FormSubmission page object
-from pages.page_form_submission import FormSubmission
+import pytest
+
+from src.pages.page_form_submission import FormSubmission
 from utils.config import Configuration
 
 
@@ -38,3 +40,55 @@ def test_form_submission_fills_and_submits(monkeypatch, dummy_driver):
     # Extra behavior checks
     assert page.get_strength_label_text() == "Strong"
     assert page.is_success_message_displayed() is True
+
+
+class FormDriver:
+    """Records fill scripts; answers with queued results (index of a missing field, or -1)"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        return self.results.pop(0)
+
+
+def test_fill_registration_form_sets_fields_in_one_script_and_types_password(monkeypatch):
+    driver = FormDriver(-1)
+    page = FormSubmission(driver)
+    typed = []
+    monkeypatch.setattr(page, "send_keys", lambda locator, text: typed.append((locator, text)))
+    user = {"first_name": "Alice", "last_name": "Smith", "email": "alice@example.com",
+            "password": "P@ssw0rd!", "confirm_password": "P@ssw0rd!"}
+
+    page.fill_registration_form(user)
+
+    assert driver.scripts == [([
+        ["css", "#firstname", "Alice"],
+        ["css", "#lastname", "Smith"],
+        ["css", "#email_address", "alice@example.com"],
+        ["css", "#password-confirmation", "P@ssw0rd!"],
+    ],)]
+    assert typed == [(Configuration.PASSWORD_INPUT, "P@ssw0rd!")]
+
+
+def test_fill_form_retries_until_every_field_exists(monkeypatch):
+    driver = FormDriver(1, -1)
+    page = FormSubmission(driver)
+    page.wait.poll = 0.001
+
+    page.fill_form({"#a": "x", "#b": 2})
+
+    assert len(driver.scripts) == 2
+    assert driver.scripts[-1] == ([["css", "#a", "x"], ["css", "#b", "2"]],)
+
+
+def test_fill_form_reports_missing_field():
+    driver = FormDriver(*[1] * 1000)
+    page = FormSubmission(driver)
+    page.wait.poll = 0.001
+    page.wait.timeout = 0.02
+
+    with pytest.raises(Exception, match="#missing"):
+        page.fill_form({"#a": "x", "#missing": "y"})
@@ -0,0 +1,55 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from utils.import_profiler import package_times, parse_importtime, report
+
+REPORT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:       300 |       1500 |   faker.providers
+import time:      2000 |       3500 | faker
+some unrelated line
+"""
+
+
+def test_parse_importtime_reads_timings_and_depth():
+    timings = parse_importtime(REPORT)
+
+    assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ("_io", 120, 120, 0), ("faker.providers", 300, 1500, 1), ("faker", 2000, 3500, 0)
+    ]
+    assert "faker" in report(timings, top=2)
+
+
+def test_packages_first_loaded_through_a_submodule_or_plugin_are_reported():
+    timings = parse_importtime("""import time:       100 |        100 |       faker.utils
+import time:       400 |        500 |     faker.providers
+import time:        50 |         50 |       dateutil
+import time:       200 |        250 |     faker.proxy
+import time:        30 |        780 |   pytest_randomly
+import time:        20 |        800 | conftest
+import time:       300 |        300 | faker.config
+""")
+
+    assert package_times(timings) == {"conftest": 800, "pytest_randomly": 780, "faker": 1050, "dateutil": 50}
+    heavy = report(timings).split("Top")[0]
+    assert "faker" in heavy and "1.1 ms" in heavy
+
+
+def test_framework_imports_do_not_load_heavy_packages():
+    code = ("import sys, src.api, utils.api_helpers, utils.data_generator; "
+            "print(sorted(m for m in ('faker', 'selenium', 'jsonschema') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_framework_packages_are_imported_through_src_only():
+    # 'api.x' and 'src.api.x' would be two module objects (split isinstance checks, cache, metrics)
+    root = Path(__file__).resolve().parents[2]
+    pattern = re.compile(r"^\s*(from|import)\s+(api|pages)(\.|\s)", re.MULTILINE)
+    offenders = [str(path.relative_to(root)) for folder in ("src", "tests", "tools", "utils")
+                 for path in (root / folder).rglob("*.py") if pattern.search(path.read_text(encoding="utf-8"))]
+
+    assert offenders == []
@@ -0,0 +1,69 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.request_metrics import LatencySample, RequestTiming, capture_samples, observe
+from utils.api_metrics import (
+    assert_latency_percentile, assert_response_time, check_latency_sla, elapsed_of, latency_percentile,
+    measure_latency
+)
+
+
+def _sample(total, endpoint='/users/{id}', method='GET', dns=None):
+    return LatencySample(method, endpoint, RequestTiming(dns=dns, total=total))
+
+
+def test_elapsed_of_accepts_results_responses_timings_and_numbers():
+    response = SimpleNamespace(timing=RequestTiming(ttfb=0.1, total=0.25), elapsed=timedelta(seconds=0.1))
+    plain_response = SimpleNamespace(elapsed=timedelta(milliseconds=300))
+
+    assert elapsed_of(response) == 0.25
+    assert elapsed_of(response, 'ttfb') == 0.1
+    assert elapsed_of(plain_response) == 0.3
+    assert elapsed_of(RequestTiming(total=0.5)) == 0.5
+    assert elapsed_of(2) == 2.0
+
+
+def test_percentile_excludes_warmup_samples():
+    samples = [5.0] + [0.1] * 19
+
+    assert latency_percentile(samples, 95) == 0.1
+    assert latency_percentile(samples, 100) == 5.0
+    assert latency_percentile(samples, 100, warmup=1) == 0.1
+    assert_latency_percentile(samples, 100, 0.2, warmup=1)
+    with pytest.raises(AssertionError, match="p100 de 20 llamadas"):
+        assert_latency_percentile(samples, 100, 0.2)
+
+
+def test_per_call_threshold():
+    assert_response_time(0.5, 1)
+    with pytest.raises(AssertionError, match="supera el límite de 1000 ms"):
+        assert_response_time(1.5, 1)
+
+
+def test_measure_latency_discards_warmup_calls():
+    calls = iter(range(5))
+
+    assert measure_latency(lambda: next(calls), repetitions=3, warmup=2) == [2, 3, 4]
+
+
+def test_marker_check_filters_by_endpoint_and_requires_samples():
+    samples = [_sample(0.1), _sample(3.0, endpoint='/posts'), _sample(0.2)]
+
+    check_latency_sla(samples, 1, endpoint='GET /users/*')
+    check_latency_sla(samples, 0.15, percentile=50, endpoint='/users/{id}')
+    with pytest.raises(AssertionError, match="latency_sla: GET /posts took 3000.0 ms"):
+        check_latency_sla(samples, 1)
+    with pytest.raises(AssertionError, match="no API requests"):
+        check_latency_sla(samples, 1, endpoint='DELETE *')
+    with pytest.raises(AssertionError, match="no API requests"):
+        check_latency_sla(samples, 1, phase='dns')
+
+
+def test_capture_samples_collects_observed_requests():
+    with capture_samples() as samples:
+        observe('get', '/users/7', RequestTiming(total=0.05))
+    observe('get', '/users/8', RequestTiming(total=0.05))
+
+    assert [(s.method, s.endpoint, s.timing.total) for s in samples] == [('GET', '/users/{id}', 0.05)]
@@ -0,0 +1,107 @@
+import logging
+import time
+
+import pytest
+
+from src.api.request_metrics import RequestTiming, observe
+import requests
+
+from tests.load_test.load_engine import LoadEngine, LoadReport, main, target_base_url
+
+
+def _scenario(latency=0.0, status=200, fail_every=None):
+    def scenario(user):
+        if latency:
+            time.sleep(latency)
+        observe('GET', f'/users/{user.random.randint(1, 10)}', RequestTiming(total=latency or 0.01), status=status)
+        if fail_every and user.iteration % fail_every == 0:
+            raise AssertionError("unexpected response")
+    return scenario
+
+
+def test_closed_model_stops_at_iteration_budget():
+    report = LoadEngine(_scenario(), virtual_users=4, duration=5, iterations=40, seed=1).run()
+
+    assert isinstance(report, LoadReport)
+    assert report.iterations == 40
+    assert report.request_count == 40
+    assert report.failed_requests == 0 and report.error_rate == 0
+    assert report.requests.summary()[0]['endpoint'] == '/users/{id}'
+
+
+def test_open_model_keeps_arrival_rate():
+    report = LoadEngine(_scenario(), virtual_users=2, arrival_rate=50, duration=0.4).run()
+
+    assert 15 <= report.iterations <= 21
+    assert report.dropped_iterations == 0
+
+
+def test_open_model_drops_iterations_when_all_users_are_busy():
+    report = LoadEngine(_scenario(latency=0.2), virtual_users=1, arrival_rate=40, duration=0.3).run()
+
+    assert report.iterations <= 2
+    assert report.dropped_iterations >= 6
+
+
+def test_errors_count_failed_statuses_and_exceptions():
+    report = LoadEngine(_scenario(status=503, fail_every=2), virtual_users=1, iterations=10, duration=5).run()
+
+    assert report.failed_requests == 10 and report.error_rate == 1.0
+    assert report.failed_iterations == 5
+    assert report.errors == {'AssertionError': 5}
+    assert report.to_dict()['requests']['failed'] == 10
+
+
+def test_stages_ramp_linearly():
+    engine = LoadEngine(_scenario(), stages=[(10, 100), (10, 100), (10, 0)], start_rate=0)
+
+    assert engine.duration == 30
+    assert engine.rate_at(5) == pytest.approx(50)
+    assert engine.rate_at(15) == 100
+    assert engine.rate_at(25) == pytest.approx(50)
+    assert engine.rate_at(40) == 0
+
+
+def test_quiet_restores_client_log_level():
+    client = type('Client', (), {'logger': logging.getLogger('load-engine-unit')})()
+    client.logger.setLevel(logging.INFO)
+    seen = []
+
+    LoadEngine(lambda user: seen.append(user.client.logger.level), client=client, iterations=1, duration=1).run()
+
+    assert seen == [logging.WARNING]
+    assert client.logger.level == logging.INFO
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        LoadEngine(_scenario(), virtual_users=0)
+    with pytest.raises(ValueError):
+        LoadEngine(_scenario(), arrival_rate=-1)
+    with pytest.raises(ValueError):
+        LoadEngine(_scenario(), duration=0)
+
+
+def test_target_base_url_prefers_explicit_then_env(monkeypatch):
+    monkeypatch.setenv('API_BASE_URL', 'https://staging.example.com')
+    with target_base_url('http://explicit.test') as url:
+        assert url == 'http://explicit.test'
+    with target_base_url() as url:
+        assert url == 'https://staging.example.com'
+
+
+def test_target_base_url_starts_local_mock_without_env(monkeypatch):
+    monkeypatch.delenv('API_BASE_URL', raising=False)
+    with target_base_url() as url:
+        assert url.startswith('http://127.0.0.1:')
+        assert requests.get(f"{url}/users/1", timeout=5).status_code == 200
+    with pytest.raises(requests.ConnectionError):
+        requests.get(f"{url}/users/1", timeout=1)
+
+
+def test_cli_runs_against_local_mock_by_default(monkeypatch, tmp_path):
+    monkeypatch.delenv('API_BASE_URL', raising=False)
+    output = tmp_path / 'load_report.json'
+
+    assert main(['--scenario', 'user_browse', '--vus', '2', '--iterations', '4', '--output', str(output)]) == 0
+    assert output.exists()
@@ -0,0 +1,111 @@
+import io
+import json
+import logging
+import time
+
+import pytest
+
+from utils.logger import WORKER_ID, AsyncLogPipeline, JsonFormatter, _file_handler, log_context
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+        self.batches = 0
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def flush_batch(self):
+        self.batches += 1
+
+
+def _logger(name, pipeline):
+    log = logging.getLogger(name)
+    log.handlers[:] = [pipeline.handler]
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    return log
+
+
+def test_pipeline_writes_in_order_and_flushes_in_batches():
+    sink = _ListHandler()
+    pipeline = AsyncLogPipeline([sink], batch_size=4, flush_interval=60).start()
+    log = _logger("unit.async", pipeline)
+
+    for i in range(10):
+        log.info("record %d", i)
+    pipeline.flush()
+    pipeline.stop()
+
+    assert sink.messages == [f"record {i}" for i in range(10)]
+    assert sink.batches <= 10 // 4 + 2
+
+
+def test_pipeline_respects_handler_levels():
+    sink = _ListHandler(logging.WARNING)
+    pipeline = AsyncLogPipeline([sink]).start()
+    log = _logger("unit.levels", pipeline)
+
+    log.info("ignored")
+    log.warning("kept")
+    pipeline.stop()
+
+    assert sink.messages == ["kept"]
+
+
+def test_drop_policy_discards_low_levels_when_queue_is_full():
+    pipeline = AsyncLogPipeline([_ListHandler()], maxsize=1, policy="drop")
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "msg", None, None)
+
+    pipeline.handler.enqueue(record)
+    pipeline.handler.enqueue(record)
+
+    assert pipeline.dropped == 1
+    assert pipeline.queue.qsize() == 1
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncLogPipeline([], policy="later")
+
+
+def test_file_handler_is_lazy_and_rotates_by_size(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_MAX_BYTES", "200")
+    monkeypatch.setenv("LOG_BACKUP_COUNT", "2")
+    monkeypatch.delenv("LOG_ROTATE_WHEN", raising=False)
+    path = tmp_path / "logs" / "run.log"
+    handler = _file_handler(path)
+    assert not path.parent.exists()
+
+    pipeline = AsyncLogPipeline([handler], batch_size=8).start()
+    log = _logger("unit.rotate", pipeline)
+    for i in range(20):
+        log.info("line %02d %s", i, "x" * 40)
+    pipeline.stop()
+    handler.close()
+
+    assert path.exists()
+    assert (tmp_path / "logs" / "run.log.1").exists()
+
+
+def test_json_records_carry_correlation_context_and_extra_fields():
+    stream = io.StringIO()
+    sink = logging.StreamHandler(stream)
+    sink.setFormatter(JsonFormatter())
+    pipeline = AsyncLogPipeline([sink]).start()
+    log = _logger("unit.json", pipeline)
+
+    with log_context(test="t.py::a", test_started=time.time() - 2):
+        with log_context(request_id="abc123"):
+            log.info("Response: %s", 200, extra={"status": 200, "elapsed_ms": 12.5})
+        log.info("after request")
+    pipeline.stop()
+
+    first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert first["message"] == "Response: 200"
+    assert (first["test"], first["request_id"], first["worker"]) == ("t.py::a", "abc123", WORKER_ID)
+    assert (first["status"], first["elapsed_ms"]) == (200, 12.5)
+    assert 2 <= first["elapsed"] < 10
+    assert second["request_id"] is None and second["test"] == "t.py::a"
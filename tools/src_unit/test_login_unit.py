@@ -1,14 +1,14 @@
 import pytest
-from pages.login import LoginPage
+from src.pages.login import LoginPage
 from utils.config import Configuration
 
 
 def test_login_calls_and_redirect(monkeypatch, dummy_driver):
-    calls = {"send_keys": [], "click": []}
+    calls = {"fill_form": [], "click": []}
     page = LoginPage(dummy_driver)
 
     # Monkeypatch BaseActions methods on the instance
-    monkeypatch.setattr(page, "send_keys", lambda locator, text: calls["send_keys"].append((locator, text)))
+    monkeypatch.setattr(page, "fill_form", lambda fields, **kwargs: calls["fill_form"].append(fields))
     def fake_click(locator):
         calls["click"].append(locator)
         # Simulate redirect after clicking login
@@ -19,10 +19,10 @@ def test_login_calls_and_redirect(monkeypatch, dummy_driver):
     page.login("foo@example.com", "secret")
 
     # Verify interactions
-    assert calls["send_keys"] == [
-        (Configuration.USER_NAME_INPUT, "foo@example.com"),
-        (Configuration.PASSWORD_INPUT_LOGIN, "secret"),
-    ]
+    assert calls["fill_form"] == [{
+        Configuration.USER_NAME_INPUT: "foo@example.com",
+        Configuration.PASSWORD_INPUT_LOGIN: "secret",
+    }]
     assert calls["click"] == [Configuration.LOGIN_BUTTON]
 
     # Verify redirect check
@@ -37,8 +37,20 @@ def test_login_negative_error_visible(monkeypatch, dummy_driver):
         monkeypatch.setattr(Configuration, "LOGIN_ERROR_MESSAGE", ("css", ".message-error"), raising=False)
 
     # Force error visible/text
-    monkeypatch.setattr(page, "is_visible", lambda locator: True)
+    monkeypatch.setattr(page, "is_visible", lambda locator, **kwargs: True)
     monkeypatch.setattr(page, "get_text", lambda locator: "Invalid login or password.")
 
     assert page.is_error_visible() is True
     assert page.get_error_text() == "Invalid login or password."
+
+
+def test_error_check_waits_the_full_timeout(monkeypatch, dummy_driver):
+    page = LoginPage(dummy_driver)
+    if not getattr(Configuration, "LOGIN_ERROR_MESSAGE", None):
+        monkeypatch.setattr(Configuration, "LOGIN_ERROR_MESSAGE", ("css", ".message-error"), raising=False)
+    calls = []
+    monkeypatch.setattr(page, "is_visible", lambda locator, **kwargs: calls.append(kwargs) or False)
+
+    assert page.is_error_visible() is False
+    # No shortened per-call timeout: the message can render a while after submit
+    assert calls == [{}]
@@ -0,0 +1,128 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+from utils.api_helpers.mock_api_server import MockAPIServer
+
+
+@pytest.fixture
+def server():
+    with MockAPIServer() as running:
+        yield running
+
+
+def call(server, method, path, body=None, headers=None):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(
+        server.base_url + path, data=data, method=method,
+        headers={"Content-Type": "application/json", **(headers or {})},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            raw = response.read()
+            return response.status, json.loads(raw) if raw else None
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_users_are_jsonplaceholder_compatible(server):
+    status, user = call(server, "GET", "/users/1")
+    assert status == 200
+    assert {"id", "name", "username", "email"} <= set(user)
+
+    status, users = call(server, "GET", "/users?_limit=3")
+    assert status == 200 and len(users) == 3
+
+    status, body = call(server, "GET", "/users/99999")
+    assert status == 404 and "error" in body
+
+
+def test_products_filter_and_paginate(server):
+    status, page = call(server, "GET", "/products?category=Electronics&page=1&limit=5")
+    assert status == 200
+    assert page["count"] == 5 and page["has_next"] is True
+    assert all(p["category"] == "Electronics" for p in page["products"])
+
+    _, ranged = call(server, "GET", "/products?min_price=20&max_price=50")
+    prices = [p["price"] for p in ranged["products"]]
+    assert prices == sorted(prices) and all(20 <= p <= 50 for p in prices)
+
+
+def test_product_writes_require_auth_and_validation(server):
+    assert call(server, "POST", "/products", {"name": "X", "price": 1})[0] == 401
+
+    auth = {"Authorization": "Bearer token"}
+    status, body = call(server, "POST", "/products", {"price": 1}, auth)
+    assert status == 400 and body["error"] == "name is required"
+    status, body = call(server, "POST", "/products", {"name": "X", "price": -10}, auth)
+    assert status == 400 and body["error"] == "invalid price"
+
+    assert call(server, "DELETE", "/products/5", headers=auth)[0] == 204
+    assert call(server, "GET", "/products/5")[0] == 404
+
+
+def test_payments_flow(server):
+    payment = {"order_id": "12345", "amount": 99.99, "card_number": "4111111111111111", "reference": "REF789"}
+    status, body = call(server, "POST", "/payments", payment)
+    assert status == 200 and body["status"] == "completed" and body["transaction_id"]
+    assert call(server, "GET", "/orders/12345")[1]["status"] == "paid"
+    assert call(server, "POST", "/payments", payment) == (409, {"error": "duplicate transaction"})
+
+    status, refund = call(server, "POST", "/payments/PAY123/refunds", {"amount": 30})
+    assert status == 200 and refund["remaining_amount"] == 70.0
+
+    assert call(server, "POST", "/payments", {"amount": 1, "card_number": "1234567890123456"})[0] == 400
+    assert call(server, "POST", "/payments", {"amount": 10000, "card_number": "4111111111111111"})[0] == 402
+
+
+def test_invalid_query_params_and_bodies_answer_400(server):
+    assert call(server, "GET", "/users?_limit=abc") == (400, {"error": "invalid _limit"})
+    assert call(server, "GET", "/products?min_price=x") == (400, {"error": "invalid min_price"})
+    assert call(server, "GET", "/products?page=0")[0] == 400
+    status, body = call(server, "GET", "/products?sort=nope")
+    assert status == 400 and "invalid sort field" in body["error"]
+    assert call(server, "POST", "/users", [{"name": "X"}]) == (400, {"error": "JSON body must be an object"})
+    assert call(server, "POST", "/payments/PAY123/refunds", {"amount": "ten"}) == (400, {"error": "invalid refund amount"})
+
+
+def test_unexpected_errors_answer_json_500(server, monkeypatch):
+    def broken(*args):
+        raise KeyError("boom")
+
+    monkeypatch.setattr(server, "_route_users", broken)
+    assert call(server, "GET", "/users/1") == (500, {"error": "internal server error: KeyError"})
+    assert call(server, "GET", "/products/1")[0] == 200
+
+
+def test_keep_alive_requests_do_not_wait_for_delayed_ack(server):
+    import http.client
+    import time
+
+    connection = http.client.HTTPConnection(server.base_url[len("http://"):])
+    try:
+        connection.request("GET", "/users/1")
+        connection.getresponse().read()
+        start = time.perf_counter()
+        for _ in range(10):
+            connection.request("GET", "/users/1")
+            assert connection.getresponse().read()
+        elapsed = time.perf_counter() - start
+    finally:
+        connection.close()
+
+    # ~40 ms per request with Nagle + delayed ACK # ~40 ms por petición con Nagle + ACK retrasado
+    assert elapsed < 0.2
+
+
+def test_user_writes_are_answered_but_not_persisted(server):
+    assert call(server, "DELETE", "/users/1") == (200, {})
+    assert call(server, "GET", "/users/1")[0] == 200
+
+    status, patched = call(server, "PATCH", "/users/2", {"name": "Changed"})
+    assert status == 200 and patched["name"] == "Changed" and patched["email"] == "user2@example.com"
+    assert call(server, "GET", "/users/2")[1]["name"] == "User 2"
+
+    status, created = call(server, "POST", "/users", {"name": "New"})
+    assert status == 201 and created["id"] == 11
+    assert call(server, "GET", "/users/11")[0] == 404
@@ -0,0 +1,116 @@
+import random
+import socket
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from src.api import request_metrics, timed_adapter
+from src.api.base_api_client import BaseAPIClient
+from src.api.request_metrics import (
+    LatencyHistogram, RequestMetrics, RequestTiming, add_id_pattern, endpoint_template, timing_scope,
+    current_timing
+)
+from utils.api_helpers.mock_api_server import MockAPIServer
+
+
+def test_endpoint_template_collapses_ids_and_query():
+    assert endpoint_template('/users/42/posts?_limit=5') == '/users/{id}/posts'
+    assert endpoint_template('https://api.test/orders/3f2a9c1e-0b7d-4c1a-9e2f-1a2b3c4d5e6f') == '/orders/{id}'
+    assert endpoint_template('/users') == '/users'
+
+
+def test_endpoint_template_collapses_codes_and_slugs_but_not_versions():
+    assert endpoint_template('/v2/orders/ORD-2024-0042/items') == '/v2/orders/{id}/items'
+    assert endpoint_template('/api/v1/posts/42-hello-world') == '/api/v1/posts/{id}'
+    assert endpoint_template('/sku/ab12cd/reviews/2024-01-05') == '/sku/{id}/reviews/{id}'
+    assert endpoint_template('/users/me/order-items') == '/users/me/order-items'
+
+
+def test_add_id_pattern_covers_word_slugs(monkeypatch):
+    monkeypatch.setattr(request_metrics, '_extra_id_patterns', [])
+    assert endpoint_template('/posts/my-first-post') == '/posts/my-first-post'
+
+    add_id_pattern(r'[a-z]+(-[a-z]+){2,}')
+
+    assert endpoint_template('/posts/my-first-post') == '/posts/{id}'
+    assert endpoint_template('/posts/order-items') == '/posts/order-items'
+    endpoint_template.cache_clear()
+
+
+def test_histogram_percentiles_are_within_one_percent():
+    rng = random.Random(7)
+    samples = sorted(rng.uniform(0.001, 2.0) for _ in range(5000))
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.record(value)
+
+    for percent in (50, 95, 99):
+        exact = samples[int(percent / 100 * len(samples)) - 1]
+        assert abs(histogram.percentile(percent) - exact) / exact < 0.01
+    assert histogram.max == round(samples[-1], 6)
+    assert histogram.count == 5000
+
+
+def test_histograms_merge_exactly_through_the_json_artifact(tmp_path):
+    first, second = RequestMetrics(), RequestMetrics()
+    for i in range(1, 101):
+        target = first if i % 2 else second
+        target.record('get', f'/users/{i}', RequestTiming(ttfb=i / 2000, total=i / 1000), error=i == 100)
+
+    second.save(tmp_path / 'second.json')
+    merged = first.merge_dict(RequestMetrics.load(tmp_path / 'second.json').to_dict())
+
+    total = merged.histogram('GET', '/users/{id}')
+    assert total.count == 100 and len(merged) == 100
+    assert abs(total.percentile(95) - 0.095) < 0.001
+    row, = merged.summary()
+    assert (row['method'], row['endpoint'], row['errors']) == ('GET', '/users/{id}', 1)
+    assert row['dns']['p50'] is None
+    assert 'GET' in merged.format_table()
+
+
+def test_timing_scope_sets_and_restores_current_timing():
+    timing = RequestTiming()
+    with timing_scope(timing):
+        assert current_timing() is timing
+    assert current_timing() is None
+
+
+
+@pytest.fixture
+def dual_stack_host(monkeypatch):
+    """'dual.test' resolves to the addresses in the returned list, in order"""
+    real_getaddrinfo = socket.getaddrinfo
+    addresses = []
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        if host != 'dual.test':
+            return real_getaddrinfo(host, port, *args, **kwargs)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, port)) for address in addresses]
+
+    monkeypatch.setattr(timed_adapter.socket, 'getaddrinfo', getaddrinfo)
+    return addresses
+
+
+def test_timed_connection_falls_back_to_the_next_resolved_address(dual_stack_host):
+    # The mock listens on 127.0.0.1 only, so 127.0.0.2 refuses the connection
+    dual_stack_host.extend(['127.0.0.2', '127.0.0.1'])
+    with MockAPIServer() as server:
+        client = BaseAPIClient(f"http://dual.test:{urlsplit(server.base_url).port}", max_retries=0)
+        response = client.get('/users/1')
+        client.close()
+
+    assert response.status_code == 200
+    assert response.timing.dns is not None and response.timing.connect is not None
+
+
+def test_timed_connection_raises_when_every_address_fails(dual_stack_host):
+    dual_stack_host.extend(['127.0.0.2', '127.0.0.3'])
+    with MockAPIServer() as server:
+        port = urlsplit(server.base_url).port
+    client = BaseAPIClient(f"http://dual.test:{port}", max_retries=0)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get('/users/1')
+    client.close()
@@ -0,0 +1,160 @@
+import io
+import json
+import os
+
+import pytest
+from jsonschema.exceptions import SchemaError
+
+from utils.api_helpers import schema_validator
+from utils.api_helpers.schema_validator import SchemaRegistry, SchemaValidator, iter_json_array
+
+ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    "required": ["id", "name"],
+}
+
+
+@pytest.fixture
+def validator(tmp_path):
+    (tmp_path / "item_schema.json").write_text(json.dumps(ITEM_SCHEMA), encoding="utf-8")
+    return SchemaValidator("item_schema.json", schemas_dir=tmp_path)
+
+
+def _items(count, bad=()):
+    return [{"id": i} if i in bad else {"id": i, "name": f"item {i}"} for i in range(count)]
+
+
+# ==================== validate_many ====================
+
+def test_validate_many_collects_every_error(validator):
+    result = validator.validate_many(_items(50, bad={3, 40}))
+
+    assert result["is_valid"] is False
+    assert result["checked"] == 50
+    assert [e["index"] for e in result["errors"]] == [3, 40]
+    assert result["errors"][0]["validator"] == "required"
+
+
+def test_validate_many_fail_fast_stops_at_first_error(validator):
+    result = validator.validate_many(iter(_items(50, bad={3, 40})), fail_fast=True)
+
+    assert [e["index"] for e in result["errors"]] == [3]
+    assert result["checked"] == 4
+    assert validator.validate_many([])["is_valid"] is True
+
+
+def test_validate_many_parallel_matches_serial(validator):
+    items = _items(3000, bad={1234, 2100, 2999})
+
+    serial = validator.validate_many(items)
+    parallel = validator.validate_many(iter(items), processes=2, chunk_size=500)
+
+    assert parallel["checked"] == serial["checked"] == 3000
+    assert parallel["errors"] == serial["errors"]
+
+
+def test_validate_many_parallel_fail_fast_reports_the_first_error(validator):
+    # Errors in every later chunk: whichever finishes first, index 1234 must win
+    items = _items(5000, bad={1234} | set(range(1500, 5000, 100)))
+
+    serial = validator.validate_many(items, fail_fast=True)
+    parallel = validator.validate_many(items, fail_fast=True, processes=2, chunk_size=500)
+
+    assert [e["index"] for e in parallel["errors"]] == [e["index"] for e in serial["errors"]] == [1234]
+    assert parallel["checked"] == serial["checked"] == 1235
+
+
+# ==================== iter_json_array ====================
+
+def test_iter_json_array_handles_chunk_boundaries():
+    document = '[1, 23, "a,]b", {"x": [1, 2]}, true, null, -4.5e1]'
+    expected = json.loads(document)
+
+    for size in (1, 2, 3, 7, len(document)):
+        chunks = [document[i:i + size] for i in range(0, len(document), size)]
+        assert list(iter_json_array(chunks)) == expected
+
+
+def test_iter_json_array_splits_utf8_sequences_and_reads_files():
+    data = json.dumps([{"name": "José ñandú"}, {"name": "東京"}], ensure_ascii=False).encode("utf-8")
+
+    byte_chunks = [data[i:i + 1] for i in range(len(data))]
+    assert [v["name"] for v in iter_json_array(byte_chunks)] == ["José ñandú", "東京"]
+    assert len(list(iter_json_array(io.BytesIO(data), chunk_size=3))) == 2
+    assert len(list(iter_json_array(io.StringIO(data.decode("utf-8")), chunk_size=3))) == 2
+    assert list(iter_json_array(["  [ ", " ]"])) == []
+
+
+@pytest.mark.parametrize("document", ['{"a": 1}', "[1, 2", "[1,, 2]", "[1, 2,]", "[1 2]", '[{"a": ]', ""])
+def test_iter_json_array_rejects_malformed_input(document):
+    with pytest.raises(ValueError):
+        list(iter_json_array([document]))
+
+
+# ==================== SchemaRegistry ====================
+
+@pytest.fixture
+def registry():
+    SchemaRegistry.clear()
+    yield SchemaRegistry
+    SchemaRegistry.clear()
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_registry_compiles_each_schema_file_once(tmp_path, registry, monkeypatch):
+    path = tmp_path / "item_schema.json"
+    path.write_text(json.dumps(ITEM_SCHEMA), encoding="utf-8")
+    compiled = []
+    real_compile = schema_validator._compile
+    monkeypatch.setattr(schema_validator, "_compile", lambda schema: compiled.append(schema) or real_compile(schema))
+
+    schema, first = registry.get(path)
+    _, second = registry.get(path)
+    third = SchemaValidator("item_schema.json", schemas_dir=tmp_path).validator
+
+    assert schema == ITEM_SCHEMA
+    assert first is second is third
+    assert len(compiled) == 1
+
+
+def test_registry_reloads_a_schema_when_the_file_changes(tmp_path, registry):
+    path = tmp_path / "item_schema.json"
+    path.write_text(json.dumps(ITEM_SCHEMA), encoding="utf-8")
+    _, before = registry.get(path)
+    assert before.is_valid({"id": 1, "name": "a"})
+
+    path.write_text(json.dumps({**ITEM_SCHEMA, "required": ["id", "name", "price"]}), encoding="utf-8")
+    _bump_mtime(path)
+    schema, after = registry.get(path)
+
+    assert after is not before
+    assert schema["required"] == ["id", "name", "price"]
+    assert not after.is_valid({"id": 1, "name": "a"})
+
+
+def test_registry_rejects_invalid_schemas(tmp_path, registry):
+    path = tmp_path / "bad_schema.json"
+    path.write_text(json.dumps({"type": "not-a-type"}), encoding="utf-8")
+
+    with pytest.raises(SchemaError):
+        registry.get(path)
+    with pytest.raises(SchemaError):
+        SchemaValidator.validate_against_schema_string({}, {"type": 12})
+    with pytest.raises(FileNotFoundError):
+        registry.get(tmp_path / "missing.json")
+
+
+def test_inline_schemas_are_compiled_once_per_canonical_json(registry):
+    schema_a = {"type": "object", "required": ["name"]}
+    schema_b = {"required": ["name"], "type": "object"}
+
+    assert SchemaValidator.validate_against_schema_string({"name": "x"}, schema_a) is True
+    assert SchemaValidator.validate_against_schema_string({}, schema_b) is False
+
+    info = schema_validator._compile_inline.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
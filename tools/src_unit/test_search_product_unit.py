@@ -1,4 +1,4 @@
-from pages.search_product_page import SearchProductPage
+from src.pages.search_product_page import SearchProductPage
 from utils.config import Configuration
 
 
@@ -25,3 +25,41 @@ def test_search_results_parsing(monkeypatch, dummy_driver):
     assert page.results_visible() is True
     titles = page.get_results_titles()
     assert any("jacket" in t.lower() for t in titles)
+
+
+class ScriptDriver:
+    """Answers execute_script with queued results and records every call"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        return self.results.pop(0)
+
+
+def test_get_results_titles_reads_all_titles_in_one_round_trip():
+    titles = [f"Jacket {i}" for i in range(48)]
+    driver = ScriptDriver(titles)
+    page = SearchProductPage(driver)
+
+    assert page.get_results_titles() == titles
+    assert driver.calls == [("css", ".product-item-name a", "text", None)]
+
+
+def test_batch_reads_wait_until_elements_exist():
+    driver = ScriptDriver([], [{"x": 0, "y": 10, "width": 100, "height": 20}])
+    page = SearchProductPage(driver)
+    page.wait.poll = 0.001
+
+    assert page.get_rects("#search") == [{"x": 0, "y": 10, "width": 100, "height": 20}]
+    assert len(driver.calls) == 2
+
+
+def test_get_attributes_passes_attribute_name():
+    driver = ScriptDriver(["/a", "/b"])
+    page = SearchProductPage(driver)
+
+    assert page.get_attributes(("xpath", "//a"), "href") == ["/a", "/b"]
+    assert driver.calls == [("xpath", "//a", "attribute", "href")]
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from src.pages.smart_wait import SmartWait
+
+
+class FakePageDriver:
+    """Driver whose page_state() script answers from a list of snapshots (last one repeats)"""
+
+    def __init__(self, states=None):
+        self.states = list(states or [["complete", 0, 10, 100, 5000]])
+        self.scripts = 0
+
+    def execute_script(self, script):
+        self.scripts += 1
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def test_until_returns_value_once_condition_is_met():
+    attempts = iter([None, NoSuchElementException(), "element"])
+
+    def condition(driver):
+        value = next(attempts)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    wait = SmartWait(FakePageDriver(), timeout=1, poll=0.001)
+
+    assert wait.until(condition) == "element"
+
+
+def test_until_honours_per_call_timeout():
+    wait = SmartWait(FakePageDriver(), timeout=10, poll=0.01)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutException):
+        wait.until(lambda driver: False, timeout=0.05)
+
+    assert time.monotonic() - started < 1
+
+
+def test_until_not_returns_true_when_element_disappears():
+    wait = SmartWait(FakePageDriver(), timeout=1, poll=0.001)
+    visible = iter([True, True])
+
+    def condition(driver):
+        if next(visible, None) is None:
+            raise NoSuchElementException()
+        return True
+
+    assert wait.until_not(condition) is True
+
+
+def test_network_idle_waits_for_resources_to_stop_loading():
+    states = [["loading", 0, 1, 10, 100], ["complete", 2, 5, 50, 900], ["complete", 0, 8, 60, 1000]]
+    driver = FakePageDriver(states)
+    wait = SmartWait(driver, timeout=1, poll=0.005, settle=0.02)
+
+    assert wait.network_idle() is True
+    assert driver.states == [["complete", 0, 8, 60, 1000]]
+
+
+def test_dom_stable_times_out_while_dom_keeps_changing():
+    growing = [["complete", 0, 1, 10 + i, 100] for i in range(1000)]
+    wait = SmartWait(FakePageDriver(growing), timeout=0.1, poll=0.001, settle=0.05)
+
+    with pytest.raises(TimeoutException, match="DOM"):
+        wait.dom_stable()
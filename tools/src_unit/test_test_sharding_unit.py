@@ -0,0 +1,52 @@
+import xml.etree.ElementTree as ET
+
+from utils.test_sharding import load_durations, merge_junit, partition
+
+
+def test_partition_without_history_balances_by_count():
+    nodeids = [f"tests/t.py::test_{i}" for i in range(10)]
+
+    shards = partition(nodeids, 3)
+
+    assert sorted(len(shard) for shard in shards) == [3, 3, 4]
+    assert sorted(n for shard in shards for n in shard) == sorted(nodeids)
+
+
+def test_partition_uses_durations_to_balance_load():
+    durations = {"a": 10.0, "b": 6.0, "c": 4.0, "d": 3.0, "e": 3.0}
+
+    shards = partition(list(durations), 2, durations)
+
+    loads = sorted(sum(durations[n] for n in shard) for shard in shards)
+    assert loads == [13.0, 13.0]
+
+
+def test_partition_drops_empty_shards():
+    assert partition(["only"], 4) == [["only"]]
+
+
+def test_load_durations_ignores_missing_or_invalid_file(tmp_path):
+    assert load_durations(None) == {}
+    assert load_durations(tmp_path / "missing.json") == {}
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+    assert load_durations(broken) == {}
+
+
+def test_merge_junit_sums_worker_reports(tmp_path):
+    for index, (tests, failures) in enumerate([(3, 0), (2, 1)]):
+        (tmp_path / f"shard-{index}.xml").write_text(
+            f'<testsuites><testsuite name="pytest" tests="{tests}" failures="{failures}" '
+            f'errors="0" skipped="0" time="1.5"><testcase name="t"/></testsuite></testsuites>'
+        )
+    output = tmp_path / "merged.xml"
+
+    totals = merge_junit(
+        [tmp_path / "shard-0.xml", tmp_path / "shard-1.xml", tmp_path / "shard-9.xml"], output
+    )
+
+    assert totals == {"tests": 5, "failures": 1, "errors": 0, "skipped": 0}
+    root = ET.parse(output).getroot()
+    assert root.tag == "testsuites"
+    assert len(root.findall("testsuite")) == 2
+    assert root.get("time") == "3.000"
@@ -0,0 +1,65 @@
+import json
+from types import SimpleNamespace
+
+from utils.test_timing import (
+    TimingRecorder, TimingStore, lpt_schedule, module_of, predicted_makespan, shard_store_path
+)
+
+
+def test_store_round_trip_and_moving_average(tmp_path):
+    path = tmp_path / "durations.json"
+    store = TimingStore(path)
+    store.update({"t.py::a": 4.0})
+    store.save()
+
+    reloaded = TimingStore(path)
+    reloaded.update({"t.py::a": 2.0, "t.py::b": 1.0})
+
+    assert reloaded.durations() == {"t.py::a": 3.0, "t.py::b": 1.0}
+    assert json.loads(path.read_text())["tests"]["t.py::a"]["runs"] == 1
+
+
+def test_store_accepts_flat_mapping_and_ignores_broken_file(tmp_path):
+    flat = tmp_path / "flat.json"
+    flat.write_text('{"t.py::a": 2.5, "t.py::b": "bad"}')
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+
+    assert TimingStore(flat).durations() == {"t.py::a": 2.5}
+    assert len(TimingStore(broken)) == 0
+
+
+def test_lpt_schedule_minimizes_the_slowest_worker():
+    durations = {"a": 7.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 3.0, "f": 2.0}
+
+    bins = lpt_schedule(list(durations), 3, durations)
+
+    assert predicted_makespan(bins, durations) == 9.0  # optimum: {a, f} {b, d} {c, e}
+    assert sorted(n for members in bins for n in members) == sorted(durations)
+
+
+def test_lpt_schedule_keeps_modules_together_in_collection_order():
+    nodeids = ["m1.py::t1", "m2.py::t1", "m1.py::t2", "m3.py::t1"]
+    durations = {"m1.py::t1": 1.0, "m1.py::t2": 5.0, "m2.py::t1": 4.0, "m3.py::t1": 1.0}
+
+    bins = lpt_schedule(nodeids, 2, durations, group_by=module_of)
+
+    assert ["m1.py::t1", "m1.py::t2"] in bins
+    assert ["m2.py::t1", "m3.py::t1"] in bins
+
+
+def test_recorder_sums_phases_and_skips_skipped_tests(tmp_path, monkeypatch):
+    monkeypatch.delenv("SHARD_ID", raising=False)
+    path = tmp_path / "durations.json"
+    recorder = TimingRecorder(path)
+    for phase, duration, skipped in [("setup", 0.5, False), ("call", 1.0, False), ("teardown", 0.25, False)]:
+        recorder.pytest_runtest_logreport(SimpleNamespace(nodeid="t.py::a", when=phase, duration=duration, skipped=skipped))
+    recorder.pytest_runtest_logreport(SimpleNamespace(nodeid="t.py::s", when="setup", duration=0.1, skipped=True))
+
+    recorder.pytest_sessionfinish(session=None)
+
+    assert TimingStore(path).durations() == {"t.py::a": 1.75}
+
+
+def test_shard_store_path_adds_suffix(tmp_path):
+    assert shard_store_path(tmp_path / "d.json", 3).name == "d.shard-3.json"
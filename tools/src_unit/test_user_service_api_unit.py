@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from src.api.api_result import APIResult
+from src.api.user_service_api import UserServiceAPI
+from utils.api_helpers.mock_api_server import MockAPIServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    # Random per-request delay so batch items finish out of order
+    with MockAPIServer(jitter=0.02) as running:
+        yield running
+
+
+@pytest.fixture
+def user_api(server):
+    with UserServiceAPI(base_url=server.base_url) as api:
+        yield api
+
+
+def test_batch_results_keep_input_order(user_api):
+    user_ids = [7, 1, 10, 3, 5, 2, 9, 4, 8, 6]
+
+    users = user_api.get_users_by_ids(user_ids, max_workers=10)
+    posts = user_api.get_posts_for_users(user_ids, max_workers=4)
+    albums = user_api.get_albums_for_users(user_ids, max_workers=4)
+    todos = user_api.get_todos_for_users(user_ids, completed=True, max_workers=4)
+
+    assert [r['data']['id'] for r in users] == user_ids
+    assert [{p['userId'] for p in r['data']} for r in posts] == [{user_id} for user_id in user_ids]
+    assert [{a['userId'] for a in r['data']} for r in albums] == [{user_id} for user_id in user_ids]
+    assert all(t['completed'] for r in todos for t in r['data'])
+    assert [{t['userId'] for t in r['data']} - {user_id} for user_id, r in zip(user_ids, todos)] == [set()] * 10
+
+
+def test_failed_item_is_reported_in_its_slot_without_aborting_the_batch(user_api, monkeypatch):
+    real_get = user_api.get_user_by_id
+    boom = ConnectionError("connection reset")
+
+    def get_user_by_id(user_id):
+        if user_id == 3:
+            raise boom
+        return real_get(user_id)
+
+    monkeypatch.setattr(user_api, "get_user_by_id", get_user_by_id)
+
+    results = user_api.get_users_by_ids([1, 3, 99999, 2])
+
+    assert [r['status_code'] for r in results] == [200, None, 404, 200]
+    assert isinstance(results[1], APIResult) and results[1]['error'] is boom
+    assert results[1]['data'] is None
+    assert 'error' not in results[0] and 'error' not in results[2]
+    assert results[3]['data']['id'] == 2
+
+
+def test_batch_concurrency_is_bounded_by_max_workers(user_api, monkeypatch):
+    active, peak = 0, 0
+    lock = threading.Lock()
+    real_get = user_api.get_user_by_id
+
+    def get_user_by_id(user_id):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            time.sleep(0.01)
+            return real_get(user_id)
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(user_api, "get_user_by_id", get_user_by_id)
+
+    results = user_api.get_users_by_ids(list(range(1, 11)) * 2, max_workers=3)
+
+    assert len(results) == 20 and all(r['status_code'] == 200 for r in results)
+    assert 1 < peak <= 3
+
+
+def test_empty_batch_makes_no_requests(user_api, monkeypatch):
+    monkeypatch.setattr(user_api, "get_user_by_id", lambda user_id: pytest.fail("unexpected call"))
+
+    assert user_api.get_users_by_ids([]) == []
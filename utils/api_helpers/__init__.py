@@ -5,9 +5,32 @@ This module provides utility classes for API testing, including:
 - Schema validation for JSON responses
 - API response helpers
 - Common API testing utilities
+- Local mock API server for offline runs
 
 Usage:
     from utils.api_helpers.schema_validator import SchemaValidator
+    from utils.api_helpers.mock_api_server import MockAPIServer
 """
 
-__all__ = ['SchemaValidator']
+__all__ = ['SchemaValidator', 'SchemaRegistry', 'MockAPIServer']
+
+import importlib
+
+# English: Exports are imported on first access (PEP 562): jsonschema is only loaded when a
+# schema is validated and the mock server only when it is used
+# Spanish: Las exportaciones se importan en el primer acceso (PEP 562): jsonschema solo se carga
+# al validar un esquema y el servidor mock solo cuando se usa
+_EXPORTS = {
+    'SchemaValidator': 'schema_validator',
+    'SchemaRegistry': 'schema_validator',
+    'MockAPIServer': 'mock_api_server',
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
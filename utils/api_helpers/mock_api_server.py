@@ -0,0 +1,630 @@
+"""
+Mock API Server - in-process, multi-threaded HTTP server for offline API testing
+
+This module provides a local stand-in for the user, product and order/payment services
+described in features/api/*.feature, so the API suites can run and be benchmarked
+without network access and at high request rates.
+
+Educational Notes:
+- Built only on the standard library (http.server.ThreadingHTTPServer)
+- One thread per connection, HTTP/1.1 keep-alive, so pooled sessions are reused
+- Deterministic seed data; every server instance has its own in-memory store
+- Latency knobs (fixed + random jitter, optionally per route) to emulate real services
+
+Resources:
+    /users, /users/{id}, /users/{id}/posts|albums|todos     (JSONPlaceholder compatible)
+    /products, /products/{id}                              (filters, sorting, pagination)
+    /orders, /orders/{id}, /orders/{id}/payments
+    /payments, /payments/{id}, /payments/{id}/capture, /payments/{id}/refunds
+
+Usage:
+    from utils.api_helpers.mock_api_server import MockAPIServer
+
+    with MockAPIServer(latency=0.01) as server:
+        user_api = UserServiceAPI(base_url=server.base_url)
+        user_api.get_user_by_id(1)
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from utils.logger import logger
+
+
+CATEGORIES = ('Electronics', 'Clothing', 'Books', 'Home')
+
+# Product fields accepted by '?sort=' # Campos de producto aceptados por '?sort='
+PRODUCT_SORT_FIELDS = ('id', 'name', 'price', 'category')
+
+# Card payments at or above this amount decline with 402 (emulates insufficient funds)
+# Los pagos con tarjeta desde este monto son rechazados con 402 (simula fondos insuficientes)
+INSUFFICIENT_FUNDS_LIMIT = 10000.0
+
+
+class HTTPError(Exception):
+    """Raised inside route handlers to answer with an error status and message"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _luhn_valid(card_number: str) -> bool:
+    """Check a card number with the Luhn algorithm"""
+    digits = [int(d) for d in card_number if d.isdigit()]
+    if len(digits) < 12 or len(digits) != len(card_number):
+        return False
+    checksum = 0
+    for index, digit in enumerate(reversed(digits)):
+        if index % 2 == 1:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        checksum += digit
+    return checksum % 10 == 0
+
+
+def _card_expired(expiry: str) -> bool:
+    """Expiry accepted as MM/YYYY or MM/YY"""
+    try:
+        month, year = expiry.split('/')
+        month, year = int(month), int(year)
+    except ValueError:
+        raise HTTPError(400, "invalid expiry date")
+    if year < 100:
+        year += 2000
+    today = datetime.now(timezone.utc)
+    return (year, month) < (today.year, today.month)
+
+
+class MockDataStore:
+    """
+    Thread-safe in-memory store with deterministic seed data
+
+    Attributes:
+        users, products, orders, payments (dict): Resources indexed by id
+    """
+
+    def __init__(self, users: int = 10, products: int = 60, seed: int = 42):
+        rnd = random.Random(seed)
+        self.lock = threading.RLock()
+        self.users: Dict[int, Dict] = {}
+        self.posts: Dict[int, List[Dict]] = {}
+        self.albums: Dict[int, List[Dict]] = {}
+        self.todos: Dict[int, List[Dict]] = {}
+        self.products: Dict[int, Dict] = {}
+        self.orders: Dict[str, Dict] = {}
+        self.payments: Dict[str, Dict] = {}
+        self.references: Dict[str, str] = {}
+
+        for user_id in range(1, users + 1):
+            self.users[user_id] = {
+                'id': user_id,
+                'name': f"User {user_id}",
+                'username': f"user{user_id}",
+                'email': f"user{user_id}@example.com",
+                'phone': f"555-01{user_id:02d}",
+                'website': f"user{user_id}.example.com",
+                'address': {'street': f"{user_id} Main St", 'city': 'Testville', 'zipcode': '00000'},
+                'company': {'name': f"Company {user_id}", 'catchPhrase': 'Quality first'}
+            }
+            self.posts[user_id] = [
+                {'userId': user_id, 'id': (user_id - 1) * 10 + n, 'title': f"Post {n}", 'body': 'Lorem ipsum'}
+                for n in range(1, 11)
+            ]
+            self.albums[user_id] = [
+                {'userId': user_id, 'id': (user_id - 1) * 10 + n, 'title': f"Album {n}"}
+                for n in range(1, 11)
+            ]
+            self.todos[user_id] = [
+                {'userId': user_id, 'id': (user_id - 1) * 20 + n, 'title': f"Todo {n}", 'completed': n % 2 == 0}
+                for n in range(1, 21)
+            ]
+
+        for product_id in range(1, products + 1):
+            category = CATEGORIES[(product_id - 1) % len(CATEGORIES)]
+            name = f"{'Phone' if category == 'Electronics' and product_id % 3 == 1 else category} Item {product_id}"
+            self.products[product_id] = {
+                'id': product_id,
+                'name': name,
+                'price': round(rnd.uniform(5, 200), 2),
+                'category': category,
+                'description': f"Seed product {product_id}"
+            }
+
+        for order_id in ('12345', 'ORD123'):
+            self.orders[order_id] = {'id': order_id, 'total': 99.99, 'currency': 'USD', 'status': 'pending'}
+
+        for payment_id, status in (('PAY123', 'completed'), ('PAY456', 'completed'), ('PAY999', 'completed'),
+                                   ('PAY111', 'pending'), ('PAY222', 'authorized')):
+            self.payments[payment_id] = self._new_payment(
+                payment_id, 'ORD123', 100.00, 'USD', 'credit_card', status
+            )
+
+    @staticmethod
+    def _new_payment(payment_id: str, order_id: Optional[str], amount: float, currency: str,
+                     method: str, status: str) -> Dict:
+        return {
+            'id': payment_id,
+            'order_id': order_id,
+            'amount': amount,
+            'currency': currency,
+            'payment_method': method,
+            'status': status,
+            'transaction_id': uuid.uuid4().hex,
+            'refunded_amount': 0.0,
+            'created_at': _now(),
+            'updated_at': _now()
+        }
+
+
+class MockAPIServer:
+    """
+    Local HTTP server that implements the user, product, order and payment resources
+
+    Attributes:
+        base_url (str): URL to pass to the API clients (e.g. 'http://127.0.0.1:54321')
+        latency (float): Fixed delay added to every response, in seconds
+        jitter (float): Random extra delay in [0, jitter] seconds
+        route_latency (dict): Per resource overrides, e.g. {'payments': 0.5}
+        require_auth (bool): Require an Authorization header on product writes
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, route_latency: Optional[Dict[str, float]] = None,
+                 require_auth: bool = True, store: Optional[MockDataStore] = None):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free one
+            latency (float): Fixed delay per request in seconds
+            jitter (float): Random extra delay per request in seconds
+            route_latency (dict): Fixed delay per top-level resource, overrides 'latency'
+            require_auth (bool): Answer 401 to product writes without Authorization
+            store (MockDataStore): Custom seed data
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.route_latency = route_latency or {}
+        self.require_auth = require_auth
+        self.store = store or MockDataStore()
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+
+        handler = type('BoundMockHandler', (_MockRequestHandler,), {'server_ref': self})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockAPIServer':
+        """Serve requests on a background thread # Sirve peticiones en un hilo de fondo"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05},
+            name='mock-api-server', daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Mock API server listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        """Stop serving and release the port # Detiene el servidor y libera el puerto"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        logger.info(f"Mock API server stopped after {self.request_count} requests")
+
+    def __enter__(self) -> 'MockAPIServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _delay(self, resource: str):
+        delay = self.route_latency.get(resource, self.latency)
+        if self.jitter:
+            delay += random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _count(self):
+        with self._count_lock:
+            self.request_count += 1
+
+    # ==================== ROUTING ====================
+
+    def dispatch(self, method: str, path: str, query: Dict[str, List[str]], body: Any,
+                 headers: Dict[str, str]) -> Tuple[int, Any]:
+        """
+        Route a request to its handler
+
+        Returns:
+            tuple: (status_code, json_body or None)
+        """
+        parts = [p for p in path.split('/') if p]
+        if not parts:
+            raise HTTPError(404, "resource not found")
+
+        resource = parts[0]
+        self._count()
+        self._delay(resource)
+
+        route = getattr(self, f"_route_{resource}", None)
+        if route is None:
+            raise HTTPError(404, "resource not found")
+        with self.store.lock:
+            return route(method, parts[1:], query, body, headers)
+
+    # ----- users -----
+
+    def _route_users(self, method, parts, query, body, headers):
+        users = self.store.users
+        if not parts:
+            if method == 'GET':
+                result = list(users.values())
+                for field in ('email', 'username', 'name'):
+                    if field in query:
+                        result = [u for u in result if u[field] == query[field][0]]
+                return 200, _limit(result, query)
+            if method == 'POST':
+                return 201, {**(body or {}), 'id': max(users, default=0) + 1}
+            raise HTTPError(405, "method not allowed")
+
+        # English: Like JSONPlaceholder, user writes are answered but not persisted, so tests
+        # sharing the session server (e.g. one that deletes user 1) do not affect each other
+        # Spanish: Como en JSONPlaceholder, las escrituras de usuarios se responden pero no se
+        # guardan, así los tests que comparten el servidor no se afectan entre sí
+        user_id = _int_id(parts[0])
+        if user_id not in users:
+            if method in ('PUT', 'PATCH', 'DELETE'):
+                # JSONPlaceholder answers writes on unknown users too
+                return 200, {} if method == 'DELETE' else {**(body or {}), 'id': user_id}
+            raise HTTPError(404, "user not found")
+
+        if len(parts) == 2:
+            if method != 'GET' or parts[1] not in ('posts', 'albums', 'todos'):
+                raise HTTPError(404, "resource not found")
+            items = getattr(self.store, parts[1])[user_id]
+            if parts[1] == 'todos' and 'completed' in query:
+                wanted = query['completed'][0] == 'true'
+                items = [t for t in items if t['completed'] == wanted]
+            return 200, _limit(items, query)
+
+        if method == 'GET':
+            return 200, users[user_id]
+        if method == 'PUT':
+            return 200, {**(body or {}), 'id': user_id}
+        if method == 'PATCH':
+            return 200, {**users[user_id], **(body or {}), 'id': user_id}
+        if method == 'DELETE':
+            return 200, {}
+        raise HTTPError(405, "method not allowed")
+
+    # ----- products -----
+
+    def _check_auth(self, headers):
+        if self.require_auth and not headers.get('authorization'):
+            raise HTTPError(401, "unauthorized")
+
+    @staticmethod
+    def _validate_product(data: Dict, partial: bool = False):
+        if not partial and not data.get('name'):
+            raise HTTPError(400, "name is required")
+        if 'price' in data or not partial:
+            try:
+                price = float(data.get('price'))
+            except (TypeError, ValueError):
+                raise HTTPError(400, "invalid price")
+            if price < 0:
+                raise HTTPError(400, "invalid price")
+            data['price'] = price
+
+    def _route_products(self, method, parts, query, body, headers):
+        products = self.store.products
+        if not parts:
+            if method == 'GET':
+                return 200, _list_products(list(products.values()), query)
+            if method == 'POST':
+                self._check_auth(headers)
+                data = dict(body or {})
+                self._validate_product(data)
+                new_id = max(products, default=0) + 1
+                products[new_id] = {**data, 'id': new_id}
+                return 201, products[new_id]
+            raise HTTPError(405, "method not allowed")
+
+        product_id = _int_id(parts[0])
+        if product_id not in products:
+            raise HTTPError(404, "product not found")
+
+        if method == 'GET':
+            return 200, products[product_id]
+        self._check_auth(headers)
+        if method == 'PUT':
+            data = {**products[product_id], **(body or {})}
+            self._validate_product(data)
+            products[product_id] = {**data, 'id': product_id}
+            return 200, products[product_id]
+        if method == 'PATCH':
+            data = dict(body or {})
+            self._validate_product(data, partial=True)
+            products[product_id].update(data)
+            return 200, products[product_id]
+        if method == 'DELETE':
+            del products[product_id]
+            return 204, None
+        raise HTTPError(405, "method not allowed")
+
+    # ----- orders -----
+
+    def _route_orders(self, method, parts, query, body, headers):
+        orders = self.store.orders
+        if not parts:
+            if method == 'GET':
+                return 200, _limit(list(orders.values()), query)
+            if method == 'POST':
+                order_id = str((body or {}).get('id') or uuid.uuid4().hex[:8].upper())
+                orders[order_id] = {'status': 'pending', 'currency': 'USD', **(body or {}), 'id': order_id}
+                return 201, orders[order_id]
+            raise HTTPError(405, "method not allowed")
+
+        order_id = parts[0]
+        if order_id not in orders:
+            raise HTTPError(404, "order not found")
+        if len(parts) == 2 and parts[1] == 'payments' and method == 'GET':
+            payments = [p for p in self.store.payments.values() if p['order_id'] == order_id]
+            payments.sort(key=lambda p: p['created_at'], reverse=True)
+            return 200, payments
+        if len(parts) == 1 and method == 'GET':
+            return 200, orders[order_id]
+        raise HTTPError(405, "method not allowed")
+
+    # ----- payments -----
+
+    def _route_payments(self, method, parts, query, body, headers):
+        payments = self.store.payments
+        if not parts:
+            if method == 'GET':
+                return 200, _limit(list(payments.values()), query)
+            if method == 'POST':
+                return self._create_payment(dict(body or {}))
+            raise HTTPError(405, "method not allowed")
+
+        payment_id = parts[0]
+        if payment_id not in payments:
+            raise HTTPError(404, "payment not found")
+        payment = payments[payment_id]
+
+        if len(parts) == 1:
+            if method == 'GET':
+                return 200, payment
+            if method == 'PATCH':
+                if 'status' not in (body or {}):
+                    raise HTTPError(400, "status is required")
+                payment['status'] = body['status']
+                payment['updated_at'] = _now()
+                return 200, payment
+            raise HTTPError(405, "method not allowed")
+
+        action = parts[1]
+        if method != 'POST':
+            raise HTTPError(405, "method not allowed")
+        if action == 'capture':
+            if payment['status'] != 'authorized':
+                raise HTTPError(409, "payment is not authorized")
+            payment['status'] = 'captured'
+            payment['updated_at'] = _now()
+            return 200, payment
+        if action == 'refunds':
+            return self._refund(payment, body or {})
+        raise HTTPError(404, "resource not found")
+
+    def _create_payment(self, data: Dict) -> Tuple[int, Dict]:
+        reference = data.get('reference')
+        if reference and reference in self.store.references:
+            raise HTTPError(409, "duplicate transaction")
+
+        method = data.get('payment_method', 'credit_card')
+        try:
+            amount = float(data.get('amount', 0))
+        except (TypeError, ValueError):
+            raise HTTPError(400, "invalid amount")
+        if amount <= 0:
+            raise HTTPError(400, "invalid amount")
+
+        status = 'pending' if method == 'paypal' else 'completed'
+        if method != 'paypal':
+            card_number = str(data.get('card_number') or '')
+            if not card_number:
+                raise HTTPError(400, "card_number is required")
+            if not _luhn_valid(card_number):
+                raise HTTPError(400, "invalid card number")
+            if data.get('expiry') and _card_expired(str(data['expiry'])):
+                raise HTTPError(400, "card expired")
+            if amount >= INSUFFICIENT_FUNDS_LIMIT:
+                raise HTTPError(402, "insufficient funds")
+            if data.get('capture') is False:
+                status = 'authorized'
+
+        payment_id = f"PAY{uuid.uuid4().hex[:10].upper()}"
+        payment = MockDataStore._new_payment(
+            payment_id, data.get('order_id'), amount, data.get('currency', 'USD'), method, status
+        )
+        if method == 'paypal':
+            payment['redirect_url'] = f"{self.base_url}/paypal/checkout/{payment_id}"
+        self.store.payments[payment_id] = payment
+        if reference:
+            self.store.references[reference] = payment_id
+
+        order = self.store.orders.get(str(data.get('order_id')))
+        if order is not None and status == 'completed':
+            order['status'] = 'paid'
+        return 200, payment
+
+    @staticmethod
+    def _refund(payment: Dict, data: Dict) -> Tuple[int, Dict]:
+        if payment['status'] not in ('completed', 'captured', 'partially_refunded'):
+            raise HTTPError(409, "payment cannot be refunded")
+        remaining = round(payment['amount'] - payment['refunded_amount'], 2)
+        try:
+            amount = float(data.get('amount', remaining))
+        except (TypeError, ValueError):
+            raise HTTPError(400, "invalid refund amount")
+        if amount <= 0 or amount > remaining:
+            raise HTTPError(400, "invalid refund amount")
+        payment['refunded_amount'] = round(payment['refunded_amount'] + amount, 2)
+        remaining = round(payment['amount'] - payment['refunded_amount'], 2)
+        payment['status'] = 'refunded' if remaining == 0 else 'partially_refunded'
+        payment['updated_at'] = _now()
+        return 200, {
+            'payment_id': payment['id'],
+            'refunded_amount': amount,
+            'remaining_amount': remaining,
+            'status': payment['status'],
+            'confirmation': uuid.uuid4().hex
+        }
+
+
+# ==================== QUERY HELPERS ====================
+
+def _int_id(raw: str) -> int:
+    try:
+        return int(raw)
+    except ValueError:
+        raise HTTPError(404, "resource not found")
+
+
+def _query_number(query: Dict[str, List[str]], name: str, cast=int, minimum=None, default=None):
+    """Parse a numeric query parameter, answering 400 when it is invalid"""
+    if name not in query:
+        return default
+    try:
+        value = cast(query[name][0])
+    except ValueError:
+        raise HTTPError(400, f"invalid {name}")
+    if value != value or (minimum is not None and value < minimum):
+        raise HTTPError(400, f"invalid {name}")
+    return value
+
+
+def _limit(items: List[Dict], query: Dict[str, List[str]]) -> List[Dict]:
+    """JSONPlaceholder style '_limit' query parameter"""
+    limit = _query_number(query, '_limit', minimum=0)
+    return items if limit is None else items[:limit]
+
+
+def _list_products(items: List[Dict], query: Dict[str, List[str]]) -> Dict:
+    """Filter, sort and paginate products; returns items plus pagination metadata"""
+    first = {key: values[0] for key, values in query.items()}
+
+    if 'category' in first:
+        items = [p for p in items if p['category'] == first['category']]
+    min_price = _query_number(query, 'min_price', float)
+    max_price = _query_number(query, 'max_price', float)
+    if min_price is not None:
+        items = [p for p in items if p['price'] >= min_price]
+    if max_price is not None:
+        items = [p for p in items if p['price'] <= max_price]
+    if 'name' in first:
+        needle = first['name'].lower()
+        items = [p for p in items if needle in p['name'].lower()]
+
+    sort_field = first.get('sort')
+    if sort_field is None and (min_price is not None or max_price is not None):
+        sort_field = 'price'
+    if sort_field is not None and sort_field not in PRODUCT_SORT_FIELDS:
+        raise HTTPError(400, f"invalid sort field, expected one of {', '.join(PRODUCT_SORT_FIELDS)}")
+    if first.get('order', 'asc') not in ('asc', 'desc'):
+        raise HTTPError(400, "invalid order, expected asc or desc")
+    if sort_field:
+        # Products created through the API may lack the field # Los productos creados pueden no tener el campo
+        items = sorted(items, key=lambda p: (p.get(sort_field) is None, p.get(sort_field) or 0),
+                       reverse=first.get('order') == 'desc')
+
+    total = len(items)
+    page = _query_number(query, 'page', minimum=1, default=1)
+    limit = _query_number(query, 'limit', minimum=1, default=total or 1)
+    start = (page - 1) * limit
+    return {
+        'products': items[start:start + limit],
+        'count': len(items[start:start + limit]),
+        'total': total,
+        'page': page,
+        'limit': limit,
+        'has_next': start + limit < total
+    }
+
+
+# ==================== HTTP HANDLER ====================
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    """Translate HTTP requests into MockAPIServer.dispatch calls"""
+
+    protocol_version = 'HTTP/1.1'
+    # English: Headers and body are separate writes; with Nagle on, every keep-alive request
+    # after the first waits ~40 ms for the client's delayed ACK
+    # Spanish: Cabeceras y cuerpo se escriben por separado; con Nagle activo cada petición
+    # keep-alive después de la primera espera ~40 ms al ACK retrasado del cliente
+    disable_nagle_algorithm = True
+    server_ref: MockAPIServer = None
+
+    def _handle(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            self._send(400, {'error': 'invalid JSON body'})
+            return
+        if body is not None and not isinstance(body, dict):
+            self._send(400, {'error': 'JSON body must be an object'})
+            return
+
+        headers = {k.lower(): v for k, v in self.headers.items()}
+        try:
+            status, payload = self.server_ref.dispatch(
+                self.command, parsed.path, parse_qs(parsed.query), body, headers
+            )
+        except HTTPError as e:
+            status, payload = e.status, {'error': e.message}
+        except Exception as e:
+            # English: Always answer; a dropped connection looks like a network error to the client
+            # Spanish: Siempre responde; una conexión cortada parece un error de red para el cliente
+            logger.exception(f"Mock API server error on {self.command} {self.path}")
+            status, payload = 500, {'error': f"internal server error: {type(e).__name__}"}
+        self._send(status, payload)
+
+    def _send(self, status: int, payload: Any):
+        data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        # English: Route access logs through the framework logger at DEBUG
+        # Spanish: Envía los logs de acceso al logger del framework en DEBUG
+        logger.debug("mock-api %s - %s", self.address_string(), format % args)
@@ -7,6 +7,8 @@ It supports BDD testing scenarios and follows the framework's architecture patte
 Educational Notes:
 - Uses jsonschema library for validation
 - Supports external schema files (JSON format)
+- Schema files are loaded, checked and compiled once per process (SchemaRegistry)
+  and reloaded only when the file changes on disk
 - Provides detailed error reporting
 - Integrates with the framework's logger
 
@@ -18,12 +20,232 @@ Usage:
 """
 
 import json
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from jsonschema import validate, ValidationError, Draft7Validator
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple, Union
+from jsonschema import ValidationError, Draft7Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from utils.logger import logger
 
 
+def _compile(schema: Dict[str, Any]):
+    """
+    Check a schema once and build a reusable validator for it
+
+    The validator class follows the schema's $schema keyword (Draft 7 by default),
+    the same choice jsonschema.validate() makes on every call.
+    """
+    validator_cls = validator_for(schema, default=Draft7Validator)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+@lru_cache(maxsize=128)
+def _compile_inline(schema_json: str):
+    """Compiled validator for an inline (dict) schema, keyed by its canonical JSON"""
+    return _compile(json.loads(schema_json))
+
+
+def _error_details(error: ValidationError, index: Optional[int] = None) -> Dict[str, Any]:
+    """Serializable description of one validation error"""
+    details = {
+        'message': error.message,
+        'path': ' -> '.join(str(p) for p in error.path),
+        'schema_path': ' -> '.join(str(p) for p in error.schema_path),
+        'validator': error.validator
+    }
+    if index is not None:
+        details['index'] = index
+    return details
+
+
+def _validate_chunk(schema: Dict[str, Any], start: int, items: List[Any],
+                    fail_fast: bool) -> List[Dict[str, Any]]:
+    """
+    Validate a chunk of items (runs in worker processes too, so it is module level)
+
+    Returns:
+        list: Error details with absolute item indices
+    """
+    compiled = _compile_inline(json.dumps(schema, sort_keys=True))
+    errors = []
+    for offset, item in enumerate(items):
+        error = best_match(compiled.iter_errors(item))
+        if error is not None:
+            errors.append(_error_details(error, start + offset))
+            if fail_fast:
+                break
+    return errors
+
+
+def iter_json_array(source: Union[Any, Iterable[Union[str, bytes]]],
+                    chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Stream the elements of a top-level JSON array without loading the whole document
+
+    Args:
+        source: File-like object with read() (e.g. open(...) or response.raw), or an
+                iterable of str/bytes chunks (e.g. response.iter_content(65536))
+        chunk_size (int): Characters/bytes read per step from file-like sources
+
+    Yields:
+        Each decoded array element, in order
+
+    Raises:
+        ValueError: If the document is not a JSON array or is truncated
+
+    Example:
+        response = user_api.get('/users', stream=True)
+        for user in iter_json_array(response.iter_content(65536)):
+            ...
+    """
+    if hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), b'')
+    else:
+        chunks = iter(source)
+
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    pending = b''
+
+    def _more() -> bool:
+        nonlocal buffer, pos, eof, pending
+        for chunk in chunks:
+            if not chunk:
+                break
+            if isinstance(chunk, bytes):
+                # English: keep incomplete UTF-8 sequences for the next chunk
+                # Spanish: conserva secuencias UTF-8 incompletas para el siguiente bloque
+                chunk = pending + chunk
+                try:
+                    text = chunk.decode('utf-8')
+                    pending = b''
+                except UnicodeDecodeError as e:
+                    text = chunk[:e.start].decode('utf-8')
+                    pending = chunk[e.start:]
+            else:
+                text = chunk
+            buffer = buffer[pos:] + text
+            pos = 0
+            return True
+        eof = True
+        return False
+
+    def _skip(chars: str) -> Optional[str]:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in chars:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not _more():
+                return None
+
+    if _skip(' \t\r\n') != '[':
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    expect_value = True
+    seen_values = False
+    while True:
+        char = _skip(' \t\r\n')
+        if char is None:
+            raise ValueError("Truncated JSON array")
+        if char == ']':
+            if expect_value and seen_values:
+                raise ValueError("Trailing ',' in JSON array")
+            return
+        if char == ',':
+            if expect_value:
+                raise ValueError("Unexpected ',' in JSON array")
+            pos += 1
+            expect_value = True
+            continue
+        if not expect_value:
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # English: a number cut at the chunk boundary may continue in the next chunk
+                # Spanish: un número cortado en el límite del bloque puede continuar en el siguiente
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if (is_number and not eof and (end == len(buffer) or buffer[end] not in ' \t\r\n,]')
+                        and _more()):
+                    continue
+                break
+            except json.JSONDecodeError:
+                if eof or not _more():
+                    raise ValueError("Truncated or invalid JSON array element")
+        pos = end
+        expect_value = False
+        seen_values = True
+        yield value
+
+
+class SchemaRegistry:
+    """
+    Process-wide cache of loaded and compiled schema files
+
+    Each schema file is read, checked and compiled once. The file's modification
+    time is checked on every lookup (a single stat call), so editing a schema during
+    a session transparently reloads it.
+
+    Example:
+        schema, validator = SchemaRegistry.get(Path('schemas/user_schema.json'))
+    """
+
+    _entries: Dict[Path, Tuple[int, Dict[str, Any], Any]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, schema_path: Path) -> Tuple[Dict[str, Any], Any]:
+        """
+        Get the schema and its compiled validator, loading them if needed
+
+        Args:
+            schema_path (Path): Full path to the schema file
+
+        Returns:
+            tuple: (schema dict, compiled validator)
+
+        Raises:
+            FileNotFoundError: If schema file doesn't exist
+            json.JSONDecodeError: If schema file is invalid JSON
+        """
+        key = schema_path.resolve()
+        mtime = key.stat().st_mtime_ns
+
+        entry = cls._entries.get(key)
+        if entry is not None and entry[0] == mtime:
+            return entry[1], entry[2]
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and entry[0] == mtime:
+                return entry[1], entry[2]
+
+            with open(key, 'r', encoding='utf-8') as schema_file:
+                schema = json.load(schema_file)
+            compiled = _compile(schema)
+            cls._entries[key] = (mtime, schema, compiled)
+            logger.debug(f"Schema compiled and cached: {key}")
+            return schema, compiled
+
+    @classmethod
+    def clear(cls):
+        """Forget every cached schema # Olvida todos los esquemas en caché"""
+        with cls._lock:
+            cls._entries.clear()
+        _compile_inline.cache_clear()
+
+
 class SchemaValidator:
     """
     JSON Schema Validator for API Response Validation
@@ -95,15 +317,25 @@ class SchemaValidator:
             raise FileNotFoundError(error_msg)
         
         try:
-            with open(self.schema_path, 'r', encoding='utf-8') as schema_file:
-                schema = json.load(schema_file)
-                logger.debug(f"Successfully loaded schema from: {self.schema_path}")
-                return schema
+            schema, _ = SchemaRegistry.get(self.schema_path)
+            logger.debug(f"Successfully loaded schema from: {self.schema_path}")
+            return schema
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON in schema file {self.schema_path}: {str(e)}"
             logger.error(error_msg)
             raise json.JSONDecodeError(error_msg, e.doc, e.pos)
     
+    @property
+    def validator(self):
+        """
+        Compiled validator for this schema (reloaded if the file changed on disk)
+        
+        Returns:
+            jsonschema validator instance
+        """
+        self.schema, compiled = SchemaRegistry.get(self.schema_path)
+        return compiled
+    
     def _list_available_schemas(self) -> List[str]:
         """
         List all available schema files in the schemas directory
@@ -143,8 +375,10 @@ class SchemaValidator:
             validator.validate(response_data, raise_error=True)
         """
         try:
-            # Validate using jsonschema
-            validate(instance=data, schema=self.schema)
+            # Validate using the cached, pre-checked validator (same error as jsonschema.validate)
+            error = best_match(self.validator.iter_errors(data))
+            if error is not None:
+                raise error
             logger.info(f"Schema validation PASSED for: {self.schema_name}")
             return True
             
@@ -184,8 +418,7 @@ class SchemaValidator:
             if not result['is_valid']:
                 print(f"Errors: {result['errors']}")
         """
-        validator_obj = Draft7Validator(self.schema)
-        errors = list(validator_obj.iter_errors(data))
+        errors = list(self.validator.iter_errors(data))
         
         result = {
             'is_valid': len(errors) == 0,
@@ -208,6 +441,120 @@ class SchemaValidator:
         
         return result
     
+    def validate_many(self, items: Iterable[Any], fail_fast: bool = False,
+                      processes: Optional[int] = None, chunk_size: int = 1000) -> Dict[str, Any]:
+        """
+        Validate every item of an iterable against the loaded (item) schema
+        
+        Works with lists, generators and streamed arrays (see iter_json_array), so
+        tens of thousands of records never need to be validated as one big array.
+        
+        Args:
+            items (iterable): Items to validate (e.g. get_all_users()['data'])
+            fail_fast (bool): Stop at the first invalid item (True) or collect every error (False)
+            processes (int): Validate chunks in a process pool of this size. None/1 = in process
+            chunk_size (int): Items per chunk handed to a worker process
+        
+        Returns:
+            dict: Validation results with per-item error indices
+                {
+                    'is_valid': bool,
+                    'checked': int (items validated; lower than the total when fail_fast stopped early),
+                    'invalid_count': int,
+                    'errors': list of error dicts, each with an 'index' key,
+                    'schema_name': str
+                }
+        
+        Example:
+            validator = SchemaValidator('user_schema.json')
+            result = validator.validate_many(user_api.get_all_users()['data'])
+            assert result['is_valid'], result['errors'][:5]
+        """
+        if processes and processes > 1:
+            checked, errors = self._validate_many_parallel(items, fail_fast, processes, chunk_size)
+        else:
+            compiled = self.validator
+            checked, errors = 0, []
+            for index, item in enumerate(items):
+                checked += 1
+                error = best_match(compiled.iter_errors(item))
+                if error is not None:
+                    errors.append(_error_details(error, index))
+                    if fail_fast:
+                        break
+        
+        result = {
+            'is_valid': not errors,
+            'checked': checked,
+            'invalid_count': len(errors),
+            'errors': errors,
+            'schema_name': self.schema_name
+        }
+        
+        if errors:
+            logger.warning(
+                f"Bulk schema validation found {len(errors)} invalid item(s) out of {checked} "
+                f"for: {self.schema_name} (first at index {errors[0]['index']})"
+            )
+        else:
+            logger.info(f"Bulk schema validation PASSED for {checked} item(s): {self.schema_name}")
+        
+        return result
+    
+    def _validate_many_parallel(self, items: Iterable[Any], fail_fast: bool, processes: int,
+                                chunk_size: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Validate chunks of items across a process pool
+        
+        Chunks are submitted as the iterable is consumed, with at most 2 * processes
+        chunks in flight, so streamed input is never fully materialized.
+        
+        With fail_fast, chunks finish in any order: after an error, chunks that start
+        before it are still awaited (one of them may hold an earlier error) and the
+        later ones are cancelled, so the result matches the in-process path.
+        """
+        schema = self.schema
+        iterator = iter(items)
+        errors: List[Dict[str, Any]] = []
+        checked = 0
+        start = 0
+        first_error: Optional[int] = None
+        in_flight = {}
+        
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            while True:
+                while first_error is None and len(in_flight) < processes * 2:
+                    chunk = list(islice(iterator, chunk_size))
+                    if not chunk:
+                        break
+                    future = executor.submit(_validate_chunk, schema, start, chunk, fail_fast)
+                    in_flight[future] = (start, len(chunk))
+                    start += len(chunk)
+                if not in_flight:
+                    break
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _, count = in_flight.pop(future)
+                    chunk_errors = future.result()
+                    errors.extend(chunk_errors)
+                    checked += count
+                    if fail_fast and chunk_errors:
+                        index = chunk_errors[0]['index']
+                        first_error = index if first_error is None else min(first_error, index)
+                
+                if first_error is not None:
+                    for future, (chunk_start, _) in list(in_flight.items()):
+                        if chunk_start > first_error:
+                            future.cancel()
+                            del in_flight[future]
+        
+        errors.sort(key=lambda e: e['index'])
+        if fail_fast and errors:
+            errors = errors[:1]
+            checked = first_error + 1
+        return checked, errors
+    
     def get_schema(self) -> Dict[str, Any]:
         """
         Get the loaded schema
@@ -245,7 +592,10 @@ class SchemaValidator:
             )
         """
         try:
-            validate(instance=data, schema=schema)
+            compiled = _compile_inline(json.dumps(schema, sort_keys=True))
+            error = best_match(compiled.iter_errors(data))
+            if error is not None:
+                raise error
             logger.info("Schema validation PASSED (inline schema)")
             return True
         except ValidationError as e:
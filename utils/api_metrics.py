@@ -0,0 +1,241 @@
+# English: pytest plugin - API latency summary (p50/p95/p99 per endpoint) and JSON artifact
+# Spanish: Plugin de pytest - resumen de latencia de la API (p50/p95/p99 por endpoint) y artefacto JSON
+
+"""
+English:
+BaseAPIClient records dns/connect/ttfb/total for every request into the shared
+RequestMetrics (src/api/request_metrics.py). At the end of the session this plugin prints
+the slowest endpoints in the terminal summary and saves the histograms to
+reports/api_metrics.json, so runs can be compared to spot slow endpoints and regressions.
+Shard workers write 'api_metrics.shard-N.json' and utils.test_sharding merges them.
+
+It also enforces the 'latency_sla' marker: the API requests a marked test makes are
+checked against the threshold after the test body runs, and the test fails when the
+per-call limit or the percentile limit is exceeded (or when no request was made).
+
+Spanish:
+BaseAPIClient registra dns/connect/ttfb/total de cada petición en el RequestMetrics
+compartido. Al final de la sesión este plugin muestra los endpoints más lentos en el resumen
+de la terminal y guarda los histogramas en reports/api_metrics.json.
+También aplica el marcador 'latency_sla': las peticiones API de un test marcado se comparan
+con el umbral al terminar el test, y el test falla si se supera el límite por llamada o el
+del percentil (o si no hizo ninguna petición).
+
+Usage:
+    pytest tests/api_test                                   # summary + reports/api_metrics.json
+    pytest tests/api_test --api-metrics-file=reports/staging.json --api-metrics-top=30
+    pytest tests/api_test --no-api-metrics
+
+    @pytest.mark.latency_sla(2)                                  # every call <= 2 s
+    @pytest.mark.latency_sla(0.5, percentile=95, warmup=1)       # p95 <= 500 ms, first call ignored
+    @pytest.mark.latency_sla(0.3, endpoint="GET /users/{id}", phase="ttfb")
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from src.api.request_metrics import RequestMetrics, capture_samples, default_metrics
+from utils.test_timing import PROJECT_ROOT, shard_store_path
+
+DEFAULT_METRICS_FILE = PROJECT_ROOT / "reports" / "api_metrics.json"
+
+
+def metrics_path(config) -> Path:
+    """
+    English: --api-metrics-file or reports/api_metrics.json, with a '.shard-N' / worker suffix in workers.
+    Spanish: --api-metrics-file o reports/api_metrics.json, con sufijo '.shard-N' / worker en los workers.
+    """
+    path = Path(config.getoption("--api-metrics-file", None) or DEFAULT_METRICS_FILE)
+    worker = os.getenv("SHARD_ID") or getattr(config, "workerinput", {}).get("workerid")
+    if worker is not None:
+        path = shard_store_path(path, worker)
+    return path
+
+
+class APIMetricsReporter:
+    """Saves the session's request metrics and prints them in the terminal summary"""
+
+    def __init__(self, path: Path, top: int, metrics: RequestMetrics = None):
+        self.path = path
+        self.top = top
+        self.metrics = metrics if metrics is not None else default_metrics()
+        self.saved = None
+
+    def pytest_sessionstart(self, session):
+        self.metrics.reset()
+
+    def pytest_sessionfinish(self, session):
+        if len(self.metrics):
+            self.saved = self.metrics.save(self.path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not len(self.metrics):
+            return
+        terminalreporter.write_sep("=", f"API latency by endpoint (ms, top {self.top})")
+        for line in self.metrics.format_table(self.top).splitlines():
+            terminalreporter.write_line(line)
+        if self.saved is not None:
+            terminalreporter.write_line(f"API metrics saved to {self.saved}")
+
+
+# ==================== LATENCY SLA ASSERTIONS ====================
+# Aserciones de latencia: umbral por llamada, percentil sobre N repeticiones y exclusión de calentamiento
+# Latency assertions: per-call threshold, percentile over N repetitions and warm-up exclusion
+
+PHASES = ('dns', 'connect', 'ttfb', 'total')
+
+
+def elapsed_of(sample, phase='total'):
+    """
+    Duración en segundos de una llamada / Duration in seconds of one call
+
+    Acepta un APIResult, un requests.Response, un RequestTiming, un LatencySample o un número.
+    Accepts an APIResult, a requests.Response, a RequestTiming, a LatencySample or a number.
+    """
+    if isinstance(sample, (int, float)):
+        return float(sample)
+    timing = getattr(sample, 'timing', None)
+    if timing is None and all(hasattr(sample, name) for name in PHASES):
+        timing = sample
+    if timing is not None and getattr(timing, phase, None) is not None:
+        return getattr(timing, phase)
+    if phase == 'total':
+        elapsed = getattr(sample, 'elapsed', None)
+        if isinstance(elapsed, (int, float)):
+            return float(elapsed)
+        if elapsed is not None:
+            return elapsed.total_seconds()
+    raise ValueError(f"No se pudo obtener el tiempo '{phase}' de {sample!r}")
+
+
+def latency_percentile(samples, percentile, phase='total', warmup=0):
+    """Percentil (nearest-rank) de las duraciones en segundos, sin las 'warmup' primeras muestras"""
+    durations = sorted(elapsed_of(sample, phase) for sample in list(samples)[warmup:])
+    if not durations:
+        raise ValueError("No hay muestras de latencia para evaluar (¿todas excluidas por warmup?)")
+    rank = max(1, math.ceil(percentile / 100 * len(durations)))
+    return durations[rank - 1]
+
+
+def assert_response_time(sample, max_seconds, phase='total', message=None):
+    """
+    Umbral por llamada / Per-call threshold
+
+    Ejemplo:
+        assert_response_time(user_api.get_user_by_id(1), 2)
+    """
+    elapsed = elapsed_of(sample, phase)
+    assert elapsed <= max_seconds, message or (
+        f"Tiempo de respuesta ({phase}) {elapsed * 1000:.1f} ms supera el límite de {max_seconds * 1000:.0f} ms"
+    )
+
+
+def assert_latency_percentile(samples, percentile, max_seconds, phase='total', warmup=0, message=None):
+    """
+    Umbral sobre un percentil de N llamadas / Threshold over a percentile of N calls
+
+    Las 'warmup' primeras muestras (conexión en frío, cachés vacías) no cuentan.
+    The first 'warmup' samples (cold connection, empty caches) are not counted.
+
+    Ejemplo:
+        results = measure_latency(lambda: user_api.get_user_by_id(1), repetitions=20, warmup=2)
+        assert_latency_percentile(results, 95, 0.5)
+    """
+    samples = list(samples)
+    value = latency_percentile(samples, percentile, phase, warmup)
+    measured = len(samples) - warmup
+    assert value <= max_seconds, message or (
+        f"p{percentile:g} de {measured} llamadas ({phase}) = {value * 1000:.1f} ms "
+        f"supera el límite de {max_seconds * 1000:.0f} ms "
+        f"(máx {latency_percentile(samples, 100, phase, warmup) * 1000:.1f} ms)"
+    )
+
+
+def measure_latency(call, repetitions=10, warmup=0):
+    """
+    Ejecuta 'call()' warmup + repetitions veces y devuelve solo los resultados medidos
+    Runs 'call()' warmup + repetitions times and returns only the measured results
+
+    Cada resultado (p. ej. APIResult de UserServiceAPI) trae su propio tiempo en .timing / .elapsed.
+    """
+    for _ in range(warmup):
+        call()
+    return [call() for _ in range(repetitions)]
+
+
+def check_latency_sla(samples, max_seconds, percentile=None, phase="total", endpoint=None, warmup=0):
+    """
+    English: Assert the 'latency_sla' marker arguments against the samples captured during a test.
+    'endpoint' is a pattern on "METHOD /template" or "/template" (fnmatch, e.g. "GET /users/*").
+    Spanish: Evalúa los argumentos del marcador 'latency_sla' sobre las muestras capturadas en un test.
+    """
+    # English: dns/connect only exist for requests that opened a new connection
+    # Spanish: dns/connect solo existen en peticiones que abrieron una conexión nueva
+    samples = [s for s in samples if getattr(s.timing, phase) is not None]
+    if endpoint:
+        samples = [s for s in samples
+                   if fnmatch.fnmatch(f"{s.method} {s.endpoint}", endpoint) or fnmatch.fnmatch(s.endpoint, endpoint)]
+    assert len(samples) > warmup, (
+        f"latency_sla: no API requests to check ({len(samples)} recorded"
+        f"{f' for {endpoint}' if endpoint else ''}, warmup={warmup})"
+    )
+    if percentile is not None:
+        assert_latency_percentile(samples, percentile, max_seconds, phase=phase, warmup=warmup)
+        return
+    for sample in samples[warmup:]:
+        assert_response_time(sample, max_seconds, phase=phase, message=(
+            f"latency_sla: {sample.method} {sample.endpoint} took {elapsed_of(sample, phase) * 1000:.1f} ms "
+            f"({phase}), limit {max_seconds * 1000:.0f} ms"
+        ))
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("latency_sla")
+    if marker is None:
+        return (yield)
+    with capture_samples() as samples:
+        result = yield
+    check_latency_sla(samples, *marker.args, **marker.kwargs)
+    return result
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api-metrics")
+    group.addoption(
+        "--api-metrics-file",
+        action="store",
+        default=None,
+        help="Archivo JSON con los histogramas de latencia de la API (por defecto: reports/api_metrics.json)"
+    )
+    group.addoption(
+        "--api-metrics-top",
+        action="store",
+        type=int,
+        default=15,
+        help="Endpoints mostrados en el resumen de latencia de la API (por defecto: 15)"
+    )
+    group.addoption(
+        "--no-api-metrics",
+        action="store_true",
+        default=False,
+        help="No mostrar ni guardar las métricas de latencia de la API"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "latency_sla(max_seconds, percentile=None, phase='total', endpoint=None, warmup=0): "
+        "falla el test si sus peticiones API superan el límite de latencia"
+    )
+    if config.getoption("--no-api-metrics") or config.getoption("--collect-only"):
+        return
+    reporter = APIMetricsReporter(metrics_path(config), config.getoption("--api-metrics-top"))
+    config.pluginmanager.register(reporter, "api-metrics-reporter")
@@ -5,7 +5,6 @@ class AssertionError(Exception):
 
 def assert_element_displayed(element, message="Elemento no visible"):
     assert element.is_displayed(), message
-from selenium.common.exceptions import NoSuchElementException
 
 def assert_text_equals(actual, expected, message=None):
     assert actual == expected, message or f"Texto esperado: '{expected}', pero fue: '{actual}'"
@@ -38,3 +37,4 @@ def assert_element_exists(driver, locator, message=None):
         driver.find_element(*locator)
     except NoSuchElementException:
         raise AssertionError(message or f"Elemento esperado no existe: {locator}")
+
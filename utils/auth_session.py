@@ -0,0 +1,195 @@
+# English: AuthSession - log in once per worker and inject the session into new browsers
+# Spanish: AuthSession - iniciar sesión una vez por worker e inyectar la sesión en navegadores nuevos
+
+"""
+English:
+Tests that only need an authenticated user (account page, cart, checkout...) should not
+pay for a full UI login every time. AuthSession captures the cookies and local/session
+storage of a logged-in browser (or of an HTTP login against the Magento form) and injects
+them into a fresh WebDriver session, which then starts already authenticated.
+
+The root conftest exposes it as fixtures:
+- auth_session: captured once per pytest process (worker) and refreshed when it expires
+- authenticated_driver: a driver with the session injected, already on ACCOUNT_URL
+
+Spanish:
+Los tests que solo necesitan un usuario autenticado no deberían pagar un login completo
+por la UI cada vez. AuthSession captura las cookies y el local/session storage de un
+navegador con sesión iniciada (o de un login HTTP contra el formulario de Magento) y las
+inyecta en una sesión WebDriver nueva, que arranca ya autenticada.
+
+Environment variables (opcionales):
+- AUTH_LOGIN: http|ui, how the session is captured (default: http, falls back to ui)
+"""
+
+import re
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from selenium.common.exceptions import TimeoutException
+
+from utils.config import Configuration
+from utils.logger import logger
+
+# English: Magento puts a CSRF token in every form; the login POST is rejected without it
+# Spanish: Magento incluye un token CSRF en cada formulario; el POST de login se rechaza sin él
+_FORM_KEY = re.compile(r'name="form_key"[^>]*value="([^"]+)"|value="([^"]+)"[^>]*name="form_key"')
+
+_STORAGE_JS = """
+var dump = function (storage) {
+    var data = {};
+    for (var i = 0; i < storage.length; i++) { var k = storage.key(i); data[k] = storage.getItem(k); }
+    return data;
+};
+return [dump(window.localStorage), dump(window.sessionStorage)];
+"""
+
+_RESTORE_STORAGE_JS = """
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+"""
+
+
+class AuthSession:
+    """
+    English:
+    Snapshot of an authenticated browser session for one origin.
+
+    Spanish:
+    Captura de una sesión de navegador autenticada para un origen.
+
+    Example:
+        session = AuthSession.login_via_http(username, password)
+        session.inject(driver, Configuration.ACCOUNT_URL)
+    """
+
+    def __init__(self, origin: str, cookies: List[Dict], local_storage: Optional[Dict] = None,
+                 session_storage: Optional[Dict] = None):
+        self.origin = origin
+        self.cookies = cookies
+        self.local_storage = local_storage or {}
+        self.session_storage = session_storage or {}
+        self.captured_at = time.time()
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Earliest expiry among persistent cookies (None when all are session cookies)"""
+        expiries = [cookie["expiry"] for cookie in self.cookies if cookie.get("expiry")]
+        return min(expiries) if expiries else None
+
+    def is_expired(self, margin: float = 60.0) -> bool:
+        expires_at = self.expires_at
+        return expires_at is not None and expires_at - margin <= time.time()
+
+    # --------------------------
+    # Capture / Captura
+    # --------------------------
+    @classmethod
+    def capture(cls, driver) -> "AuthSession":
+        """Snapshot cookies and storage of the current page's origin"""
+        parsed = urlparse(driver.current_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}/"
+        local_storage, session_storage = driver.execute_script(_STORAGE_JS)
+        return cls(origin, driver.get_cookies(), local_storage, session_storage)
+
+    @classmethod
+    def login_via_ui(cls, driver, username: str, password: str) -> "AuthSession":
+        """
+        English: Log in through LoginPage and capture the resulting session.
+        Spanish: Inicia sesión con LoginPage y captura la sesión resultante.
+
+        Raises:
+            RuntimeError: If the login does not reach the account page
+        """
+        from src.pages.login import LoginPage
+
+        page = LoginPage(driver)
+        page.open_login()
+        page.login(username, password)
+        try:
+            page.wait.until(lambda d: page.is_redirected_to_account())
+        except TimeoutException:
+            raise RuntimeError("UI login failed: not redirected to the account page")
+        return cls.capture(driver)
+
+    @classmethod
+    def login_via_http(cls, username: str, password: str, timeout: float = 30) -> "AuthSession":
+        """
+        English: Post the Magento login form with requests (no browser) and capture its cookies.
+        Spanish: Envía el formulario de login de Magento con requests (sin navegador) y captura sus cookies.
+
+        Raises:
+            RuntimeError: If the form key is missing or the login does not reach the account page
+        """
+        import requests
+
+        http = requests.Session()
+        login_page = http.get(Configuration.LOGIN_URL, timeout=timeout)
+        login_page.raise_for_status()
+        match = _FORM_KEY.search(login_page.text)
+        if not match:
+            raise RuntimeError("HTTP login failed: form_key not found on the login page")
+
+        response = http.post(
+            urljoin(Configuration.LOGIN_URL.rstrip("/") + "/", "../loginPost/"),
+            data={"form_key": match.group(1) or match.group(2),
+                  "login[username]": username, "login[password]": password},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        if Configuration.ACCOUNT_URL.rstrip("/") not in response.url.rstrip("/"):
+            raise RuntimeError("HTTP login failed: not redirected to the account page")
+
+        parsed = urlparse(Configuration.BASE_URL)
+        cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+                **({"expiry": int(cookie.expires)} if cookie.expires else {}),
+            }
+            for cookie in http.cookies
+        ]
+        return cls(f"{parsed.scheme}://{parsed.netloc}/", cookies)
+
+    @classmethod
+    def login(cls, driver_factory, username: str, password: str, mode: str = "http") -> "AuthSession":
+        """
+        English: Capture a session with the given mode; an HTTP failure falls back to the UI login.
+        Spanish: Captura una sesión con el modo indicado; si falla por HTTP se usa el login por UI.
+        """
+        if mode == "http":
+            try:
+                return cls.login_via_http(username, password)
+            except Exception as e:
+                logger.warning(f"HTTP login failed ({e}); falling back to UI login")
+        driver = driver_factory()
+        try:
+            return cls.login_via_ui(driver, username, password)
+        finally:
+            driver.quit()
+
+    # --------------------------
+    # Inject / Inyección
+    # --------------------------
+    def inject(self, driver, url: Optional[str] = None) -> None:
+        """
+        English: Load the session into 'driver' and navigate to 'url' (default: the origin).
+        Cookies can only be set for the current domain, so the origin is opened first.
+        Spanish: Carga la sesión en 'driver' y navega a 'url' (por defecto: el origen).
+        Las cookies solo se pueden asignar al dominio actual, por eso primero se abre el origen.
+        """
+        driver.get(self.origin)
+        for cookie in self.cookies:
+            # English: let the browser scope the cookie to the current host
+            # Spanish: el navegador asocia la cookie al host actual
+            driver.add_cookie({k: v for k, v in cookie.items() if k not in ("domain", "sameSite")})
+        if self.local_storage or self.session_storage:
+            driver.execute_script(_RESTORE_STORAGE_JS, self.local_storage, self.session_storage)
+        driver.get(url or self.origin)
+
+    def __repr__(self) -> str:
+        return f"AuthSession(origin='{self.origin}', cookies={len(self.cookies)})"
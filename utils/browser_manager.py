@@ -18,14 +18,23 @@ Key points / Puntos clave:
 - Chrome/Firefox supported with options (headless optional)
 - Sensible defaults (maximize/size, timeouts)
 - Optional local driver path if provided (otherwise Selenium Manager picks it)
+- Optional "fast" profile: no images/fonts/extensions/background networking, third-party
+  ads/analytics blocked, and a pre-warmed profile directory copied for every session
 - Designed to be simple for tests and clear for learning purposes
 
 """
 
 from __future__ import annotations
 
+import atexit
 import os
-from typing import Optional
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote, urlsplit
+from urllib.request import getproxies
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -33,6 +42,90 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.remote.webdriver import WebDriver
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# English: Third-party hosts loaded by the Magento demo that no test interacts with (ads, analytics, web fonts)
+# Spanish: Hosts de terceros que carga el demo de Magento y con los que ningún test interactúa (anuncios, analítica, fuentes)
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "connect.facebook.net",
+    "hotjar.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+)
+
+# English: Chrome lock files that must not be copied from the template profile
+# Spanish: Archivos de bloqueo de Chrome que no se deben copiar del perfil plantilla
+_PROFILE_LOCK_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile", "parent.lock", ".parentlock")
+
+# English: A template lock older than this is considered abandoned by a crashed worker
+# Spanish: Un bloqueo de plantilla más antiguo que esto se considera abandonado
+_TEMPLATE_LOCK_STALE_SECONDS = 300
+
+
+# English: Discard port on loopback: nothing listens there, connections are refused immediately
+# Spanish: Puerto 'discard' en loopback: nadie escucha ahí, las conexiones se rechazan de inmediato
+_BLOCKED_PROXY = "PROXY 127.0.0.1:9"
+
+
+_PAC_PROXY_TYPES = {"http": "PROXY", "https": "HTTPS", "socks": "SOCKS5", "socks5": "SOCKS5",
+                    "socks5h": "SOCKS5", "socks4": "SOCKS4", "socks4a": "SOCKS4"}
+
+
+def _pac_proxy(proxy_url: str) -> str:
+    """'http://proxy.corp:3128' -> 'PROXY proxy.corp:3128' (PAC result syntax)"""
+    parts = urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    kind = _PAC_PROXY_TYPES.get(parts.scheme.lower(), "PROXY")
+    port = parts.port or (1080 if kind.startswith("SOCKS") else 443 if kind == "HTTPS" else 80)
+    return f"{kind} {parts.hostname}:{port}"
+
+
+def _pac_host_list(hosts: List[str]) -> str:
+    return "[" + ", ".join(f'"{host.lower()}"' for host in hosts) + "]"
+
+
+def _blocking_pac_url(domains: List[str], proxies: Optional[Dict[str, str]] = None) -> str:
+    """
+    English: data: URL of a PAC script that routes the domains and their subdomains to _BLOCKED_PROXY.
+    Every other request keeps the run's proxy ('proxies' as returned by urllib's getproxies():
+    HTTP(S)_PROXY / ALL_PROXY / NO_PROXY or the system settings), or goes DIRECT when there is none.
+    Spanish: URL data: de un script PAC que envía los dominios y sus subdominios a _BLOCKED_PROXY.
+    El resto de peticiones conserva el proxy de la ejecución (variables HTTP(S)_PROXY / ALL_PROXY /
+    NO_PROXY o la configuración del sistema), o va DIRECT si no hay ninguno.
+    """
+    proxies = {key.lower(): value for key, value in (proxies or {}).items() if value}
+    bypass = [host.strip().lstrip("*").lstrip(".") for host in proxies.get("no", "").split(",") if host.strip()]
+    routes = {}
+    if "" not in bypass:  # NO_PROXY=* sends everything direct
+        routes = {scheme: _pac_proxy(proxies[scheme] if scheme in proxies else proxies["all"])
+                  for scheme in ("http", "https") if scheme in proxies or "all" in proxies}
+
+    script = (
+        "function FindProxyForURL(url, host) {"
+        f" var blocked = {_pac_host_list(domains)}; host = host.toLowerCase();"
+        " for (var i = 0; i < blocked.length; i++) {"
+        " if (host == blocked[i] || dnsDomainIs(host, '.' + blocked[i])) return '" + _BLOCKED_PROXY + "';"
+        " }"
+    )
+    if routes:
+        script += (
+            f" var bypass = {_pac_host_list(bypass)};"
+            " for (var j = 0; j < bypass.length; j++) {"
+            " if (host == bypass[j] || dnsDomainIs(host, '.' + bypass[j])) return 'DIRECT';"
+            " }"
+        )
+        if "https" in routes:
+            script += f" if (url.substring(0, 6) == 'https:') return '{routes['https']}';"
+        if "http" in routes:
+            script += f" if (url.substring(0, 5) == 'http:') return '{routes['http']}';"
+    script += " return 'DIRECT'; }"
+    return "data:application/x-ns-proxy-autoconfig," + quote(script)
+
 
 class BrowserManager:
     """
@@ -52,20 +145,29 @@ class BrowserManager:
     - CHROME_DRIVER_PATH: path to a chromedriver binary (if you insist on manual driver)
     - FIREFOX_DRIVER_PATH: path to a geckodriver binary (manual driver)
     - WINDOW_WIDTH / WINDOW_HEIGHT: window size when not headless (firefox); chrome is maximized by default
-    - IMPLICIT_WAIT: seconds (default: 2)
+    - IMPLICIT_WAIT: seconds (default: 0; BaseActions waits explicitly, see src/pages/smart_wait.py)
     - PAGELOAD_TIMEOUT: seconds (default: 30)
+    - BROWSER_PROFILE: default|fast (default: default)
+    - BLOCKED_DOMAINS: comma separated hosts blocked by the fast profile (default: DEFAULT_BLOCKED_DOMAINS)
+    - BROWSER_PROFILE_DIR: where the pre-warmed template profiles live (default: .browser_profiles)
+    - BROWSER_PROFILE_WARM: true|false, reuse a pre-warmed profile with the fast profile (default: true)
+    - BROWSER_WARMUP_URL: page visited once to fill the template cache (default: BASE_URL)
 
     Note:
     - On Linux, a file like driver/chromedriver.exe is a Windows binary and will not be used.
       Prefer Selenium Manager or provide a Linux-compatible driver path.
     """
 
-    def __init__(self, browser: Optional[str] = None, headless: Optional[bool] = None):
+    def __init__(self, browser: Optional[str] = None, headless: Optional[bool] = None,
+                 profile: Optional[str] = None):
         self._browser = (browser or os.getenv("BROWSER") or "chrome").lower()
         self._headless = (
             (str(headless).lower() if headless is not None else os.getenv("HEADLESS", "false"))
             in ("1", "true", "yes")
         )
+        self._profile = (profile or os.getenv("BROWSER_PROFILE") or "default").lower()
+        if self._profile not in ("default", "fast"):
+            raise ValueError(f"Perfil de navegador no soportado / Unsupported browser profile: {self._profile}")
         self.driver: WebDriver = self._start_driver(self._browser)
 
     # English: Public accessor in case tests want to grab the driver
@@ -74,29 +176,43 @@ class BrowserManager:
     def instance(self) -> WebDriver:
         return self.driver
 
+    @property
+    def is_fast(self) -> bool:
+        return self._profile == "fast"
+
     def _start_driver(self, browser: str) -> WebDriver:
+        if browser not in ("chrome", "firefox"):
+            raise ValueError(f"Navegador no soportado / Unsupported browser: {browser}")
+
+        profile_dir = None
+        if self.is_fast and os.getenv("BROWSER_PROFILE_WARM", "true").lower() in ("1", "true", "yes"):
+            template = self._prepare_template_profile(browser)
+            if template is not None:
+                profile_dir = self._copy_profile(template)
+
+        driver = self._launch(browser, profile_dir)
+        self._apply_timeouts_and_window(driver)
+        return driver
+
+    def _launch(self, browser: str, profile_dir: Optional[Path] = None) -> WebDriver:
         if browser == "chrome":
-            options = self._build_chrome_options()
+            options = self._build_chrome_options(profile_dir)
             # English: If CHROME_DRIVER_PATH is provided, use it; otherwise Selenium Manager picks a driver
             # Spanish: Si CHROME_DRIVER_PATH está definido, úsalo; de lo contrario Selenium Manager elige un driver
             chrome_driver_path = os.getenv("CHROME_DRIVER_PATH")
             service = ChromeService(executable_path=chrome_driver_path) if chrome_driver_path else ChromeService()
             driver = webdriver.Chrome(service=service, options=options)
         elif browser == "firefox":
-            options = self._build_firefox_options()
+            options = self._build_firefox_options(profile_dir)
             firefox_driver_path = os.getenv("FIREFOX_DRIVER_PATH")
             service = FirefoxService(executable_path=firefox_driver_path) if firefox_driver_path else FirefoxService()
             driver = webdriver.Firefox(service=service, options=options)
-        else:
-            raise ValueError(f"Navegador no soportado / Unsupported browser: {browser}")
-
-        self._apply_timeouts_and_window(driver)
         return driver
 
     # --------------------------
     # Options builders / Constructores de opciones
     # --------------------------
-    def _build_chrome_options(self) -> ChromeOptions:
+    def _build_chrome_options(self, profile_dir: Optional[Path] = None) -> ChromeOptions:
         options = ChromeOptions()
         if self._headless:
             options.add_argument("--headless=new")  # modern headless
@@ -113,9 +229,35 @@ class BrowserManager:
         # Common stability flags
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
+
+        if profile_dir is not None:
+            options.add_argument(f"--user-data-dir={profile_dir}")
+        if self.is_fast:
+            # English: skip work the tests never look at
+            # Spanish: evita trabajo que los tests nunca revisan
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            for argument in (
+                "--blink-settings=imagesEnabled=false",
+                "--disable-remote-fonts",
+                "--disable-extensions",
+                "--disable-background-networking",
+                "--disable-component-update",
+                "--disable-default-apps",
+                "--disable-sync",
+                "--disable-features=Translate,OptimizationHints,MediaRouter",
+                "--no-first-run",
+                "--no-default-browser-check",
+                "--mute-audio",
+            ):
+                options.add_argument(argument)
+            # English: blocked hosts fail at DNS resolution instantly instead of waiting on the network
+            # Spanish: los hosts bloqueados fallan al instante en la resolución DNS
+            rules = ", ".join(f"MAP {domain} ~NOTFOUND, MAP *.{domain} ~NOTFOUND" for domain in self._blocked_domains())
+            if rules:
+                options.add_argument(f"--host-resolver-rules={rules}")
         return options
 
-    def _build_firefox_options(self) -> FirefoxOptions:
+    def _build_firefox_options(self, profile_dir: Optional[Path] = None) -> FirefoxOptions:
         options = FirefoxOptions()
         if self._headless:
             options.add_argument("-headless")
@@ -130,14 +272,123 @@ class BrowserManager:
         firefox_binary = os.getenv("FIREFOX_BINARY")
         if firefox_binary:
             options.binary_location = firefox_binary
+
+        if profile_dir is not None:
+            options.add_argument("-profile")
+            options.add_argument(str(profile_dir))
+        if self.is_fast:
+            for name, value in (
+                ("permissions.default.image", 2),
+                ("gfx.downloadable_fonts.enabled", False),
+                ("browser.display.use_document_fonts", 0),
+                ("extensions.update.enabled", False),
+                ("app.update.auto", False),
+                ("browser.safebrowsing.malware.enabled", False),
+                ("browser.safebrowsing.phishing.enabled", False),
+                ("network.prefetch-next", False),
+                ("datareporting.healthreport.uploadEnabled", False),
+                ("toolkit.telemetry.enabled", False),
+                ("browser.shell.checkDefaultBrowser", False),
+                ("media.autoplay.default", 5),
+            ):
+                options.set_preference(name, value)
+            # English: Firefox has no resolver rules like Chrome's ~NOTFOUND; a PAC script sends blocked hosts
+            # (and their subdomains) to a closed local port, so they fail at once instead of reaching the network.
+            # The PAC replaces the proxy settings, so the run's proxy is folded into it for every other host
+            # Spanish: Firefox no tiene reglas como ~NOTFOUND de Chrome; un script PAC envía los hosts bloqueados
+            # (y sus subdominios) a un puerto local cerrado, así fallan al instante sin salir a la red.
+            # El PAC reemplaza la configuración de proxy, por eso incluye el proxy de la ejecución para el resto
+            blocked = self._blocked_domains()
+            if blocked:
+                options.set_preference("network.proxy.type", 2)
+                options.set_preference("network.proxy.autoconfig_url", _blocking_pac_url(blocked, getproxies()))
+                # English: never retry a refused request without the proxy
+                # Spanish: nunca reintenta sin proxy una petición rechazada
+                options.set_preference("network.proxy.failover_direct", False)
         return options
 
+    @staticmethod
+    def _blocked_domains() -> List[str]:
+        configured = os.getenv("BLOCKED_DOMAINS")
+        if configured is None:
+            return list(DEFAULT_BLOCKED_DOMAINS)
+        return [domain.strip() for domain in configured.split(",") if domain.strip()]
+
+    # --------------------------
+    # Pre-warmed profile / Perfil precalentado
+    # --------------------------
+    def _prepare_template_profile(self, browser: str) -> Optional[Path]:
+        """
+        English:
+        Return the template profile for this browser, creating it the first time: a browser is
+        launched on it once, the warm-up page is visited (HTTP cache, first-run work) and the
+        template is marked ready. While another worker is building it, None is returned and the
+        session simply starts with a fresh profile.
+
+        Spanish:
+        Devuelve el perfil plantilla del navegador y lo crea la primera vez: se lanza un navegador
+        sobre él, se visita la página de calentamiento y se marca como listo. Mientras otro worker
+        lo construye se devuelve None y la sesión arranca con un perfil nuevo.
+        """
+        base = Path(os.getenv("BROWSER_PROFILE_DIR") or PROJECT_ROOT / ".browser_profiles")
+        template = base / f"{browser}-template"
+        ready = template / ".ready"
+        if ready.exists():
+            return template
+
+        base.mkdir(parents=True, exist_ok=True)
+        lock = base / f"{browser}-template.lock"
+        if lock.exists() and time.time() - lock.stat().st_mtime > _TEMPLATE_LOCK_STALE_SECONDS:
+            lock.unlink(missing_ok=True)
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return None
+
+        try:
+            shutil.rmtree(template, ignore_errors=True)
+            template.mkdir(parents=True)
+            driver = self._launch(browser, template)
+            try:
+                warmup_url = os.getenv("BROWSER_WARMUP_URL", os.getenv("BASE_URL"))
+                if warmup_url:
+                    driver.set_page_load_timeout(float(os.getenv("PAGELOAD_TIMEOUT", "30")))
+                    driver.get(warmup_url)
+            except Exception:
+                # English: an unreachable site still leaves a usable (just colder) profile
+                # Spanish: un sitio inaccesible deja igualmente un perfil utilizable
+                pass
+            finally:
+                driver.quit()
+            ready.touch()
+            return template
+        except Exception:
+            shutil.rmtree(template, ignore_errors=True)
+            return None
+        finally:
+            os.close(fd)
+            lock.unlink(missing_ok=True)
+
+    @staticmethod
+    def _copy_profile(template: Path) -> Path:
+        """
+        English: Copy the template for one session (a profile can only be used by one browser at a time).
+        Spanish: Copia la plantilla para una sesión (un perfil solo lo puede usar un navegador a la vez).
+        """
+        session_dir = Path(tempfile.mkdtemp(prefix=f"{template.name}-"))
+        shutil.copytree(template, session_dir, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns(*_PROFILE_LOCK_FILES), symlinks=True)
+        atexit.register(shutil.rmtree, session_dir, ignore_errors=True)
+        return session_dir
+
     # --------------------------
     # Window and timeouts / Ventana y timeouts
     # --------------------------
     def _apply_timeouts_and_window(self, driver: WebDriver) -> None:
         # Timeouts
-        implicit_wait = float(os.getenv("IMPLICIT_WAIT", "2"))
+        # English: no implicit wait by default, it would block every poll of the explicit waits
+        # Spanish: sin espera implícita por defecto, bloquearía cada sondeo de las esperas explícitas
+        implicit_wait = float(os.getenv("IMPLICIT_WAIT", "0"))
         page_load_timeout = float(os.getenv("PAGELOAD_TIMEOUT", "30"))
         driver.implicitly_wait(implicit_wait)
         driver.set_page_load_timeout(page_load_timeout)
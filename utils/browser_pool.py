@@ -0,0 +1,221 @@
+# English: BrowserPool keeps warm WebDriver sessions alive and hands them out to tests (reuse instead of relaunch)
+# Spanish: BrowserPool mantiene sesiones WebDriver listas y las entrega a los tests (reutilizar en lugar de relanzar)
+
+"""
+English:
+Launching Chrome/Firefox dominates the runtime of short UI tests. BrowserPool starts
+sessions through BrowserManager once and lends them to tests. Between tests every session
+is reset (cookies and storage of every visited origin, extra windows, navigation to
+about:blank), and it is recycled (quit + relaunched on demand) after a configurable number
+of uses or when the reset fails because the browser crashed.
+
+WebDriver's own commands only reach the current origin, so the full reset uses the Chrome
+DevTools Protocol. Browsers without CDP (Firefox) are recycled after each test instead of
+leaking another domain's cookies into the next test, so the pool gives them no speed-up and
+the root conftest does not pool Firefox sessions.
+
+Spanish:
+Lanzar Chrome/Firefox domina el tiempo de ejecución de los tests de UI cortos. BrowserPool
+inicia las sesiones mediante BrowserManager una vez y las presta a los tests. Entre tests
+cada sesión se reinicia (cookies y storage de cada origen visitado, ventanas extra, navegación
+a about:blank) y se recicla tras un número configurable de usos o cuando el navegador falla.
+El reinicio completo usa CDP (Chrome/Edge); los navegadores sin CDP (Firefox) se reciclan tras cada test,
+por eso el conftest raíz no usa el pool con Firefox.
+
+Environment variables (opcionales):
+- BROWSER_POOL_SIZE: maximum number of warm sessions per worker (default: 1)
+- BROWSER_POOL_MAX_USES: recycle a session after this many tests (default: 50)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Callable, List, Optional, Set
+from urllib.parse import urlsplit
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import logger
+
+
+def _visited_origins(cdp: Callable) -> Set[str]:
+    """
+    English: http(s) origins in the current tab's navigation history (CDP Page.getNavigationHistory).
+    Spanish: Orígenes http(s) del historial de navegación de la pestaña actual.
+    """
+    origins = set()
+    for entry in cdp("Page.getNavigationHistory", {}).get("entries", []):
+        parts = urlsplit(entry.get("url", ""))
+        if parts.scheme in ("http", "https") and parts.netloc:
+            origins.add(f"{parts.scheme}://{parts.netloc}")
+    return origins
+
+
+class _PooledSession:
+    """A live WebDriver plus its usage counter"""
+
+    __slots__ = ("driver", "uses")
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    English:
+    Pool of reusable WebDriver sessions for one pytest process (worker).
+
+    Spanish:
+    Pool de sesiones WebDriver reutilizables para un proceso de pytest (worker).
+
+    Example:
+        pool = BrowserPool(lambda: BrowserManager("chrome").driver, size=2)
+        driver = pool.acquire()
+        ...
+        pool.release(driver)
+        pool.close()
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], size: Optional[int] = None,
+                 max_uses: Optional[int] = None):
+        self._factory = factory
+        self.size = max(1, size if size is not None else int(os.getenv("BROWSER_POOL_SIZE", "1")))
+        self.max_uses = max(1, max_uses if max_uses is not None else int(os.getenv("BROWSER_POOL_MAX_USES", "50")))
+        self._idle: List[_PooledSession] = []
+        self._in_use = {}
+        self._launching = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self.launched = 0
+        self.recycled = 0
+
+    @classmethod
+    def for_browser(cls, browser: str, headless: Optional[bool] = None, profile: Optional[str] = None,
+                    **kwargs) -> "BrowserPool":
+        # English: Build a pool whose sessions come from BrowserManager (same options as the plain fixture)
+        # Spanish: Construye un pool cuyas sesiones vienen de BrowserManager (mismas opciones que la fixture normal)
+        from utils.browser_manager import BrowserManager
+
+        return cls(lambda: BrowserManager(browser, headless=headless, profile=profile).driver, **kwargs)
+
+    # --------------------------
+    # Acquire / release
+    # --------------------------
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """
+        English: Borrow a warm session, launching one if the pool is not full yet.
+        Spanish: Toma una sesión lista, lanzando una si el pool aún no está lleno.
+        """
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed")
+                if self._idle:
+                    session = self._idle.pop()
+                    session.uses += 1
+                    self._in_use[id(session.driver)] = session
+                    return session.driver
+                if len(self._in_use) + self._launching < self.size:
+                    # English: reserve the slot so other threads do not over-launch
+                    # Spanish: reserva el lugar para que otros hilos no lancen de más
+                    self._launching += 1
+                    break
+                if not self._condition.wait(timeout):
+                    raise TimeoutError("No browser session became available in time")
+
+        try:
+            session = _PooledSession(self._factory())
+        finally:
+            with self._condition:
+                self._launching -= 1
+                self._condition.notify()
+        self.launched += 1
+        logger.info(f"BrowserPool launched session #{self.launched}")
+
+        session.uses += 1
+        with self._condition:
+            self._in_use[id(session.driver)] = session
+        return session.driver
+
+    def release(self, driver: WebDriver, broken: bool = False) -> None:
+        """
+        English: Return a session. It is reset for the next test, or quit when it is worn out or broken.
+        Spanish: Devuelve una sesión. Se reinicia para el próximo test o se cierra si está gastada o rota.
+        """
+        with self._condition:
+            session = self._in_use.pop(id(driver), None)
+        if session is None:
+            return
+
+        keep = not broken and not self._closed and session.uses < self.max_uses
+        if keep:
+            try:
+                keep = self.reset(driver)
+            except Exception as e:
+                # English: a crashed browser/driver surfaces as WebDriver or connection errors
+                # Spanish: un navegador/driver caído aparece como error de WebDriver o de conexión
+                logger.warning(f"BrowserPool reset failed, recycling session: {e.__class__.__name__}")
+                keep = False
+
+        if not keep:
+            self._quit(session)
+
+        with self._condition:
+            if keep:
+                self._idle.append(session)
+            self._condition.notify()
+
+    @staticmethod
+    def reset(driver: WebDriver) -> bool:
+        """
+        English: Bring a session back to a clean state without relaunching the browser.
+        Returns False when the browser cannot clear every origin (no CDP); the session must be recycled.
+        Spanish: Devuelve una sesión a un estado limpio sin relanzar el navegador.
+        Retorna False si el navegador no puede limpiar todos los orígenes (sin CDP); hay que reciclarla.
+        """
+        cdp = getattr(driver, "execute_cdp_cmd", None)
+        if cdp is None:
+            # English: delete_all_cookies() and the storage clear only reach the current origin
+            # Spanish: delete_all_cookies() y la limpieza de storage solo alcanzan el origen actual
+            return False
+
+        origins: Set[str] = set()
+        handles = driver.window_handles
+        for handle in handles[1:] + handles[:1]:
+            driver.switch_to.window(handle)
+            origins.update(_visited_origins(cdp))
+            if handle != handles[0]:
+                driver.close()
+
+        cdp("Network.clearBrowserCookies", {})
+        for origin in sorted(origins):
+            cdp("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.get("about:blank")
+        return True
+
+    # --------------------------
+    # Cleanup
+    # --------------------------
+    def _quit(self, session: _PooledSession) -> None:
+        self.recycled += 1
+        try:
+            session.driver.quit()
+        except Exception:
+            # English: the session may already be dead; nothing else to release
+            # Spanish: la sesión puede estar ya caída; no hay nada más que liberar
+            pass
+
+    def close(self) -> None:
+        """
+        English: Quit every idle session; sessions still in use are quit when released.
+        Spanish: Cierra todas las sesiones libres; las que están en uso se cierran al liberarse.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for session in idle:
+            self._quit(session)
+        logger.info(f"BrowserPool closed (launched={self.launched}, recycled={self.recycled})")
@@ -19,7 +19,6 @@ Las variables y los valores se cargan desde el archivo .env, por lo que los test
 
 import os
 from dotenv import load_dotenv
-from selenium.webdriver.common.by import By
 
 load_dotenv()
 
@@ -28,6 +27,9 @@ def parse_locator(env_value, var_name=None):
     """Convierte 'css,#id' en (By.CSS_SELECTOR, '#id')"""
     if not env_value:
         raise ValueError(f"El valor del locator para '{var_name or 'UNKNOWN'}' está vacío o no definido en el archivo .env")
+    # Importación perezosa: selenium solo se carga cuando se usa un locator (no en ejecuciones de API)
+    from selenium.webdriver.common.by import By
+
     by_map = {
         "id": By.ID,
         "name": By.NAME,
@@ -38,10 +40,49 @@ def parse_locator(env_value, var_name=None):
         "link": By.LINK_TEXT,
         "plink": By.PARTIAL_LINK_TEXT,
     }
-    tipo, valor = env_value.split(",", 1)
+    tipo, separator, valor = env_value.partition(",")
+    if not separator or tipo.strip().lower() not in by_map:
+        raise ValueError(
+            f"Locator inválido para '{var_name or 'UNKNOWN'}': '{env_value}'. "
+            f"Formato esperado 'tipo,valor' con tipo en: {', '.join(by_map)}"
+        )
     return (by_map[tipo.strip().lower()], valor.strip())
 
 
+class Locator:
+    """
+    English:
+    Lazy, memoized locator read from an env variable. It is parsed (and validated) the first
+    time the attribute is read; the parsed tuple then replaces the descriptor on the class,
+    so later reads are plain attribute lookups. API-only runs never touch the UI locators and
+    therefore never fail because a UI variable is missing from .env.
+
+    Spanish:
+    Locator perezoso y memorizado leído desde una variable de entorno. Se parsea (y valida) la
+    primera vez que se lee el atributo; después la tupla reemplaza al descriptor en la clase,
+    así las siguientes lecturas son accesos normales. Las ejecuciones solo de API nunca tocan
+    los locators de UI y por eso no fallan si falta una variable de UI en el .env.
+    """
+
+    def __init__(self, env_var, optional=False):
+        self.env_var = env_var
+        self.optional = optional
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        owner._locators = {**getattr(owner, "_locators", {}), name: self}
+
+    def __get__(self, instance, owner):
+        env_value = os.getenv(self.env_var)
+        if self.optional and not env_value:
+            value = None
+        else:
+            value = parse_locator(env_value, self.env_var)
+        setattr(owner, self.name, value)
+        return value
+
+
 class Configuration:
     BASE_URL = os.getenv('BASE_URL')
     LOGIN_URL = os.getenv('LOGIN_URL')
@@ -51,29 +92,46 @@ class Configuration:
     PASSWORD = os.getenv('PASSWORD')
 
     # Locators Page Submission
-    FIRST_NAME_INPUT = parse_locator(os.getenv('FORM_NAME'), 'FORM_NAME')
-    LAST_NAME_INPUT = parse_locator(os.getenv('FORM_LAST_NAME'), 'FORM_LAST_NAME')
-    EMAIL_INPUT = parse_locator(os.getenv('FORM_EMAIL'), 'FORM_EMAIL')
-    PASSWORD_INPUT = parse_locator(os.getenv('FORM_PASSWORD'), 'FORM_PASSWORD')
-    CONFIRM_PASSWORD_INPUT = parse_locator(os.getenv('FORM_CONFIRMATION_PASSWORD'), 'FORM_CONFIRMATION_PASSWORD')
-    PASSWORD_STRENGTH_LABEL = parse_locator(os.getenv('PASSWORD_STRENGTH_LABEL'), 'PASSWORD_STRENGTH_LABEL')
-    SUCCESS_MESSAGE = parse_locator(os.getenv('SUCCESS_MESSAGE'), 'SUCCESS_MESSAGE')
-    SUBMIT_BUTTON = parse_locator(os.getenv('SUBMIT_BUTTON'), 'SUBMIT_BUTTON')
+    FIRST_NAME_INPUT = Locator('FORM_NAME')
+    LAST_NAME_INPUT = Locator('FORM_LAST_NAME')
+    EMAIL_INPUT = Locator('FORM_EMAIL')
+    PASSWORD_INPUT = Locator('FORM_PASSWORD')
+    CONFIRM_PASSWORD_INPUT = Locator('FORM_CONFIRMATION_PASSWORD')
+    PASSWORD_STRENGTH_LABEL = Locator('PASSWORD_STRENGTH_LABEL')
+    SUCCESS_MESSAGE = Locator('SUCCESS_MESSAGE')
+    SUBMIT_BUTTON = Locator('SUBMIT_BUTTON')
 
     # Locators Account Page
-    ACCOUNT_WELCOME_MESSAGE = parse_locator(os.getenv('ACCOUNT_WELCOME_MESSAGE'), 'ACCOUNT_WELCOME_MESSAGE')
+    ACCOUNT_WELCOME_MESSAGE = Locator('ACCOUNT_WELCOME_MESSAGE')
 
     # Buscador de productos
     SEARCH_URL = os.getenv('SEARCH_URL') or BASE_URL  # opcional
-    SEARCH_INPUT = parse_locator(os.getenv('SEARCH_INPUT'), 'SEARCH_INPUT')
-    SEARCH_SUBMIT = parse_locator(os.getenv('SEARCH_SUBMIT'), 'SEARCH_SUBMIT')
-    SEARCH_RESULT_TITLES = parse_locator(os.getenv('SEARCH_RESULT_TITLES'), 'SEARCH_RESULT_TITLES')
+    SEARCH_INPUT = Locator('SEARCH_INPUT')
+    SEARCH_SUBMIT = Locator('SEARCH_SUBMIT')
+    SEARCH_RESULT_TITLES = Locator('SEARCH_RESULT_TITLES')
 
     # Locators Login Page
-    USER_NAME_INPUT = parse_locator(os.getenv('USER_NAME_INPUT'), 'USER_NAME_INPUT')
-    PASSWORD_INPUT_LOGIN = parse_locator(os.getenv('PASSWORD_INPUT'), 'PASSWORD_INPUT')
-    LOGIN_BUTTON = parse_locator(os.getenv('LOGIN_BUTTON'), 'LOGIN_BUTTON')
-    LOGIN_ERROR_MESSAGE = (
-        parse_locator(os.getenv('LOGIN_ERROR_MESSAGE'), 'LOGIN_ERROR_MESSAGE')
-        if os.getenv('LOGIN_ERROR_MESSAGE') else None
-    )
\ No newline at end of file
+    USER_NAME_INPUT = Locator('USER_NAME_INPUT')
+    PASSWORD_INPUT_LOGIN = Locator('PASSWORD_INPUT')
+    LOGIN_BUTTON = Locator('LOGIN_BUTTON')
+    LOGIN_ERROR_MESSAGE = Locator('LOGIN_ERROR_MESSAGE', optional=True)
+
+    @classmethod
+    def validate_locators(cls):
+        """Parsea todos los locators de una vez (falla temprano en ejecuciones de UI si falta alguno).
+        Lo llama el conftest raíz al terminar la recolección si algún test usa 'driver'.
+        Lanza un único ValueError que lista todos los locators faltantes o mal formados."""
+        errors = []
+        for name in cls._locators:
+            try:
+                getattr(cls, name)
+            except ValueError as exc:
+                errors.append(f"{name}: {exc}")
+        if errors:
+            raise ValueError("Locators inválidos:\n  " + "\n  ".join(errors))
+
+    @classmethod
+    def reset_locators(cls):
+        """Olvida los locators ya parseados para volver a leerlos del entorno"""
+        for name, descriptor in cls._locators.items():
+            setattr(cls, name, descriptor)
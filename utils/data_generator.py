@@ -11,10 +11,27 @@ Spanish:
 
 """
 
-from faker import Faker
 import random
 
-fake = Faker()
+
+class _LazyFaker:
+    """
+    English: Creates the Faker instance on first use; importing faker and its locale providers is
+    slow and test collection does not need it.
+    Spanish: Crea la instancia de Faker en el primer uso; importar faker y sus proveedores es lento
+    y la recolección de tests no lo necesita.
+    """
+
+    _instance = None
+
+    def __getattr__(self, name):
+        if _LazyFaker._instance is None:
+            from faker import Faker
+            _LazyFaker._instance = Faker()
+        return getattr(_LazyFaker._instance, name)
+
+
+fake = _LazyFaker()
 
 def generate_user():
     generated_password = fake.password(
@@ -0,0 +1,131 @@
+# English: Import-time profiler - shows which modules make framework imports and test collection slow
+# Spanish: Perfilador de tiempos de importación - muestra qué módulos hacen lentas las importaciones y la recolección
+
+"""
+English:
+Runs Python with '-X importtime' in a clean subprocess (nothing is cached in sys.modules),
+parses the report and prints the slowest imports by cumulative and by self time. Use it to
+check that API-only runs and 'pytest --collect-only' do not pay for Selenium, Faker,
+jsonschema or allure, which are loaded lazily by the framework modules.
+
+Spanish:
+Ejecuta Python con '-X importtime' en un subproceso limpio, interpreta el reporte y muestra
+las importaciones más lentas por tiempo acumulado y propio. Sirve para comprobar que las
+ejecuciones solo de API y 'pytest --collect-only' no pagan Selenium, Faker, jsonschema ni
+allure, que los módulos del framework cargan de forma perezosa.
+
+Usage:
+    python -m utils.import_profiler                          # conftest + framework packages
+    python -m utils.import_profiler utils.config src.api -n 15
+    python -m utils.import_profiler --collect tests/api_test # profile 'pytest --collect-only'
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_MODULES = ("conftest", "utils.logger", "utils.config", "src.api", "utils.api_helpers")
+
+# English: Third-party packages that should only be imported when a test really needs them
+# Spanish: Paquetes de terceros que solo deberían importarse cuando un test realmente los necesita
+HEAVY_PACKAGES = ("selenium", "faker", "jsonschema", "allure", "requests")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(report: str) -> List[ImportTiming]:
+    """Parse the stderr of 'python -X importtime' (header and other lines are ignored)"""
+    timings = []
+    for line in report.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def profile(modules: Sequence[str] = DEFAULT_MODULES, collect: Optional[Sequence[str]] = None) -> List[ImportTiming]:
+    """
+    English: Import 'modules' (or run 'pytest --collect-only' on 'collect') with -X importtime.
+    Spanish: Importa 'modules' (o ejecuta 'pytest --collect-only' sobre 'collect') con -X importtime.
+    """
+    if collect is not None:
+        cmd = [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q",
+               "-p", "no:cacheprovider", *collect]
+    else:
+        code = "; ".join(f"import {module}" for module in modules)
+        cmd = [sys.executable, "-X", "importtime", "-c", code]
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    timings = parse_importtime(result.stderr)
+    if result.returncode not in (0, 5) and not timings:
+        raise RuntimeError(result.stderr.strip() or f"exit code {result.returncode}")
+    return timings
+
+
+def package_times(timings: Sequence[ImportTiming]) -> Dict[str, int]:
+    """
+    English: Cumulative microseconds per top-level package (first dotted component). Packages first
+    imported through a submodule or a plugin count too; nested imports of the same package are not
+    counted twice.
+    Spanish: Microsegundos acumulados por paquete raíz (primer componente). Cuentan también los
+    paquetes importados primero por un submódulo o un plugin, sin contar dos veces los anidados.
+    """
+    totals: Dict[str, int] = {}
+    # English: -X importtime lists children before their parent, so reversed it is a pre-order walk
+    # Spanish: -X importtime lista los hijos antes que el padre; al revés es un recorrido en preorden
+    ancestors: List[str] = []
+    for t in reversed(timings):
+        package = t.module.split(".", 1)[0]
+        del ancestors[t.depth:]
+        if not ancestors or ancestors[-1] != package:
+            totals[package] = totals.get(package, 0) + t.cumulative_us
+        ancestors.append(package)
+    return totals
+
+
+def report(timings: Sequence[ImportTiming], top: int = 20) -> str:
+    """Human readable summary: totals, heavy third-party packages, slowest imports"""
+    total = sum(t.self_us for t in timings)
+    packages = package_times(timings)
+    lines = [f"Total import time: {total / 1e6:.3f}s across {len(timings)} modules", ""]
+
+    heavy = [name for name in HEAVY_PACKAGES if name in packages]
+    if heavy:
+        lines.append("Heavy packages loaded / Paquetes pesados cargados:")
+        lines += [f"  {name:<30} {packages[name] / 1e3:9.1f} ms" for name in heavy]
+        lines.append("")
+
+    lines.append(f"Top {top} by cumulative time / por tiempo acumulado:")
+    for t in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {t.module:<50} {t.cumulative_us / 1e3:9.1f} ms  (self {t.self_us / 1e3:.1f} ms)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile framework import time with python -X importtime")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES), help="Modules to import")
+    parser.add_argument("-n", "--top", type=int, default=20, help="Number of slowest imports to show")
+    parser.add_argument("--collect", nargs="*", default=None, metavar="PATH",
+                        help="Profile 'pytest --collect-only' on these paths instead of plain imports")
+    args = parser.parse_args(argv)
+
+    print(report(profile(args.modules, args.collect), args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,67 @@
- # English: Centralized logging with formatting, timestamp, levels (info, error, debug), file output, and log rotation
+# English: Centralized logging with formatting, timestamp, levels (info, error, debug), file output, and log rotation
 # Spanish: Logging centralizado con formato, timestamp, niveles (info, error, debug), salida a archivo y rotación de logs
 
+"""
+English:
+Loggers created by setup_logger only put records on a bounded in-memory queue; a single
+background thread (AsyncLogPipeline) writes them to the console and to a rotating log file,
+flushing the file in batches. The test thread never waits for the disk unless the queue is
+full, and then the backpressure policy decides: 'block' waits for room, 'drop' discards
+DEBUG/INFO records (WARNING and above always wait). The queue is drained at exit.
+
+Spanish:
+Los loggers creados por setup_logger solo ponen los registros en una cola acotada en memoria;
+un único hilo en segundo plano (AsyncLogPipeline) los escribe en la consola y en un archivo
+de log con rotación, vaciando el archivo por lotes. El hilo del test nunca espera al disco
+salvo que la cola esté llena, y entonces decide la política de contrapresión: 'block' espera
+espacio, 'drop' descarta registros DEBUG/INFO (WARNING o superior siempre espera).
+
+Environment variables (opcionales):
+- LOG_LEVEL: logger level (default: INFO)
+- LOG_QUEUE_SIZE: maximum queued records (default: 10000)
+- LOG_QUEUE_POLICY: block|drop, what to do when the queue is full (default: block)
+- LOG_BATCH_SIZE: records written before the file is flushed (default: 256)
+- LOG_FLUSH_INTERVAL: maximum seconds a written record waits for a flush (default: 1.0)
+- LOG_MAX_BYTES: rotate the file when it reaches this size, 0 disables it (default: 10485760)
+- LOG_BACKUP_COUNT: rotated files kept (default: 5)
+- LOG_ROTATE_WHEN: time-based rotation instead of size (e.g. midnight, H) (default: off)
+- LOG_OUTPUT: text|json, json writes the file as NDJSON (one object per line) (default: text)
+
+Every record is tagged on the emitting thread with the current test node id, the worker id,
+the API request id and the seconds elapsed since the test started (see log_context), so the
+NDJSON file can be bulk-loaded and grouped per test, endpoint or step.
+Cada registro se etiqueta con el test actual, el worker, el id de petición API y los segundos
+transcurridos desde el inicio del test (ver log_context).
+"""
+
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 
-# English: Create logs directory if it doesn't exist
-# Spanish: Crear directorio de logs si no existe
+# English: Logs directory; created when the first record is written, not at import time
+# Spanish: Directorio de logs; se crea al escribir el primer registro, no al importar
 LOGS_DIR = Path(__file__).parent.parent / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
 
-# English: Generate log filename with timestamp
-# Spanish: Generar nombre de archivo de log con timestamp
-log_filename = f"test_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+# English: Generate log filename with timestamp (and worker id, so parallel workers never share a file)
+# Spanish: Generar nombre de archivo de log con timestamp (y worker, así los workers paralelos no comparten archivo)
+_WORKER = os.getenv("PYTEST_XDIST_WORKER") or (f"shard{os.environ['SHARD_ID']}" if os.getenv("SHARD_ID") else "")
+WORKER_ID = _WORKER or "main"
+
+# English: Output format of the log file: text (default) or json (NDJSON)
+# Spanish: Formato del archivo de log: text (por defecto) o json (NDJSON)
+LOG_OUTPUT = os.getenv('LOG_OUTPUT', 'text').lower()
+
+log_filename = (f"test_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                f"{'_' + _WORKER if _WORKER else ''}.{'ndjson' if LOG_OUTPUT == 'json' else 'log'}")
 log_filepath = LOGS_DIR / log_filename
 
 # English: Configure log format
@@ -25,52 +73,323 @@ DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 # Spanish: Obtener nivel de log desde el entorno o usar INFO por defecto
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
 
+
+# --------------------------
+# Correlation context / Contexto de correlación
+# --------------------------
+_log_context = contextvars.ContextVar("log_context", default={})
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    English: Tag every record logged inside the block (on this thread / task) with 'fields'.
+    Known keys: test (node id), test_started (epoch seconds), request_id. Blocks nest.
+    Spanish: Etiqueta cada registro emitido dentro del bloque con 'fields'. Los bloques se anidan.
+
+    Example:
+        with log_context(test=item.nodeid, test_started=time.time()):
+            ...
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class _ContextFilter(logging.Filter):
+    """Copies the correlation context onto the record before it leaves the emitting thread"""
+
+    def filter(self, record):
+        context = _log_context.get()
+        record.worker = WORKER_ID
+        record.test = context.get("test")
+        record.request_id = context.get("request_id")
+        started = context.get("test_started")
+        record.elapsed = round(record.created - started, 3) if started else None
+        return True
+
+
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    English: One JSON object per record: timestamp, level, logger, message, source, the
+    correlation fields and any 'extra' passed to the log call (e.g. status, elapsed_ms).
+    Spanish: Un objeto JSON por registro: timestamp, nivel, logger, mensaje, origen, los
+    campos de correlación y cualquier 'extra' pasado al log (p. ej. status, elapsed_ms).
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "source": f"{record.filename}:{record.lineno}",
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _LazyFileMixin:
+    """
+    English: Creates the logs directory and file on the first emitted record, so importing the
+    framework (or 'pytest --collect-only') does not touch the disk. flush() is deferred to the
+    pipeline, which calls flush_batch() once per batch instead of once per record.
+    Spanish: Crea el directorio y el archivo de logs con el primer registro, así importar el
+    framework no toca el disco. flush() lo decide el pipeline, que llama a flush_batch() una vez
+    por lote en lugar de una vez por registro.
+    """
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+
+class _RotatingFileHandler(_LazyFileMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class _TimedRotatingFileHandler(_LazyFileMixin, logging.handlers.TimedRotatingFileHandler):
+    pass
+
+
+def _file_handler(path) -> logging.Handler:
+    """Size-based rotation by default, time-based when LOG_ROTATE_WHEN is set"""
+    backup_count = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    when = os.getenv("LOG_ROTATE_WHEN")
+    if when:
+        return _TimedRotatingFileHandler(path, when=when, backupCount=backup_count,
+                                         encoding='utf-8', delay=True)
+    return _RotatingFileHandler(path, mode='a', maxBytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+                                backupCount=backup_count, encoding='utf-8', delay=True)
+
+
+class _BackpressureQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that applies the pipeline's policy when the queue is full"""
+
+    def __init__(self, pipeline: "AsyncLogPipeline"):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+        self.addFilter(_ContextFilter())
+
+    def emit(self, record):
+        # English: after stop() (e.g. logging during interpreter exit) write synchronously
+        # Spanish: tras stop() (p. ej. logs durante la salida del intérprete) se escribe en línea
+        if not self.pipeline.running:
+            self.pipeline.write_now(self.prepare(record))
+            return
+        super().emit(record)
+
+    def enqueue(self, record):
+        if self.pipeline.policy == "drop" and record.levelno < logging.WARNING:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.pipeline.dropped += 1
+        else:
+            self.queue.put(record)
+
+
+class AsyncLogPipeline:
+    """
+    English:
+    Bounded queue + background writer thread shared by every logger from setup_logger.
+    Records are written as they arrive; file handlers are flushed every 'batch_size' records
+    or 'flush_interval' seconds after the first unflushed record, whichever comes first.
+
+    Spanish:
+    Cola acotada + hilo escritor en segundo plano compartidos por todos los loggers de
+    setup_logger. Los archivos se vacían cada 'batch_size' registros o 'flush_interval'
+    segundos después del primer registro pendiente, lo que ocurra primero.
+
+    Example:
+        pipeline = AsyncLogPipeline([logging.StreamHandler()], maxsize=1000, policy="drop")
+        pipeline.start()
+        logging.getLogger("x").addHandler(pipeline.handler)
+        pipeline.flush()
+        pipeline.stop()
+    """
+
+    _STOP = object()
+
+    def __init__(self, handlers, maxsize: int = 10000, policy: str = "block",
+                 batch_size: int = 256, flush_interval: float = 1.0):
+        if policy not in ("block", "drop"):
+            raise ValueError(f"Unknown log queue policy: {policy} (expected block or drop)")
+        self.handlers = list(handlers)
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.policy = policy
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.handler = _BackpressureQueueHandler(self)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> "AsyncLogPipeline":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Drain the queue, flush and stop the writer thread"""
+        thread = self._thread
+        if thread is None:
+            return
+        self.queue.put(self._STOP)
+        thread.join()
+        self._thread = None
+        with self._lock:
+            self._flush_handlers()
+
+    def flush(self) -> None:
+        """Block until every queued record has been written and flushed"""
+        if self.running:
+            self.queue.join()
+        with self._lock:
+            self._flush_handlers()
+
+    def write_now(self, record) -> None:
+        """Write a record synchronously on the calling thread"""
+        with self._lock:
+            self._handle(record)
+            self._flush_handlers()
+
+    def _run(self):
+        pending, deadline = 0, None
+        while True:
+            try:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                record = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                record = None
+            else:
+                if record is self._STOP:
+                    self.queue.task_done()
+                    break
+                with self._lock:
+                    self._handle(record)
+                self.queue.task_done()
+                pending += 1
+                if pending == 1:
+                    deadline = time.monotonic() + self.flush_interval
+                if pending < self.batch_size and time.monotonic() < deadline:
+                    continue
+            if pending:
+                with self._lock:
+                    self._flush_handlers()
+            pending, deadline = 0, None
+
+    def _handle(self, record):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _flush_handlers(self):
+        for handler in self.handlers:
+            try:
+                getattr(handler, "flush_batch", handler.flush)()
+            except (OSError, ValueError):
+                # English: stream already closed (e.g. captured stderr at interpreter exit)
+                # Spanish: stream ya cerrado (p. ej. stderr capturado al salir del intérprete)
+                pass
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline() -> AsyncLogPipeline:
+    """
+    English: Shared pipeline (console INFO + rotating file DEBUG), started on first use.
+    Spanish: Pipeline compartido (consola INFO + archivo con rotación DEBUG), iniciado en el primer uso.
+    """
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+
+            # English: Console Handler - outputs to terminal
+            # Spanish: Console Handler - salida a la terminal
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(formatter)
+
+            # English: File Handler - outputs to log file (capture all levels)
+            # Spanish: File Handler - salida a archivo de log (todos los niveles)
+            file_handler = _file_handler(log_filepath)
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(JsonFormatter() if LOG_OUTPUT == "json" else formatter)
+
+            _pipeline = AsyncLogPipeline(
+                [console_handler, file_handler],
+                maxsize=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+                policy=os.getenv("LOG_QUEUE_POLICY", "block").lower(),
+                batch_size=int(os.getenv("LOG_BATCH_SIZE", "256")),
+                flush_interval=float(os.getenv("LOG_FLUSH_INTERVAL", "1.0")),
+            ).start()
+            # English: registered after logging's own atexit hook, so it runs first and drains the queue
+            # Spanish: se registra después del atexit de logging, así corre antes y vacía la cola
+            atexit.register(_pipeline.stop)
+        return _pipeline
+
+
+def flush_logs() -> None:
+    """Wait until every log record emitted so far is on disk # Espera a que los logs estén en disco"""
+    if _pipeline is not None:
+        _pipeline.flush()
+
+
 def setup_logger(name: str = __name__, level: str = LOG_LEVEL) -> logging.Logger:
     """
     English: Setup and return a configured logger instance
     Spanish: Configurar y retornar una instancia de logger configurada
-    
+
     Args:
         name: Logger name (usually __name__ from calling module)
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    
+
     # English: Avoid adding handlers multiple times
     # Spanish: Evitar agregar handlers múltiples veces
     if logger.handlers:
         return logger
-    
+
     logger.setLevel(getattr(logging, level))
-    
-    # English: Console Handler - outputs to terminal
-    # Spanish: Console Handler - salida a la terminal
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    console_handler.setFormatter(console_formatter)
-    
-    # English: File Handler - outputs to log file
-    # Spanish: File Handler - salida a archivo de log
-    file_handler = logging.FileHandler(log_filepath, mode='a', encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)  # Capture all levels in file
-    file_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    file_handler.setFormatter(file_formatter)
-    
-    # English: Add handlers to logger
-    # Spanish: Agregar handlers al logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    
+
+    # English: The logger only enqueues; console and file output happen on the writer thread
+    # Spanish: El logger solo encola; la salida a consola y archivo ocurre en el hilo escritor
+    logger.addHandler(get_pipeline().handler)
+
     return logger
 
 # English: Create default logger instance for direct import
 # Spanish: Crear instancia de logger por defecto para importación directa
 logger = setup_logger()
 
-# English: Log the initialization
-# Spanish: Registrar la inicialización
-logger.info(f"Logger initialized - Log file: {log_filepath}")
+# English: Log the initialization (debug, so the log file is only opened by real output)
+# Spanish: Registrar la inicialización (debug, así el archivo solo se abre con salida real)
+logger.debug(f"Logger initialized - Log file: {log_filepath}")
@@ -0,0 +1,262 @@
+# English: Native sharding runner - splits a test suite across K local pytest worker processes
+# Spanish: Ejecutor de shards nativo - divide una suite de tests entre K procesos pytest locales
+
+"""
+English:
+BrowserManager and the 'driver' fixture assume one browser per pytest process. This module
+runs a suite (typically tests/smoke_tests) across K worker processes; each worker is an
+ordinary pytest process that owns its own headless browser, so nothing in the fixtures has
+to change. Tests are distributed with the LPT scheduler of utils.test_timing using the
+historical durations in reports/test_durations.json (evenly by count when there is no
+history yet), and the timings of the run are folded back into that store. The JUnit XML
+written by every worker is merged into a single report and Allure results from all workers
+land in the same directory.
+
+Spanish:
+Este módulo ejecuta una suite en K procesos worker; cada worker es un proceso pytest normal
+con su propio navegador headless. Los tests se reparten con el planificador LPT de
+utils.test_timing según las duraciones históricas, y los tiempos de la ejecución se
+guardan de nuevo en ese almacén. Los reportes JUnit de cada worker se combinan
+en uno solo.
+
+Usage:
+    python -m utils.test_sharding --workers 8 tests/smoke_tests
+    python -m utils.test_sharding -w 4 --durations reports/test_durations.json tests/smoke_tests -- --browser=firefox
+
+Worker side (loaded automatically with -p utils.test_sharding):
+    SHARD_NODEIDS_FILE  file with the node ids this worker must run (one per line)
+    SHARD_ID / SHARD_COUNT  exposed to tests and fixtures
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from utils.test_timing import (
+    DEFAULT_STORE, TimingStore, lpt_schedule, module_of, predicted_makespan, shard_store_path
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+REPORTS_DIR = PROJECT_ROOT / "reports"
+SHARDS_DIR = REPORTS_DIR / "shards"
+
+_NODEID_LINE = re.compile(r"^[^\s].*::.+")
+
+
+# --------------------------
+# Worker side / Lado del worker
+# --------------------------
+def pytest_collection_modifyitems(config, items):
+    """
+    English: Keep only the node ids assigned to this shard (SHARD_NODEIDS_FILE).
+    Spanish: Conserva solo los node ids asignados a este shard (SHARD_NODEIDS_FILE).
+    """
+    nodeids_file = os.getenv("SHARD_NODEIDS_FILE")
+    if not nodeids_file:
+        return
+    wanted = set(Path(nodeids_file).read_text(encoding="utf-8").splitlines())
+    selected, deselected = [], []
+    for item in items:
+        (selected if item.nodeid in wanted else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+# --------------------------
+# Partitioning / Particionado
+# --------------------------
+def load_durations(path: Optional[Path]) -> Dict[str, float]:
+    """
+    English: Read {nodeid: seconds} from a timing store; missing/invalid file means no history.
+    Spanish: Lee {nodeid: segundos} desde el almacén de tiempos; si falta o es inválido no hay historial.
+    """
+    if path is None:
+        return {}
+    return TimingStore(path).durations()
+
+
+def partition(nodeids: Sequence[str], workers: int, durations: Optional[Dict[str, float]] = None,
+              group: str = "test") -> List[List[str]]:
+    """
+    English: Split node ids into 'workers' shards with the LPT scheduler. group='module' keeps
+    each test file on a single worker (module-scoped fixtures, cassettes being recorded).
+    Spanish: Divide los node ids en 'workers' shards con el planificador LPT. group='module'
+    mantiene cada archivo de tests en un solo worker.
+    """
+    return lpt_schedule(nodeids, workers, durations, group_by=module_of if group == "module" else None)
+
+
+# --------------------------
+# Runner side / Lado del ejecutor
+# --------------------------
+def collect_nodeids(paths: Sequence[str], pytest_args: Sequence[str]) -> List[str]:
+    """Collect node ids with 'pytest --collect-only -q' in a subprocess"""
+    cmd = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "log_cli=false",
+           *paths, *pytest_args]
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if result.returncode not in (0, 5):  # 5 = no tests collected
+        sys.stderr.write(result.stdout + result.stderr)
+        raise RuntimeError(f"Test collection failed with exit code {result.returncode}")
+    return [line.strip() for line in result.stdout.splitlines() if _NODEID_LINE.match(line)]
+
+
+def merge_junit(xml_files: Sequence[Path], output: Path) -> Dict[str, int]:
+    """
+    English: Merge the <testsuite> elements of every worker into one <testsuites> report.
+    Spanish: Combina los <testsuite> de cada worker en un único reporte <testsuites>.
+    """
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    total_time = 0.0
+    for xml_file in xml_files:
+        if not xml_file.exists():
+            continue
+        root = ET.parse(xml_file).getroot()
+        suites = [root] if root.tag == "testsuite" else list(root.iter("testsuite"))
+        for suite in suites:
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+            total_time += float(suite.get("time", 0))
+            merged.append(suite)
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    merged.set("time", f"{total_time:.3f}")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(merged).write(output, encoding="utf-8", xml_declaration=True)
+    return totals
+
+
+def run_shards(paths: Sequence[str], workers: int, pytest_args: Sequence[str] = (),
+               durations_file: Optional[Path] = DEFAULT_STORE, headless: bool = True,
+               junit_output: Path = REPORTS_DIR / "junit-sharded.xml", group: str = "test") -> int:
+    """
+    English: Collect, partition and run the suite on 'workers' local processes. Returns the exit code.
+    Spanish: Recolecta, particiona y ejecuta la suite en 'workers' procesos locales. Retorna el código de salida.
+    """
+    nodeids = collect_nodeids(paths, pytest_args)
+    if not nodeids:
+        print("No tests collected / No se recolectaron tests")
+        return 5
+
+    durations = load_durations(durations_file)
+    shards = partition(nodeids, max(1, workers), durations, group)
+    print(f"{len(nodeids)} tests on {len(shards)} workers ({sum(n in durations for n in nodeids)} with history), "
+          f"predicted wall time {predicted_makespan(shards, durations):.1f}s")
+    SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix="shards-"))
+
+    processes = []
+    started = time.monotonic()
+    for index, shard in enumerate(shards):
+        nodeids_file = tmp_dir / f"shard-{index}.txt"
+        nodeids_file.write_text("\n".join(shard), encoding="utf-8")
+        env = {
+            **os.environ,
+            "SHARD_NODEIDS_FILE": str(nodeids_file),
+            "SHARD_ID": str(index),
+            "SHARD_COUNT": str(len(shards)),
+        }
+        if headless:
+            env["HEADLESS"] = "true"
+        junit = SHARDS_DIR / f"shard-{index}.xml"
+        cmd = [sys.executable, "-m", "pytest", "-p", "utils.test_sharding", "-q", "-o", "log_cli=false",
+               f"--junitxml={junit}", *paths, *pytest_args]
+        if durations_file is not None:
+            cmd.append(f"--durations-file={durations_file}")
+        log = open(SHARDS_DIR / f"shard-{index}.log", "w", encoding="utf-8")
+        processes.append((index, subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT), log, junit))
+        print(f"[shard {index}] {len(shard)} tests -> {junit.relative_to(PROJECT_ROOT)}")
+
+    exit_codes = []
+    for index, process, log, _ in processes:
+        exit_codes.append(process.wait())
+        log.close()
+        print(f"[shard {index}] finished with exit code {exit_codes[-1]}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    if durations_file is not None:
+        _merge_shard_durations(durations_file, len(shards))
+    _merge_shard_api_metrics(len(shards))
+
+    totals = merge_junit([junit for *_, junit in processes], junit_output)
+    elapsed = time.monotonic() - started
+    print(
+        f"Sharded run: {totals['tests']} tests, {totals['failures']} failures, {totals['errors']} errors, "
+        f"{totals['skipped']} skipped in {elapsed:.1f}s across {len(shards)} workers -> {junit_output}"
+    )
+
+    # English: 0 only if every shard passed (or had nothing to run); otherwise the first failure code
+    # Spanish: 0 solo si todos los shards pasaron; si no, el primer código de fallo
+    failing = [code for code in exit_codes if code not in (0, 5)]
+    return failing[0] if failing else 0
+
+
+def _merge_shard_durations(durations_file: Path, shard_count: int) -> None:
+    """
+    English: Fold the timings written by every worker into the main store, then drop the worker files.
+    Spanish: Incorpora los tiempos de cada worker al almacén principal y elimina los archivos de los workers.
+    """
+    store = TimingStore(durations_file)
+    for index in range(shard_count):
+        shard_file = shard_store_path(Path(durations_file), index)
+        if shard_file.exists():
+            store.merge(TimingStore(shard_file))
+            shard_file.unlink()
+    if len(store):
+        store.save()
+
+
+def _merge_shard_api_metrics(shard_count: int) -> None:
+    """
+    English: Combine the API latency histograms of every worker into reports/api_metrics.json.
+    Spanish: Combina los histogramas de latencia de la API de cada worker en reports/api_metrics.json.
+    """
+    from utils.api_metrics import DEFAULT_METRICS_FILE
+    from src.api.request_metrics import RequestMetrics
+
+    metrics = RequestMetrics()
+    for index in range(shard_count):
+        shard_file = shard_store_path(DEFAULT_METRICS_FILE, index)
+        if shard_file.exists():
+            metrics.merge_dict(json.loads(shard_file.read_text(encoding="utf-8")))
+            shard_file.unlink()
+    if len(metrics):
+        metrics.save(DEFAULT_METRICS_FILE)
+        print(f"API latency across shards -> {DEFAULT_METRICS_FILE.relative_to(PROJECT_ROOT)}")
+        print(metrics.format_table(10))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run a pytest suite across K local worker processes (one headless browser each)"
+    )
+    parser.add_argument("paths", nargs="*", default=["tests/smoke_tests"], help="Test paths (default: tests/smoke_tests)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--durations", type=Path, default=DEFAULT_STORE,
+                        help="Timing store used to balance shards and updated after the run (default: reports/test_durations.json)")
+    parser.add_argument("--group", choices=("test", "module"), default="test",
+                        help="Scheduling unit: single tests, or whole test files kept on one worker")
+    parser.add_argument("--headed", action="store_true", help="Do not force HEADLESS=true in the workers")
+    parser.add_argument("--junit", type=Path, default=REPORTS_DIR / "junit-sharded.xml", help="Merged JUnit XML output")
+    args, pytest_args = parser.parse_known_args(argv)
+    if pytest_args and pytest_args[0] == "--":
+        pytest_args = pytest_args[1:]
+
+    return run_shards(args.paths, args.workers, pytest_args, args.durations,
+                      headless=not args.headed, junit_output=args.junit, group=args.group)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+# English: Test timing store + duration-aware scheduler (longest processing time first)
+# Spanish: Almacén de tiempos por test + planificador por duración (el más largo primero)
+
+"""
+English:
+Every pytest run records how long each test took (setup + call + teardown) into a JSON
+timing store next to the Allure results (reports/test_durations.json by default). The
+stored value is an exponential moving average, so one slow run does not distort the
+schedule. The scheduler uses that history to bin-pack tests across workers with the LPT
+heuristic (longest processing time first, always onto the least loaded worker), which
+shrinks the tail where one worker keeps running minutes after the others. Tests without
+history weigh the median known duration.
+
+Spanish:
+Cada ejecución de pytest registra cuánto tardó cada test (setup + call + teardown) en un
+almacén JSON junto a los resultados de Allure (reports/test_durations.json por defecto).
+El valor guardado es una media móvil exponencial. El planificador usa ese historial para
+repartir los tests entre workers con la heurística LPT (el más largo primero, siempre al
+worker menos cargado). Los tests sin historial pesan la mediana conocida.
+
+Usage:
+    pytest tests/api_test                               # records durations (plugin enabled in conftest.py)
+    pytest tests --durations-file=reports/ui.json       # custom store
+    pytest tests --no-record-durations                  # disable recording
+    python -m utils.test_sharding -w 8 tests/api_test tests/smoke_tests tests/bdd_steps_definitions
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_STORE = PROJECT_ROOT / "reports" / "test_durations.json"
+
+STORE_VERSION = 1
+
+# English: weight of the newest run in the moving average
+# Spanish: peso de la ejecución más reciente en la media móvil
+SMOOTHING = 0.5
+
+
+class TimingStore:
+    """
+    English:
+    JSON file with the historical duration of every test node id.
+
+    Spanish:
+    Archivo JSON con la duración histórica de cada node id.
+
+    Format:
+        {"version": 1, "tests": {"<nodeid>": {"seconds": 1.23, "runs": 4}}}
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_STORE, load: bool = True):
+        self.path = Path(path)
+        self._tests: Dict[str, Dict[str, float]] = {}
+        if load:
+            self.load()
+
+    def load(self) -> "TimingStore":
+        """Read the store from disk; a missing or invalid file means no history"""
+        self._tests = {}
+        if not self.path.exists():
+            return self
+        try:
+            content = json.loads(self.path.read_text(encoding="utf-8"))
+        except ValueError:
+            return self
+        tests = content.get("tests", content) if isinstance(content, dict) else {}
+        for nodeid, value in tests.items():
+            # English: also accept a flat {nodeid: seconds} mapping
+            # Spanish: también acepta un mapeo plano {nodeid: segundos}
+            if isinstance(value, (int, float)):
+                self._tests[nodeid] = {"seconds": float(value), "runs": 1}
+            elif isinstance(value, dict) and isinstance(value.get("seconds"), (int, float)):
+                self._tests[nodeid] = {"seconds": float(value["seconds"]), "runs": int(value.get("runs", 1))}
+        return self
+
+    def durations(self) -> Dict[str, float]:
+        """{nodeid: seconds} view used by the scheduler"""
+        return {nodeid: entry["seconds"] for nodeid, entry in self._tests.items()}
+
+    def update(self, measured: Dict[str, float]) -> None:
+        """
+        English: Fold the durations of one run into the moving average.
+        Spanish: Incorpora las duraciones de una ejecución a la media móvil.
+        """
+        for nodeid, seconds in measured.items():
+            entry = self._tests.get(nodeid)
+            if entry is None:
+                self._tests[nodeid] = {"seconds": seconds, "runs": 1}
+            else:
+                entry["seconds"] = SMOOTHING * seconds + (1 - SMOOTHING) * entry["seconds"]
+                entry["runs"] += 1
+
+    def merge(self, other: "TimingStore") -> None:
+        """Fold another store (e.g. a shard worker's) into this one"""
+        self.update(other.durations())
+
+    def save(self) -> None:
+        """Write atomically so a concurrent reader never sees a half-written file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        content = {
+            "version": STORE_VERSION,
+            "tests": {nodeid: {"seconds": round(entry["seconds"], 4), "runs": entry["runs"]}
+                      for nodeid, entry in sorted(self._tests.items())},
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(content, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._tests)
+
+    def __repr__(self) -> str:
+        return f"TimingStore(path='{self.path}', tests={len(self)})"
+
+
+# --------------------------
+# Scheduler / Planificador
+# --------------------------
+def module_of(nodeid: str) -> str:
+    """'tests/api_test/test_x.py::TestA::test_b' -> 'tests/api_test/test_x.py'"""
+    return nodeid.split("::", 1)[0]
+
+
+def lpt_schedule(nodeids: Sequence[str], workers: int, durations: Optional[Dict[str, float]] = None,
+                 group_by: Optional[Callable[[str], str]] = None) -> List[List[str]]:
+    """
+    English:
+    Bin-pack node ids onto 'workers' bins, longest processing time first. With 'group_by'
+    (e.g. module_of) tests sharing a key are kept together on the same worker, which
+    preserves module-scoped fixtures such as the API cassette. Tests keep their collection
+    order inside each bin, so module/class fixtures are still set up once. Empty bins are dropped.
+
+    Spanish:
+    Reparte los node ids en 'workers' contenedores, el más largo primero. Con 'group_by'
+    (ej. module_of) los tests con la misma clave quedan juntos en el mismo worker. Dentro de
+    cada contenedor se mantiene el orden de recolección.
+    """
+    durations = durations or {}
+    known = sorted(durations[n] for n in nodeids if n in durations)
+    default = known[len(known) // 2] if known else 1.0
+
+    groups: Dict[str, List[str]] = {}
+    for nodeid in nodeids:
+        groups.setdefault(group_by(nodeid) if group_by else nodeid, []).append(nodeid)
+    weights = {key: sum(durations.get(n, default) for n in members) for key, members in groups.items()}
+
+    workers = max(1, workers)
+    bins: List[List[str]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for key in sorted(groups, key=lambda k: (-weights[k], k)):
+        target = loads.index(min(loads))
+        bins[target].extend(groups[key])
+        loads[target] += weights[key]
+
+    position = {nodeid: index for index, nodeid in enumerate(nodeids)}
+    return [sorted(members, key=position.__getitem__) for members in bins if members]
+
+
+def predicted_makespan(bins: Iterable[Sequence[str]], durations: Dict[str, float]) -> float:
+    """Expected wall time of the slowest worker for a schedule"""
+    known = sorted(durations.values())
+    default = known[len(known) // 2] if known else 1.0
+    return max((sum(durations.get(n, default) for n in members) for members in bins), default=0.0)
+
+
+# --------------------------
+# Pytest plugin / Plugin de pytest
+# --------------------------
+def store_path(config) -> Path:
+    """
+    English: --durations-file, else next to --alluredir, else reports/test_durations.json.
+    Inside a shard worker the file gets a '.shard-N' suffix; the sharding runner merges them.
+    Spanish: --durations-file, si no junto a --alluredir, si no reports/test_durations.json.
+    En un worker de shards el archivo lleva el sufijo '.shard-N'; el ejecutor los combina.
+    """
+    path = config.getoption("--durations-file", None)
+    if path:
+        path = Path(path)
+    else:
+        alluredir = config.getoption("--alluredir", None)
+        path = Path(alluredir).parent / DEFAULT_STORE.name if alluredir else DEFAULT_STORE
+    shard_id = os.getenv("SHARD_ID")
+    if shard_id is not None:
+        path = shard_store_path(path, shard_id)
+    return path
+
+
+def shard_store_path(path: Path, shard_id: Union[str, int]) -> Path:
+    return path.with_name(f"{path.stem}.shard-{shard_id}{path.suffix}")
+
+
+class TimingRecorder:
+    """Collects per-test durations during a session and saves them at the end"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.measured: Dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report):
+        # English: setup + call + teardown; skipped tests are not representative
+        # Spanish: setup + call + teardown; los tests omitidos no son representativos
+        if report.skipped:
+            return
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if not self.measured:
+            return
+        # English: a shard worker's file holds only its own run; history lives in the main store
+        # Spanish: el archivo de un worker solo guarda su ejecución; el historial está en el principal
+        store = TimingStore(self.path, load=os.getenv("SHARD_ID") is None)
+        store.update(self.measured)
+        store.save()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("test-timing")
+    group.addoption(
+        "--durations-file",
+        action="store",
+        default=None,
+        help="Archivo JSON de duraciones históricas por test (por defecto: reports/test_durations.json)"
+    )
+    group.addoption(
+        "--no-record-durations",
+        action="store_true",
+        default=False,
+        help="No registrar la duración de los tests en el almacén de tiempos"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--no-record-durations") or config.getoption("--collect-only"):
+        return
+    if hasattr(config, "workerinput"):
+        # English: pytest-xdist workers report to the controller, which records for everyone
+        # Spanish: los workers de pytest-xdist reportan al controlador, que registra por todos
+        return
+    config.pluginmanager.register(TimingRecorder(store_path(config)), "test-timing-recorder")